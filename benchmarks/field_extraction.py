@@ -0,0 +1,54 @@
+"""
+Micro-benchmark for subscription message field extraction.
+
+Compares extracting several fields from a message by splitting each dotted path and walking it
+with getattr on every message, as the SubscriptionTranslator used to, against a precompiled
+FieldSetExtractor walking all the paths together.
+
+Usage:
+    python benchmarks/field_extraction.py [--messages N]
+"""
+
+import argparse
+import timeit
+from types import SimpleNamespace
+from typing import Any
+
+from testbenchmanager.instruments.translation import FieldSetExtractor
+
+PATHS = ["data.pressure", "data.temperature.value", "data.status.ok", "meta.version"]
+
+
+def legacy_extract(message: Any, field_path: str) -> Any:
+    """Per-message path splitting, as the SubscriptionTranslator used to do."""
+    for field in field_path.split("."):
+        message = getattr(message, field)
+    return message
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=200_000)
+    args = parser.parse_args()
+    messages: int = args.messages
+
+    message = SimpleNamespace(
+        data=SimpleNamespace(
+            pressure=1e-6,
+            temperature=SimpleNamespace(value=21.5),
+            status=SimpleNamespace(ok=True),
+        ),
+        meta=SimpleNamespace(version="1.2"),
+    )
+    extractor = FieldSetExtractor(PATHS)
+
+    for name, function in (
+        ("getattr per message", lambda: [legacy_extract(message, p) for p in PATHS]),
+        ("FieldSetExtractor", lambda: extractor.extract(message)),
+    ):
+        cost = min(timeit.repeat(function, number=messages, repeat=5)) / messages
+        print(f"{name:24}{cost * 1e9:>10.1f} ns/message")
+
+
+if __name__ == "__main__":
+    main()
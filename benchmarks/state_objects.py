@@ -0,0 +1,105 @@
+"""
+Micro-benchmark for virtual instrument state objects.
+
+Compares the per-sample memory and construction cost of the old state representation (a plain
+dataclass with a __dict__, re-wrapped into a DataPoint for every sample a report records) against
+the current slotted, frozen VirtualInstrumentState consumed directly, and measures the cost of a
+VirtualInstrument.update_state call.
+
+Usage:
+    python benchmarks/state_objects.py [--samples N]
+"""
+
+import argparse
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable
+
+from testbenchmanager.common.clock import wall_clock
+from testbenchmanager.instruments.virtual import (
+    VirtualInstrument,
+    VirtualInstrumentMetadata,
+    VirtualInstrumentState,
+)
+
+
+@dataclass
+class LegacyState:
+    """The state object as it used to be: a plain dataclass with a datetime."""
+
+    value: Any
+    sequence: int
+    timestamp: datetime
+
+
+@dataclass
+class LegacyDataPoint:
+    """The per-sample copy reports used to make of each state."""
+
+    timestamp: datetime
+    value: Any
+
+
+def legacy_sample(sequence: int) -> Any:
+    state = LegacyState(
+        value=float(sequence), sequence=sequence, timestamp=datetime.now()
+    )
+    return (state, LegacyDataPoint(timestamp=state.timestamp, value=state.value))
+
+
+def current_sample(sequence: int) -> Any:
+    return VirtualInstrumentState(
+        value=float(sequence), sequence=sequence, timestamp_ns=wall_clock.now_ns()
+    )
+
+
+def bytes_per_sample(factory: Callable[[int], Any], samples: int) -> float:
+    """Average traced allocation per sample, with all samples kept alive."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [factory(sequence) for sequence in range(samples)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the samples isn't part of the per-sample cost.
+    return (after - before) / len(kept) - 8
+
+
+def nanoseconds_per_call(function: Callable[[], Any], samples: int) -> float:
+    """Best-of-five average time per call."""
+    return min(timeit.repeat(function, number=samples, repeat=5)) / samples * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=100_000)
+    args = parser.parse_args()
+    samples: int = args.samples
+
+    counter = iter(range(1 << 62))
+    print(f"{'':32}{'bytes/sample':>14}{'ns/sample':>12}")
+    for name, factory in (
+        ("legacy state + DataPoint", legacy_sample),
+        ("slotted VirtualInstrumentState", current_sample),
+    ):
+        size = bytes_per_sample(factory, samples)
+        cost = nanoseconds_per_call(lambda f=factory: f(next(counter)), samples)
+        print(f"{name:32}{size:>14.1f}{cost:>12.1f}")
+
+    instrument: VirtualInstrument[float] = VirtualInstrument(
+        VirtualInstrumentMetadata(uid="benchmark", history_tiers=[])
+    )
+    print(
+        f"{'update_state (no consumers)':32}{'':>14}"
+        f"{nanoseconds_per_call(lambda: instrument.update_state(1.0), samples):>12.1f}"
+    )
+    instrument.subscribe(lambda state: None)
+    print(
+        f"{'update_state (one subscriber)':32}{'':>14}"
+        f"{nanoseconds_per_call(lambda: instrument.update_state(1.0), samples):>12.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
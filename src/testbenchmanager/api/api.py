@@ -9,6 +9,7 @@ from .routes import (
     instrument_router,
     run_router,
     tea_router,
+    translator_router,
 )
 
 api = FastAPI()
@@ -32,3 +33,4 @@ api.include_router(tea_router)
 api.include_router(experiment_router)
 api.include_router(run_router)
 api.include_router(config_router)
+api.include_router(translator_router)
@@ -1,35 +1,84 @@
 from fastapi import APIRouter, HTTPException, status
 
+from testbenchmanager.api.transmission_structures.config import (
+    InstantiationRecordTransmissionStructure,
+    ReloadReportTransmissionStructure,
+)
 from testbenchmanager.instruments.instrument_manager import instrument_manager
+from testbenchmanager.instruments.physical import physical_instrument_registry
 from testbenchmanager.report_generator.report_manager import report_manager
 
 config_router = APIRouter(prefix="/config")
 
 
 @config_router.post("/reload/")
-def reload_configuration() -> None:
-    reload_instrument_configuration()
+def reload_configuration() -> ReloadReportTransmissionStructure:
+    report = reload_instrument_configuration()
     reload_report_configuration()
-    return None
+    return report
 
 
 @config_router.post("/reload/instruments/")
-def reload_instrument_configuration() -> None:
+def reload_instrument_configuration() -> ReloadReportTransmissionStructure:
     """
-    Reload the instrument configuration.
+    Reload the instrument configuration, touching only what changed.
 
     Raises:
         HTTPException: If reloading the configuration fails.
+
+    Returns:
+        ReloadReportTransmissionStructure: What the reload touched.
     """
     try:
-        instrument_manager.load_all_configurations()
+        report = instrument_manager.load_all_configurations()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to reload instrument configuration: {e}",
         ) from e
 
-    return None
+    return ReloadReportTransmissionStructure(
+        files_changed=report.files_changed,
+        physical_instruments_added=report.physical_instruments_added,
+        physical_instruments_removed=report.physical_instruments_removed,
+        physical_instruments_rebuilt=report.physical_instruments_rebuilt,
+        physical_instruments_unchanged=report.physical_instruments_unchanged,
+        translators_added=report.translators_added,
+        translators_removed=report.translators_removed,
+        translators_rebuilt=report.translators_rebuilt,
+        translators_restarted=report.translators_restarted,
+        translators_unchanged=report.translators_unchanged,
+        failed=report.failed,
+        physical_instruments_pending=report.physical_instruments_pending,
+        translators_waiting=report.translators_waiting,
+        instantiation_times=report.instantiation_times,
+        stop_duration=report.stop.duration,
+        stop_latencies=report.stop.latencies,
+        translators_detached=report.stop.detached,
+        duration=report.duration,
+    )
+
+
+@config_router.get("/instruments/instantiation/")
+def get_instantiation_records() -> list[InstantiationRecordTransmissionStructure]:
+    """
+    Get the instantiation timing of every physical instrument created from configuration, to see
+    what dominates startup.
+
+    Returns:
+        list[InstantiationRecordTransmissionStructure]: Timing of each physical instrument.
+    """
+    return [
+        InstantiationRecordTransmissionStructure(
+            uid=record.uid,
+            state=record.state.value,
+            attempts=record.attempts,
+            duration=record.duration,
+            total_duration=record.total_duration,
+            last_error=record.last_error,
+        )
+        for record in physical_instrument_registry.instantiation_records().values()
+    ]
 
 
 @config_router.post("/reload/reports/")
@@ -1,14 +1,23 @@
 """Instrument API routes"""
 
-from bisect import bisect_left
+import asyncio
+from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 
 from testbenchmanager.api.transmission_structures.instrument import (
+    InstrumentCommandResultTransmissionStructure,
+    InstrumentCommandTransmissionStructure,
+    InstrumentHistoryBucketTransmissionStructure,
+    InstrumentHistoryTransmissionStructure,
+    InstrumentMemoryTransmissionStructure,
     InstrumentStateTransmissionStructure,
+    InstrumentStatisticsTransmissionStructure,
     InstrumentTransmissionStructure,
+    SubscriberStatisticsTransmissionStructure,
 )
+from testbenchmanager.common.clock import format_timestamp_ns
 from testbenchmanager.instruments.virtual import (
     VirtualInstrumentState,
     VirtualInstrumentValueTypes,
@@ -33,8 +42,11 @@ def list_instruments() -> list[str]:
 
 
 @instrument_router.get("/{uid}")
-def get_instrument_reading(
-    uid: str, sequence: Optional[int] = None, timeout: Optional[float] = None
+async def get_instrument_reading(
+    uid: str,
+    sequence: Optional[int] = None,
+    timeout: Optional[float] = None,
+    limit: Optional[int] = Query(default=None, ge=1),
 ) -> InstrumentTransmissionStructure:
     """
     Get the reading of a virtual instrument by UID.
@@ -43,6 +55,7 @@ def get_instrument_reading(
         uid (str): UID of the virtual instrument.
         sequence (Optional[int], optional): Optional earliest sequence to include. If this sequence is in the future, will wait until the timeout. Defaults to None.
         timeout (float, optional): timeout if waiting for a future sequence. Defaults to None, i.e. wait indefinitely.
+        limit (Optional[int], optional): Maximum number of states to return, starting from sequence. Defaults to None, i.e. no limit.
     Returns:
         InstrumentTransmissionStructure: Transmission structure of the instrument and its states.
     """
@@ -56,25 +69,238 @@ def get_instrument_reading(
         states = [instrument.get_latest_state()]
     else:
         try:
-            instrument.wait_for(lambda s: s.sequence >= sequence, timeout=timeout)
+            await instrument.wait_for_sequence_async(sequence, timeout=timeout)
         except TimeoutError as e:
             raise HTTPException(status_code=status.HTTP_408_REQUEST_TIMEOUT) from e
-        first_index = bisect_left(
-            instrument.history, sequence, key=lambda s: s.sequence
-        )
-        states = instrument.history[first_index:]
+        states = instrument.history_since(sequence, limit=limit)
 
     return InstrumentTransmissionStructure(
         uid=instrument.metadata.uid,
         name=instrument.metadata.name,
         unit=instrument.metadata.unit,
         description=instrument.metadata.description,
+        stale=instrument.stale,
         states=[
             InstrumentStateTransmissionStructure(
                 value=state.value,
                 sequence=state.sequence,
-                timestamp=state.timestamp,
+                timestamp=state.timestamp_iso,
+                timestamp_ns=state.timestamp_ns,
             )
             for state in states
         ],
     )
+
+
+@instrument_router.get("/{uid}/history")
+def get_instrument_history(
+    uid: str,
+    start: datetime,
+    end: Optional[datetime] = None,
+    max_points: int = Query(default=1000, ge=1),
+) -> InstrumentHistoryTransmissionStructure:
+    """
+    Get the history of a virtual instrument over a time range, at the finest resolution which
+    covers the range within the point budget.
+
+    Args:
+        uid (str): UID of the virtual instrument.
+        start (datetime): Start of the time range.
+        end (Optional[datetime], optional): End of the time range. Defaults to None, i.e. now.
+        max_points (int, optional): Maximum number of states or buckets to return. Defaults to 1000.
+
+    Returns:
+        InstrumentHistoryTransmissionStructure: Raw states or downsampled buckets in the range.
+    """
+    try:
+        instrument = virtual_instrument_registry.get(uid)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    history = instrument.history_range(start, end, max_points=max_points)
+    return InstrumentHistoryTransmissionStructure(
+        uid=instrument.metadata.uid,
+        resolution=history.resolution,
+        states=[
+            InstrumentStateTransmissionStructure(
+                value=state.value,
+                sequence=state.sequence,
+                timestamp=state.timestamp_iso,
+                timestamp_ns=state.timestamp_ns,
+            )
+            for state in history.states
+        ],
+        buckets=[
+            InstrumentHistoryBucketTransmissionStructure(
+                start=format_timestamp_ns(bucket.start_ns),
+                start_ns=bucket.start_ns,
+                minimum=bucket.minimum,
+                maximum=bucket.maximum,
+                mean=bucket.mean,
+                count=bucket.count,
+                last=bucket.last,
+            )
+            for bucket in history.buckets
+        ],
+    )
+
+
+@instrument_router.get("/{uid}/memory")
+def get_instrument_memory(uid: str) -> InstrumentMemoryTransmissionStructure:
+    """
+    Get the history size and memory usage of a virtual instrument.
+
+    Args:
+        uid (str): UID of the virtual instrument.
+
+    Returns:
+        InstrumentMemoryTransmissionStructure: History size and memory usage.
+    """
+    try:
+        instrument = virtual_instrument_registry.get(uid)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    usage = instrument.memory_usage()
+    return InstrumentMemoryTransmissionStructure(
+        uid=instrument.metadata.uid,
+        length=usage.length,
+        capacity=usage.capacity,
+        max_length=usage.max_length,
+        retention=usage.retention,
+        history_bytes=usage.history_bytes,
+        tier_bytes=usage.tier_bytes,
+        total_bytes=usage.history_bytes + usage.tier_bytes,
+    )
+
+
+@instrument_router.get("/{uid}/stats")
+def get_instrument_stats(uid: str) -> InstrumentStatisticsTransmissionStructure:
+    """
+    Get the running statistics of a virtual instrument.
+
+    Args:
+        uid (str): UID of the virtual instrument.
+
+    Returns:
+        InstrumentStatisticsTransmissionStructure: Running statistics.
+    """
+    try:
+        instrument = virtual_instrument_registry.get(uid)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    statistics = instrument.stats()
+    if statistics is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Running statistics are not enabled for instrument '{uid}'.",
+        )
+    return InstrumentStatisticsTransmissionStructure(
+        uid=instrument.metadata.uid,
+        count=statistics.count,
+        mean=statistics.mean,
+        std=statistics.std,
+        minimum=statistics.minimum,
+        maximum=statistics.maximum,
+        window=statistics.window,
+        window_count=statistics.window_count,
+        window_mean=statistics.window_mean,
+        window_std=statistics.window_std,
+        window_minimum=statistics.window_minimum,
+        window_maximum=statistics.window_maximum,
+        rate_of_change=statistics.rate_of_change,
+        ewma=statistics.ewma,
+    )
+
+
+@instrument_router.get("/{uid}/subscribers")
+def get_instrument_subscribers(
+    uid: str,
+) -> list[SubscriberStatisticsTransmissionStructure]:
+    """
+    Get the delivery counters of the mailbox subscriptions of a virtual instrument.
+
+    Args:
+        uid (str): UID of the virtual instrument.
+
+    Returns:
+        list[SubscriberStatisticsTransmissionStructure]: Counters of each mailbox subscription.
+    """
+    try:
+        instrument = virtual_instrument_registry.get(uid)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    return [
+        SubscriberStatisticsTransmissionStructure(
+            name=statistics.name,
+            mailbox_size=statistics.mailbox_size,
+            overflow_policy=statistics.overflow_policy,
+            pending=statistics.pending,
+            delivered=statistics.delivered,
+            dropped=statistics.dropped,
+            failed=statistics.failed,
+        )
+        for statistics in instrument.subscriber_statistics()
+    ]
+
+
+@instrument_router.post("/{uid}/command")
+async def command_instrument(
+    uid: str, command: InstrumentCommandTransmissionStructure
+) -> InstrumentCommandResultTransmissionStructure:
+    """
+    Command a virtual instrument, and wait for the command to be acknowledged.
+
+    Args:
+        uid (str): UID of the virtual instrument.
+        command (InstrumentCommandTransmissionStructure): Value to set, and how long to wait.
+
+    Returns:
+        InstrumentCommandResultTransmissionStructure: Result of the command.
+    """
+    try:
+        instrument = virtual_instrument_registry.get(uid)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    future = instrument.submit_command(command.value)
+    try:
+        result = await asyncio.wait_for(
+            asyncio.shield(asyncio.wrap_future(future)), timeout=command.timeout
+        )
+    except TimeoutError as e:
+        # The command stays queued, only the wait is abandoned.
+        raise HTTPException(status_code=status.HTTP_408_REQUEST_TIMEOUT) from e
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # Whatever failed the command, e.g. the device or a read-back mismatch.
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        ) from e
+
+    return InstrumentCommandResultTransmissionStructure(
+        uid=instrument.metadata.uid,
+        result=result if isinstance(result, (bool, int, float, str)) else None,
+    )
+
+
+@instrument_router.post("/{uid}/burst")
+def request_instrument_burst(uid: str, duration: Optional[float] = None) -> bool:
+    """
+    Ask the source of a virtual instrument to update it at its fastest rate for a while.
+
+    Args:
+        uid (str): UID of the virtual instrument.
+        duration (Optional[float], optional): How long for, in seconds. Defaults to None, i.e. the
+        source's configured burst duration.
+
+    Returns:
+        bool: True if the source supports bursts, False if the request was ignored.
+    """
+    try:
+        instrument = virtual_instrument_registry.get(uid)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    return instrument.request_burst(duration)
@@ -4,7 +4,6 @@ from datetime import datetime
 
 from fastapi import APIRouter, Response, status
 
-from testbenchmanager.report_generator.report import DataPoint
 from testbenchmanager.report_generator.report_manager import report_manager
 from testbenchmanager.report_generator.report_metadata import ReportMetadata
 
@@ -0,0 +1,131 @@
+"""Translator API routes"""
+
+from fastapi import APIRouter, HTTPException, status
+
+from testbenchmanager.api.transmission_structures.translator import (
+    HistogramTransmissionStructure,
+    TranslatorHealthTransmissionStructure,
+    TranslatorTelemetryTransmissionStructure,
+    TranslatorTransmissionStructure,
+)
+from testbenchmanager.instruments.instrument_manager import instrument_manager
+from testbenchmanager.instruments.translation import HistogramSnapshot
+
+translator_router = APIRouter(prefix="/translator")
+
+
+@translator_router.get("/")
+def list_translators() -> list[str]:
+    """
+    List all loaded translator UIDs.
+
+    Returns:
+        list[str]: List of translator UIDs.
+    """
+    return instrument_manager.translator_uids
+
+
+@translator_router.get("/{uid}")
+def get_translator(uid: str) -> TranslatorTransmissionStructure:
+    """
+    Get a translator by UID.
+
+    Args:
+        uid (str): UID of the translator.
+
+    Returns:
+        TranslatorTransmissionStructure: Transmission structure of the translator.
+    """
+    try:
+        translator = instrument_manager.get_translator(uid)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    return TranslatorTransmissionStructure(
+        uid=translator.metadata.uid,
+        name=translator.metadata.name,
+        description=translator.metadata.description,
+        class_name=type(translator).__name__,
+    )
+
+
+@translator_router.get("/{uid}/health")
+def get_translator_health(uid: str) -> TranslatorHealthTransmissionStructure:
+    """
+    Get the failure supervision state of a translator: its circuit breaker state and failures.
+
+    Args:
+        uid (str): UID of the translator.
+
+    Returns:
+        TranslatorHealthTransmissionStructure: Failure supervision state.
+    """
+    try:
+        translator = instrument_manager.get_translator(uid)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    health = translator.supervisor.health()
+    return TranslatorHealthTransmissionStructure(
+        uid=translator.metadata.uid,
+        state=health.state.value,
+        consecutive_failures=health.consecutive_failures,
+        total_failures=health.total_failures,
+        last_error=health.last_error,
+        seconds_since_failure=health.seconds_since_failure,
+        seconds_since_success=health.seconds_since_success,
+        retry_in=health.retry_in,
+    )
+
+
+@translator_router.get("/{uid}/telemetry")
+def get_translator_telemetry(uid: str) -> TranslatorTelemetryTransmissionStructure:
+    """
+    Get the schedule telemetry of a polling translator: histograms of the actual interval between
+    polls, of poll durations and of lateness, plus overrun counts.
+
+    Args:
+        uid (str): UID of the translator.
+
+    Returns:
+        TranslatorTelemetryTransmissionStructure: Schedule telemetry.
+    """
+    try:
+        translator = instrument_manager.get_translator(uid)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    if translator.telemetry is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Translator '{uid}' does not poll, and has no telemetry.",
+        )
+    telemetry = translator.telemetry.snapshot()
+    return TranslatorTelemetryTransmissionStructure(
+        uid=translator.metadata.uid,
+        polling_interval=telemetry.polling_interval,
+        overrun_policy=telemetry.overrun_policy.value,
+        polls=telemetry.polls,
+        overruns=telemetry.overruns,
+        skipped=telemetry.skipped,
+        interval=_histogram_transmission_structure(telemetry.interval),
+        duration=_histogram_transmission_structure(telemetry.duration),
+        lateness=_histogram_transmission_structure(telemetry.lateness),
+    )
+
+
+def _histogram_transmission_structure(
+    histogram: HistogramSnapshot,
+) -> HistogramTransmissionStructure:
+    return HistogramTransmissionStructure(
+        count=histogram.count,
+        mean=histogram.mean,
+        std=histogram.std,
+        minimum=histogram.minimum,
+        maximum=histogram.maximum,
+        p50=histogram.p50,
+        p90=histogram.p90,
+        p99=histogram.p99,
+        bucket_bounds=histogram.bucket_bounds,
+        bucket_counts=histogram.bucket_counts,
+    )
@@ -0,0 +1,41 @@
+"""Configuration transmission structures"""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ReloadReportTransmissionStructure(BaseModel):
+    """Transmission structure for what an instrument configuration reload touched."""
+
+    files_changed: list[str]
+    physical_instruments_added: list[str]
+    physical_instruments_removed: list[str]
+    physical_instruments_rebuilt: list[str]
+    physical_instruments_unchanged: list[str]
+    translators_added: list[str]
+    translators_removed: list[str]
+    translators_rebuilt: list[str]
+    translators_restarted: list[str]
+    translators_unchanged: list[str]
+    failed: list[str]  # Translators which failed to load
+    physical_instruments_pending: list[str]  # Retried in the background
+    translators_waiting: list[str]  # Started once their physical instruments are ready
+    instantiation_times: dict[str, float]  # Seconds, per physical instrument created
+    stop_duration: float  # Seconds spent stopping translators
+    stop_latencies: dict[str, float]  # Seconds, per translator stopped
+    # Didn't stop in time, left to finish in the background
+    translators_detached: list[str]
+    duration: float  # Seconds
+
+
+class InstantiationRecordTransmissionStructure(BaseModel):
+    """Transmission structure for the instantiation timing of a physical instrument."""
+
+    uid: str
+    state: str  # ready, pending or failed
+    attempts: int
+    duration: Optional[float] = None  # Last completed attempt, in seconds
+    # From the first attempt until ready, in seconds
+    total_duration: Optional[float] = None
+    last_error: Optional[str] = None
@@ -1,11 +1,13 @@
 """Instrument transmission structures"""
 
-from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel
 
-from testbenchmanager.instruments.virtual import VirtualInstrumentValueTypes
+from testbenchmanager.instruments.virtual import (
+    OverflowPolicy,
+    VirtualInstrumentValueTypes,
+)
 
 
 class InstrumentStateTransmissionStructure(BaseModel):
@@ -13,7 +15,8 @@ class InstrumentStateTransmissionStructure(BaseModel):
 
     value: VirtualInstrumentValueTypes
     sequence: int
-    timestamp: datetime
+    timestamp: str  # ISO 8601, local time
+    timestamp_ns: int  # Epoch nanoseconds
 
 
 class InstrumentTransmissionStructure(BaseModel):
@@ -23,4 +26,84 @@ class InstrumentTransmissionStructure(BaseModel):
     name: Optional[str] = None
     unit: Optional[str] = None
     description: Optional[str] = None
+    stale: bool = False  # The source has stopped updating the instrument
     states: list[InstrumentStateTransmissionStructure]
+
+
+class InstrumentHistoryBucketTransmissionStructure(BaseModel):
+    """Transmission structure for a single downsampled history bucket."""
+
+    start: str  # ISO 8601, local time
+    start_ns: int  # Epoch nanoseconds
+    minimum: float
+    maximum: float
+    mean: float
+    count: int
+    last: float
+
+
+class InstrumentHistoryTransmissionStructure(BaseModel):
+    """Transmission structure for an instrument's history over a time range."""
+
+    uid: str
+    resolution: Optional[float] = None  # Bucket width in seconds, None for raw states.
+    states: list[InstrumentStateTransmissionStructure] = []
+    buckets: list[InstrumentHistoryBucketTransmissionStructure] = []
+
+
+class InstrumentMemoryTransmissionStructure(BaseModel):
+    """Transmission structure for the history size and memory usage of an instrument."""
+
+    uid: str
+    length: int
+    capacity: int
+    max_length: int
+    retention: Optional[float] = None
+    history_bytes: int
+    tier_bytes: int
+    total_bytes: int
+
+
+class InstrumentStatisticsTransmissionStructure(BaseModel):
+    """Transmission structure for the running statistics of an instrument."""
+
+    uid: str
+    count: int
+    mean: Optional[float] = None
+    std: Optional[float] = None
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    window: float
+    window_count: int
+    window_mean: Optional[float] = None
+    window_std: Optional[float] = None
+    window_minimum: Optional[float] = None
+    window_maximum: Optional[float] = None
+    rate_of_change: Optional[float] = None
+    ewma: dict[float, float] = {}  # Time constant (seconds): average
+
+
+class SubscriberStatisticsTransmissionStructure(BaseModel):
+    """Transmission structure for the delivery counters of a mailbox subscription."""
+
+    name: str
+    mailbox_size: int
+    overflow_policy: OverflowPolicy
+    pending: int
+    delivered: int
+    dropped: int
+    failed: int
+
+
+class InstrumentCommandTransmissionStructure(BaseModel):
+    """Transmission structure for a command to an instrument."""
+
+    value: VirtualInstrumentValueTypes
+    timeout: Optional[float] = None  # Seconds to wait, None to wait indefinitely
+
+
+class InstrumentCommandResultTransmissionStructure(BaseModel):
+    """Transmission structure for an acknowledged command."""
+
+    uid: str
+    result: Optional[VirtualInstrumentValueTypes] = None  # e.g. the value read back
@@ -0,0 +1,56 @@
+"""Translator transmission structures"""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class TranslatorTransmissionStructure(BaseModel):
+    """Transmission structure for a translator."""
+
+    uid: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    class_name: str
+
+
+class TranslatorHealthTransmissionStructure(BaseModel):
+    """Transmission structure for a translator's failure supervision state."""
+
+    uid: str
+    state: str  # Circuit breaker state: closed, open or half_open
+    consecutive_failures: int
+    total_failures: int
+    last_error: Optional[str] = None
+    seconds_since_failure: Optional[float] = None
+    seconds_since_success: Optional[float] = None
+    retry_in: float  # Seconds until the next attempt is allowed
+
+
+class HistogramTransmissionStructure(BaseModel):
+    """Transmission structure for a histogram of durations, in seconds."""
+
+    count: int
+    mean: Optional[float] = None
+    std: Optional[float] = None
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    p50: Optional[float] = None
+    p90: Optional[float] = None
+    p99: Optional[float] = None
+    bucket_bounds: list[float]  # Upper bound of each non-empty bucket
+    bucket_counts: list[int]
+
+
+class TranslatorTelemetryTransmissionStructure(BaseModel):
+    """Transmission structure for a polling translator's schedule telemetry."""
+
+    uid: str
+    polling_interval: float
+    overrun_policy: str
+    polls: int
+    overruns: int
+    skipped: int
+    interval: HistogramTransmissionStructure
+    duration: HistogramTransmissionStructure
+    lateness: HistogramTransmissionStructure
@@ -0,0 +1,112 @@
+"""Wall clock and timestamp helpers."""
+
+from datetime import datetime
+from threading import Lock
+from time import monotonic_ns, time_ns
+
+
+class WallClock:
+    """
+    Epoch-nanosecond wall clock which never goes backwards.
+
+    Time is measured with the monotonic clock, offset to the system wall clock. The offset is
+    re-synchronised periodically: if the system clock has stepped forwards the offset follows it
+    straight away, but if it has stepped backwards (e.g. an NTP correction) the offset is slewed
+    towards it slowly enough that timestamps keep increasing.
+    """
+
+    RESYNC_INTERVAL_NS: int = 10_000_000_000
+    # Maximum rate at which the offset is slewed backwards, as a fraction of elapsed time.
+    MAX_SLEW_RATE: float = 0.0005
+
+    def __init__(self) -> None:
+        self._lock: Lock = Lock()
+        monotonic = monotonic_ns()
+        self._offset: int = time_ns() - monotonic
+        self._last_resync: int = monotonic
+
+    def now_ns(self) -> int:
+        """
+        Get the current time.
+
+        Returns:
+            int: Epoch timestamp in nanoseconds.
+        """
+        monotonic = monotonic_ns()
+        if monotonic - self._last_resync >= self.RESYNC_INTERVAL_NS:
+            self._resync(monotonic)
+        return monotonic + self._offset
+
+    def _resync(self, monotonic: int) -> None:
+        """
+        Move the offset towards the current system wall clock.
+        """
+        with self._lock:
+            elapsed = monotonic - self._last_resync
+            if elapsed < self.RESYNC_INTERVAL_NS:
+                # Another thread got here first.
+                return
+            target = time_ns() - monotonic
+            self._offset = max(target, self._offset - int(elapsed * self.MAX_SLEW_RATE))
+            self._last_resync = monotonic
+
+
+wall_clock = WallClock()  # global singleton instance
+
+
+def timestamp_from_ns(timestamp_ns: int) -> datetime:
+    """
+    Convert an epoch timestamp in nanoseconds to a (naive, local) datetime, without the precision
+    loss of going through a float.
+
+    Args:
+        timestamp_ns (int): Epoch timestamp in nanoseconds.
+
+    Returns:
+        datetime: Equivalent local datetime, truncated to microseconds.
+    """
+    return datetime.fromtimestamp(timestamp_ns // 1_000_000_000).replace(
+        microsecond=timestamp_ns // 1_000 % 1_000_000
+    )
+
+
+def timestamp_to_ns(timestamp: datetime) -> int:
+    """
+    Convert a datetime to an epoch timestamp in nanoseconds. Naive datetimes are interpreted as
+    local time, consistent with timestamp_from_ns.
+
+    Args:
+        timestamp (datetime): Datetime to convert.
+
+    Returns:
+        int: Epoch timestamp in nanoseconds, with microsecond resolution.
+    """
+    return round(timestamp.timestamp() * 1_000_000) * 1_000
+
+
+# Most recently formatted second, and its ISO 8601 prefix. Replaced as a single tuple so concurrent
+# readers always see a consistent pair.
+_formatted_second: tuple[int, str] = (0, datetime.fromtimestamp(0).isoformat())
+
+
+def format_timestamp_ns(timestamp_ns: int) -> str:
+    """
+    Format an epoch timestamp in nanoseconds as a (naive, local) ISO 8601 string with microseconds,
+    the same as timestamp_from_ns(timestamp_ns).isoformat(timespec="microseconds").
+
+    The date and time part is only computed once per second, consecutive timestamps within the same
+    second only format the microseconds.
+
+    Args:
+        timestamp_ns (int): Epoch timestamp in nanoseconds.
+
+    Returns:
+        str: ISO 8601 timestamp.
+    """
+    global _formatted_second  # pylint: disable=global-statement
+    second, microsecond = divmod(timestamp_ns // 1_000, 1_000_000)
+    cached_second, prefix = _formatted_second
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second).isoformat()
+        _formatted_second = (second, prefix)
+    return f"{prefix}.{microsecond:06d}"
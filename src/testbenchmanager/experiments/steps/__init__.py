@@ -1 +1,2 @@
+from .burst import Burst as Burst
 from .wait import Wait as Wait
@@ -0,0 +1,49 @@
+from datetime import datetime
+from threading import Event
+from typing import Optional
+
+from testbenchmanager.experiments.state import Outcome, State
+from testbenchmanager.experiments.step import BaseStep
+from testbenchmanager.experiments.step_configuration import StepConfiguration
+from testbenchmanager.experiments.step_registry import step_registry
+from testbenchmanager.instruments.virtual import virtual_instrument_registry
+
+
+class BurstConfiguration(StepConfiguration):
+    instrument_uids: list[str]  # Virtual instruments to update at their fastest rate
+    # Seconds, None for each source's configured duration
+    duration: Optional[float] = None
+
+
+@step_registry.register_class()
+class Burst(BaseStep):
+    @classmethod
+    def configuration(cls) -> type[BurstConfiguration]:
+        return BurstConfiguration
+
+    def __init__(self, config: BurstConfiguration) -> None:
+        self._instrument_uids = config.instrument_uids
+        self._duration = config.duration
+        super().__init__(config)
+
+    def execute(self, abort_event: Event) -> None:
+        self.state = State.RUNNING
+        self.start_time = datetime.now()
+        outcome = Outcome.SUCCEEDED
+        for uid in self._instrument_uids:
+            try:
+                instrument = virtual_instrument_registry.get(uid)
+            except KeyError:
+                outcome = Outcome.FAILED
+                continue
+            if not instrument.request_burst(self._duration):
+                # Sources which don't adapt their rate already update as fast as they will.
+                if outcome is Outcome.SUCCEEDED:
+                    outcome = Outcome.SUCCEEDED_WITH_WARNINGS
+        self.end_time = datetime.now()
+
+        self.state = State.COMPLETE
+        self.outcome = outcome if not abort_event.is_set() else Outcome.ABORTED
+
+    def instrument_uids(self) -> list[str]:
+        return list(self._instrument_uids)
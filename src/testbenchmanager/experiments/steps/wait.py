@@ -1,6 +1,5 @@
 from datetime import datetime
 from threading import Event
-from time import monotonic, sleep
 
 from testbenchmanager.experiments.state import Outcome, State
 from testbenchmanager.experiments.step import BaseStep
@@ -25,9 +24,8 @@ class Wait(BaseStep):
     def execute(self, abort_event: Event) -> None:
         self.state = State.RUNNING
         self.start_time = datetime.now()
-        timer_start = monotonic()
-        while not abort_event.is_set() and (monotonic() - timer_start) < self._duration:
-            sleep(0.1)
+        # Returns as soon as the run is aborted.
+        abort_event.wait(self._duration)
         self.end_time = datetime.now()
 
         self.state = State.COMPLETE
@@ -2,4 +2,6 @@
 
 from .instrument_configuration import InstrumentConfiguration as InstrumentConfiguration
 from .instrument_manager import InstrumentManager as InstrumentManager
+from .instrument_manager import ReloadReport as ReloadReport
+from .instrument_manager import StopReport as StopReport
 from .instrument_manager import instrument_manager as instrument_manager
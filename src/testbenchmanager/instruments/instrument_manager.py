@@ -1,16 +1,31 @@
 """Top-level manager for the instrumentation component."""
 
+import hashlib
+import json
 import logging
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from functools import partial
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any, ClassVar, Optional
 
 from testbenchmanager.configuration import (
     ConfigurationDirectory,
     ConfigurationManager,
     ConfigurationScope,
 )
-from testbenchmanager.instruments.physical import physical_instrument_registry
-from testbenchmanager.instruments.translation import Translator, translator_registry
+from testbenchmanager.instruments.physical import (
+    InstrumentState,
+    PhysicalInstrumentConfiguration,
+    physical_instrument_registry,
+)
+from testbenchmanager.instruments.translation import (
+    Translator,
+    TranslatorConfiguration,
+    translator_registry,
+)
+from testbenchmanager.instruments.virtual import VirtualInstrument
+from testbenchmanager.instruments.virtual.history_buffer import HistoryBuffer
 
 from .instrument_configuration import (
     InstrumentConfiguration,
@@ -20,6 +35,15 @@ from .instrument_configuration import (
 logger = logging.getLogger(__name__)
 
 
+def _configuration_hash(data: Any) -> str:
+    """
+    Stable hash of configuration data, independent of key order.
+    """
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
 @dataclass
 class InstrumentConfigurationGroup:
     metadata: InstrumentConfigurationMetadata
@@ -27,6 +51,50 @@ class InstrumentConfigurationGroup:
     translators: list[Translator[Any]]
 
 
+@dataclass
+class StopReport:
+    """
+    How long stopping a set of translators took.
+    """
+
+    # Seconds, until every translator stopped or the deadline passed
+    duration: float = 0.0
+    # Seconds, by translator UID
+    latencies: dict[str, float] = field(default_factory=dict)
+    # Translators which detached from stuck work, or didn't stop before the deadline.
+    detached: list[str] = field(default_factory=list)
+
+
+# pylint: disable=too-many-instance-attributes
+# One list per kind of change; grouping them further wouldn't make the report easier to read.
+@dataclass
+class ReloadReport:
+    """
+    What an instrument configuration reload touched, by UID.
+    """
+
+    files_changed: list[str] = field(default_factory=list)  # Added, changed or removed
+    physical_instruments_added: list[str] = field(default_factory=list)
+    physical_instruments_removed: list[str] = field(default_factory=list)
+    physical_instruments_rebuilt: list[str] = field(default_factory=list)
+    physical_instruments_unchanged: list[str] = field(default_factory=list)
+    translators_added: list[str] = field(default_factory=list)
+    translators_removed: list[str] = field(default_factory=list)
+    translators_rebuilt: list[str] = field(default_factory=list)
+    translators_restarted: list[str] = field(default_factory=list)  # To resubscribe
+    translators_unchanged: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)  # Translators which failed to load
+    # Physical instruments which missed their instantiation deadline, retried in the background.
+    physical_instruments_pending: list[str] = field(default_factory=list)
+    # Translators waiting on pending physical instruments, started once they are ready.
+    translators_waiting: list[str] = field(default_factory=list)
+    # Time taken to create each physical instrument created within its deadline, in seconds.
+    instantiation_times: dict[str, float] = field(default_factory=dict)
+    # Stopping the translators rebuilt, removed or restarted.
+    stop: StopReport = field(default_factory=StopReport)
+    duration: float = 0.0  # Seconds
+
+
 class InstrumentManager:
     """
     This is the top-level manager for the instrumentation component.
@@ -42,9 +110,33 @@ class InstrumentManager:
             ConfigurationScope.INSTRUMENTS
         )
 
+    # Overall deadline for stopping translators, in seconds.
+    STOP_DEADLINE: ClassVar[float] = 10.0
+
     def __init__(self):
         self._configuration_groups: dict[str, InstrumentConfigurationGroup] = {}
         self._config_dir: ConfigurationDirectory | None = None
+        self._history_memory_budget: Optional[int] = None
+        # Hashes of what is loaded, by file, physical instrument and translator UID, to reload
+        # only what changed.
+        self._file_hashes: dict[str, str] = {}
+        self._file_configurations: dict[str, InstrumentConfiguration] = {}
+        self._physical_instrument_hashes: dict[str, str] = {}
+        self._translator_hashes: dict[str, str] = {}
+        self._reload_lock: Lock = Lock()
+        # Translators waiting on pending physical instruments, by UID: a token identifying the
+        # wait, their configuration, and the configuration file they belong to.
+        self._waiting: dict[str, tuple[object, TranslatorConfiguration, str]] = {}
+
+    def set_history_memory_budget(self, budget: Optional[int]) -> None:
+        """
+        Set the total memory budget for virtual instrument history, shared out across all virtual
+        instruments when configurations are loaded.
+
+        Args:
+            budget (Optional[int]): Budget in bytes, or None for no budget.
+        """
+        self._history_memory_budget = budget
 
     @property
     def configuration_directory(self) -> ConfigurationDirectory:
@@ -54,70 +146,491 @@ class InstrumentManager:
             )
         return self._config_dir
 
-    def load_all_configurations(self) -> None:
+    def load_all_configurations(self) -> ReloadReport:
         """
-        Unload the current instrument configuration (if any) and load in a new instrument
-        configuration.
+        Load the instrument configuration, or reload it incrementally if one is already loaded.
 
-        Args:
-            config (InstrumentConfiguration): The instrument configuration model to load.
+        Every configuration file, physical instrument and translator entry is hashed, and only what
+        changed is touched: changed physical instruments are recreated, and changed translators,
+        along with translators using changed physical instruments, are rebuilt. Translators
+        consuming the outputs of rebuilt translators are restarted, so they pick up the new virtual
+        instruments. Everything else, including the histories of unchanged virtual instruments,
+        stays live.
+
+        Physical instruments are created concurrently, each with a deadline. Translators using
+        physical instruments which miss their deadline wait for them, and are started in the
+        background once they are ready.
+
+        All configuration files are read and validated before anything is stopped, so a broken
+        file leaves the running configuration untouched.
+
+        Raises:
+            FileNotFoundError: If a configuration file disappears while being read.
+            RuntimeError: If a configuration file can't be parsed.
+            pydantic.ValidationError: If a configuration file is invalid.
+
+        Returns:
+            ReloadReport: What the reload touched.
         """
+        with self._reload_lock:
+            started = monotonic()
+            report = ReloadReport()
 
-        self.stop_all_translators()
+            configurations: dict[str, InstrumentConfiguration] = {}
+            file_hashes: dict[str, str] = {}
+            for configuration_file in self.configuration_directory.configuration_uids:
+                contents = self.configuration_directory.get_contents(configuration_file)
+                file_hash = _configuration_hash(contents)
+                file_hashes[configuration_file] = file_hash
+                if self._file_hashes.get(configuration_file) == file_hash:
+                    configurations[configuration_file] = self._file_configurations[
+                        configuration_file
+                    ]
+                    continue
+                configurations[configuration_file] = (
+                    InstrumentConfiguration.model_validate(contents)
+                )
+                report.files_changed.append(configuration_file)
+            report.files_changed.extend(set(self._file_hashes) - set(file_hashes))
 
-        physical_instrument_registry.clear()
-        self._configuration_groups = {}
+            physical_instrument_configs: dict[str, PhysicalInstrumentConfiguration] = {}
+            physical_instrument_hashes: dict[str, str] = {}
+            translator_configs: dict[str, TranslatorConfiguration] = {}
+            translator_hashes: dict[str, str] = {}
+            translator_files: dict[str, str] = {}
+            for configuration_file, config in configurations.items():
+                for physical_instrument_config in config.physical_instruments:
+                    uid = physical_instrument_config.uid
+                    if uid in physical_instrument_configs:
+                        logger.warning(
+                            "Duplicate physical instrument UID '%s' in '%s' ignored",
+                            uid,
+                            configuration_file,
+                        )
+                        continue
+                    physical_instrument_configs[uid] = physical_instrument_config
+                    physical_instrument_hashes[uid] = _configuration_hash(
+                        physical_instrument_config.model_dump(
+                            mode="json", by_alias=True
+                        )
+                    )
+                for translator_config in config.translators:
+                    uid = translator_config.metadata.uid
+                    if uid in translator_configs:
+                        logger.warning(
+                            "Duplicate translator UID '%s' in '%s' ignored",
+                            uid,
+                            configuration_file,
+                        )
+                        continue
+                    translator_configs[uid] = translator_config
+                    translator_files[uid] = configuration_file
+                    translator_hashes[uid] = _configuration_hash(
+                        translator_config.model_dump(mode="json")
+                    )
 
-        for configuration_file in self.configuration_directory.configuration_uids:
-            config = InstrumentConfiguration.model_validate(
-                self.configuration_directory.get_contents(configuration_file)
+            # Physical instruments which failed to be created last time are retried.
+            registered = set(physical_instrument_registry.keys)
+            old_physical_instrument_hashes = self._physical_instrument_hashes
+            physical_instruments_removed = set(old_physical_instrument_hashes) - set(
+                physical_instrument_hashes
+            )
+            physical_instruments_added = set(physical_instrument_hashes) - set(
+                old_physical_instrument_hashes
+            )
+            physical_instruments_rebuilt = {
+                uid
+                for uid, physical_instrument_hash in physical_instrument_hashes.items()
+                if uid in old_physical_instrument_hashes
+                and (
+                    old_physical_instrument_hashes[uid] != physical_instrument_hash
+                    or (
+                        uid not in registered
+                        and not physical_instrument_registry.is_pending(uid)
+                    )
+                )
+            }
+            physical_instruments_touched = (
+                physical_instruments_removed
+                | physical_instruments_added
+                | physical_instruments_rebuilt
             )
 
+            # Likewise, translators which failed to be instantiated last time are retried.
+            old_translators: dict[str, Translator[Any]] = {
+                translator.metadata.uid: translator
+                for configuration_group in self._configuration_groups.values()
+                for translator in configuration_group.translators
+            }
+            old_translator_hashes = self._translator_hashes
+            translators_removed = set(old_translator_hashes) - set(translator_hashes)
+            translators_added = set(translator_hashes) - set(old_translator_hashes)
+            translators_rebuilt = {
+                uid
+                for uid, translator_hash in translator_hashes.items()
+                if uid in old_translator_hashes
+                and (
+                    old_translator_hashes[uid] != translator_hash
+                    or uid not in old_translators
+                    or old_translators[uid].physical_instrument_uids
+                    & physical_instruments_touched
+                )
+            }
+
+            # Everything validated, so the reload goes ahead. Waiting translators are rebuilt, and
+            # wait again if they still need to.
+            self._waiting = {}
+
+            stopped = [
+                old_translators[uid]
+                for uid in translators_removed | translators_rebuilt
+                if uid in old_translators
+            ]
+            report.stop = self._stop_translators(stopped)
+
+            for uid in physical_instruments_removed | physical_instruments_rebuilt:
+                if uid in registered or physical_instrument_registry.is_pending(uid):
+                    physical_instrument_registry.unregister(uid)
+            for uid in physical_instruments_added:
+                if uid in registered:
+                    # Registered outside of the configuration, the configuration takes over.
+                    physical_instrument_registry.unregister(uid)
             physical_instrument_registry.fill_from_configuration_sequence(
-                config.physical_instruments
+                [
+                    physical_instrument_configs[uid]
+                    for uid in physical_instrument_configs
+                    if uid in physical_instruments_added | physical_instruments_rebuilt
+                ]
             )
-            physical_instrument_uids = [
-                physical_instrument.uid
-                for physical_instrument in config.physical_instruments
+
+            new_translators: dict[str, Translator[Any]] = {}
+            for uid, translator_config in translator_configs.items():
+                if uid not in translators_added | translators_rebuilt:
+                    continue
+                if self._wait_for_physical_instruments(
+                    uid, translator_config, translator_files[uid]
+                ):
+                    report.translators_waiting.append(uid)
+                    continue
+                translator = self._instantiate_translator(translator_config)
+                if translator is None:
+                    report.failed.append(uid)
+                    continue
+                new_translators[uid] = translator
+
+            # Translators consuming replaced virtual instruments are restarted, to resubscribe.
+            replaced_virtual_instrument_uids = {
+                virtual_instrument_uid
+                for translator in [*stopped, *new_translators.values()]
+                for virtual_instrument_uid in translator.virtual_instruments
+            }
+            restarted = [
+                translator
+                for uid, translator in old_translators.items()
+                if uid in translator_hashes
+                and uid not in translators_rebuilt
+                and translator.source_virtual_instrument_uids
+                & replaced_virtual_instrument_uids
             ]
+            restart_stop = self._stop_translators(restarted)
+            report.stop.duration += restart_stop.duration
+            report.stop.latencies.update(restart_stop.latencies)
+            report.stop.detached.extend(restart_stop.detached)
 
-            translators: list[Translator[Any]] = []
-            for translator_config in config.translators:
-                try:
-                    translator_class = translator_registry.get(
-                        translator_config.class_name
+            self._configuration_groups = {}
+            for configuration_file, config in configurations.items():
+                translators: list[Translator[Any]] = []
+                for translator_config in config.translators:
+                    uid = translator_config.metadata.uid
+                    translator = new_translators.get(uid)
+                    if translator is None and uid not in translators_rebuilt:
+                        translator = old_translators.get(uid)
+                    if translator is not None:
+                        translators.append(translator)
+                self._configuration_groups[configuration_file] = (
+                    InstrumentConfigurationGroup(
+                        metadata=config.metadata,
+                        physical_instrument_uids=[
+                            physical_instrument.uid
+                            for physical_instrument in config.physical_instruments
+                        ],
+                        translators=translators,
                     )
-                except KeyError as e:
-                    logger.warning(
-                        "Translator class '%s' not found in registry: %s",
-                        translator_config.class_name,
-                        e,
-                    )
-                    continue
-                translator_config = translator_class.configuration().model_validate(
+                )
+
+            self._file_hashes = file_hashes
+            self._file_configurations = configurations
+            self._physical_instrument_hashes = physical_instrument_hashes
+            self._translator_hashes = translator_hashes
+
+            self.allocate_history_memory()
+            # Every output is registered before any translator starts, so translators consuming
+            # other translators' outputs can find them regardless of configuration order.
+            for translator in new_translators.values():
+                translator.register_virtual_instruments()
+            for translator in [*new_translators.values(), *restarted]:
+                translator.start()
+
+            report.physical_instruments_added = sorted(physical_instruments_added)
+            report.physical_instruments_removed = sorted(physical_instruments_removed)
+            report.physical_instruments_rebuilt = sorted(physical_instruments_rebuilt)
+            report.physical_instruments_unchanged = sorted(
+                set(physical_instrument_hashes) - physical_instruments_touched
+            )
+            report.translators_added = sorted(translators_added)
+            report.translators_removed = sorted(translators_removed)
+            report.translators_rebuilt = sorted(translators_rebuilt)
+            report.translators_restarted = sorted(
+                translator.metadata.uid for translator in restarted
+            )
+            report.translators_unchanged = sorted(
+                set(translator_hashes)
+                - translators_added
+                - translators_rebuilt
+                - set(report.translators_restarted)
+            )
+            records = physical_instrument_registry.instantiation_records()
+            report.physical_instruments_pending = sorted(
+                set(physical_instrument_registry.pending)
+                & set(physical_instrument_hashes)
+            )
+            report.instantiation_times = {
+                uid: record.duration
+                for uid, record in sorted(records.items())
+                if uid in physical_instruments_added | physical_instruments_rebuilt
+                and record.state is InstrumentState.READY
+                and record.duration is not None
+            }
+            report.translators_waiting.sort()
+            report.files_changed.sort()
+            report.failed.sort()
+            report.duration = monotonic() - started
+            logger.info(
+                "Reloaded instrument configuration in %.3f s: %d translators added, "
+                "%d rebuilt, %d restarted, %d removed, %d unchanged",
+                report.duration,
+                len(report.translators_added),
+                len(report.translators_rebuilt),
+                len(report.translators_restarted),
+                len(report.translators_removed),
+                len(report.translators_unchanged),
+            )
+            return report
+
+    def _wait_for_physical_instruments(
+        self,
+        uid: str,
+        translator_config: TranslatorConfiguration,
+        configuration_file: str,
+    ) -> bool:
+        """
+        If a translator needs physical instruments which are still pending, have it instantiated
+        and started once they are ready. Must be called with the reload lock held.
+
+        Args:
+            uid (str): UID of the translator.
+            translator_config (TranslatorConfiguration): Generic translator configuration.
+            configuration_file (str): Configuration file the translator belongs to.
+
+        Returns:
+            bool: True if the translator is waiting, False if it can be instantiated now.
+        """
+        token = object()
+        callback = partial(self._on_physical_instrument_ready, uid, token)
+        waiting = [
+            physical_instrument_registry.when_ready(physical_instrument_uid, callback)
+            for physical_instrument_uid in self._pending_physical_instruments(
+                translator_config
+            )
+        ]
+        if not any(waiting):
+            return False
+        self._waiting[uid] = (token, translator_config, configuration_file)
+        logger.info("Translator '%s' waiting for its physical instruments", uid)
+        return True
+
+    def _pending_physical_instruments(
+        self, translator_config: TranslatorConfiguration
+    ) -> set[str]:
+        """
+        Get the pending physical instruments a translator needs.
+        """
+        try:
+            translator_class = translator_registry.get(translator_config.class_name)
+            required = translator_class.required_physical_instruments(
+                translator_class.configuration().model_validate(
                     translator_config.model_dump()
                 )
-                try:
-                    translator_instance = translator_class(translator_config)
-                    translators.append(translator_instance)
-                except Exception as e:  # pylint: disable=broad-exception-caught
-                    # Catching broad exception here to ensure one faulty translator does not break the
-                    # entire instrument loading process. We'd like to log the error and continue.
-                    logger.error(
-                        "Error occurred while instantiating translator '%s': %s",
-                        translator_config.class_name,
-                        e,
-                    )
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Reported when the translator is instantiated.
+            return set()
+        return {
+            physical_instrument_uid
+            for physical_instrument_uid in required
+            if physical_instrument_registry.is_pending(physical_instrument_uid)
+        }
+
+    def _on_physical_instrument_ready(self, uid: str, token: object) -> None:
+        """
+        Readiness callback of a physical instrument a waiting translator needs. Instantiates and
+        starts the translator once all of them are ready, and restarts translators consuming its
+        outputs.
 
-            configuration_group = InstrumentConfigurationGroup(
-                metadata=config.metadata,
-                physical_instrument_uids=physical_instrument_uids,
-                translators=translators,
+        Args:
+            uid (str): UID of the waiting translator.
+            token (object): Token identifying the wait, so a wait superseded by a reload is
+            ignored.
+        """
+        with self._reload_lock:
+            waiting = self._waiting.get(uid)
+            if waiting is None or waiting[0] is not token:
+                return
+            _, translator_config, configuration_file = waiting
+            if self._pending_physical_instruments(translator_config):
+                # Another callback follows when the rest are ready.
+                return
+            del self._waiting[uid]
+            configuration_group = self._configuration_groups.get(configuration_file)
+            translator = self._instantiate_translator(translator_config)
+            if translator is None or configuration_group is None:
+                return
+            configuration_group.translators.append(translator)
+            self.allocate_history_memory()
+            translator.register_virtual_instruments()
+            restarted = [
+                consumer
+                for group in self._configuration_groups.values()
+                for consumer in group.translators
+                if consumer is not translator
+                and consumer.source_virtual_instrument_uids
+                & set(translator.virtual_instruments)
+            ]
+            for consumer in restarted:
+                consumer.stop()
+            translator.start()
+            for consumer in restarted:
+                consumer.start()
+            logger.info(
+                "Translator '%s' started, its physical instruments are ready", uid
             )
 
-            self._configuration_groups[configuration_file] = configuration_group
+    def _instantiate_translator(
+        self, translator_config: TranslatorConfiguration
+    ) -> Optional[Translator[Any]]:
+        """
+        Instantiate a translator from its generic configuration model.
+
+        Args:
+            translator_config (TranslatorConfiguration): Generic translator configuration.
+
+        Returns:
+            Optional[Translator[Any]]: The translator, or None if it couldn't be instantiated.
+        """
+        try:
+            translator_class = translator_registry.get(translator_config.class_name)
+        except KeyError as e:
+            logger.warning(
+                "Translator class '%s' not found in registry: %s",
+                translator_config.class_name,
+                e,
+            )
+            return None
+        try:
+            translator_config = translator_class.configuration().model_validate(
+                translator_config.model_dump()
+            )
+            return translator_class(translator_config)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Catching broad exception here to ensure one faulty translator does not break the
+            # entire instrument loading process. We'd like to log the error and continue.
+            logger.error(
+                "Error occurred while instantiating translator '%s': %s",
+                translator_config.class_name,
+                e,
+            )
+            return None
+
+    def allocate_history_memory(self) -> None:
+        """
+        Share the history memory budget out across the virtual instruments of all loaded
+        translators.
+
+        The downsampled history tiers are reserved first, then the rest of the budget is split
+        fairly: instruments requesting less than an equal share get everything they request, and
+        whatever they leave is split between the rest.
+        """
+        instruments: list[VirtualInstrument[Any]] = [
+            virtual_instrument
+            for configuration_group in self._configuration_groups.values()
+            for translator in configuration_group.translators
+            for virtual_instrument in translator.virtual_instruments.values()
+        ]
+        budget = self._history_memory_budget
+        if budget is None:
+            for virtual_instrument in instruments:
+                virtual_instrument.set_history_limit(None)
+            return
+
+        available = budget - sum(
+            virtual_instrument.history_tier_memory for virtual_instrument in instruments
+        )
+        if available < 0:
+            logger.warning(
+                "History memory budget of %d bytes does not cover the downsampled history tiers",
+                budget,
+            )
+        remaining = len(instruments)
+        for virtual_instrument in sorted(
+            instruments, key=lambda instrument: instrument.requested_history_length
+        ):
+            share = max(available, 0) // remaining // HistoryBuffer.STATE_SIZE_ESTIMATE
+            requested = virtual_instrument.requested_history_length
+            granted = max(min(requested, share), 1)
+            if granted < requested:
+                logger.warning(
+                    "History of virtual instrument '%s' limited to %d states (requested %d) "
+                    "by the history memory budget",
+                    virtual_instrument.metadata.uid,
+                    granted,
+                    requested,
+                )
+            virtual_instrument.set_history_limit(granted)
+            available -= granted * HistoryBuffer.STATE_SIZE_ESTIMATE
+            remaining -= 1
+
+    @property
+    def translator_uids(self) -> list[str]:
+        """
+        UIDs of all loaded translators.
+
+        Returns:
+            list[str]: Translator UIDs.
+        """
+        return [
+            translator.metadata.uid
+            for configuration_group in self._configuration_groups.values()
+            for translator in configuration_group.translators
+        ]
+
+    def get_translator(self, uid: str) -> Translator[Any]:
+        """
+        Get a loaded translator by UID.
+
+        Args:
+            uid (str): Translator UID.
 
-        self.start_all_translators()
+        Raises:
+            KeyError: If no translator with that UID is loaded.
+
+        Returns:
+            Translator[Any]: The translator.
+        """
+        for configuration_group in self._configuration_groups.values():
+            for translator in configuration_group.translators:
+                if translator.metadata.uid == uid:
+                    return translator
+        raise KeyError(f"Translator with UID '{uid}' not found")
 
     def start_all_translators(self) -> None:
         """
@@ -127,13 +640,101 @@ class InstrumentManager:
             for translator in configuration_group.translators:
                 translator.start()
 
-    def stop_all_translators(self) -> None:
+    def stop_all_translators(self, timeout: Optional[float] = None) -> StopReport:
         """
-        Stop all loaded translators.
+        Stop all loaded translators, in parallel. Translators still waiting on physical instruments
+        are never started.
+
+        Args:
+            timeout (Optional[float], optional): Overall deadline, in seconds. Defaults to None,
+            i.e. STOP_DEADLINE.
+
+        Returns:
+            StopReport: How long stopping took, per translator and overall.
         """
-        for configuration_group in self._configuration_groups.values():
-            for translator in configuration_group.translators:
+        with self._reload_lock:
+            self._waiting = {}
+        report = self._stop_translators(
+            [
+                translator
+                for configuration_group in self._configuration_groups.values()
+                for translator in configuration_group.translators
+            ],
+            timeout,
+        )
+        logger.info(
+            "Stopped %d translators in %.3f s, %d detached",
+            len(report.latencies),
+            report.duration,
+            len(report.detached),
+        )
+        return report
+
+    def _stop_translators(
+        self, translators: list[Translator[Any]], timeout: Optional[float] = None
+    ) -> StopReport:
+        """
+        Stop translators in parallel, each on its own thread, so the time taken is that of the
+        slowest rather than the sum. Translators which haven't stopped by the overall deadline are
+        detached from: their stop carries on in the background.
+
+        Args:
+            translators (list[Translator[Any]]): Translators to stop.
+            timeout (Optional[float], optional): Overall deadline, in seconds. Defaults to None,
+            i.e. STOP_DEADLINE.
+
+        Returns:
+            StopReport: How long stopping took, per translator and overall.
+        """
+        report = StopReport()
+        if not translators:
+            return report
+        if timeout is None:
+            timeout = self.STOP_DEADLINE
+        started = monotonic()
+        latencies: dict[str, float] = {}
+
+        def stop(translator: Translator[Any]) -> None:
+            try:
                 translator.stop()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # One translator failing to stop mustn't keep the others running.
+                logger.error(
+                    "Error occurred while stopping translator '%s': %s",
+                    translator.metadata.uid,
+                    e,
+                )
+            latencies[translator.metadata.uid] = monotonic() - started
+
+        threads = [
+            Thread(
+                target=stop,
+                args=(translator,),
+                name=f"translator-stop-{translator.metadata.uid}",
+                daemon=True,
+            )
+            for translator in translators
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(max(started + timeout - monotonic(), 0))
+
+        report.duration = monotonic() - started
+        for translator, thread in zip(translators, threads):
+            uid = translator.metadata.uid
+            if thread.is_alive():
+                logger.warning(
+                    "Translator '%s' did not stop within %.1f seconds, detaching from it",
+                    uid,
+                    timeout,
+                )
+                report.detached.append(uid)
+                continue
+            report.latencies[uid] = latencies[uid]
+            if translator.detached:
+                report.detached.append(uid)
+        return report
 
 
 instrument_manager = InstrumentManager()
@@ -1,11 +1,24 @@
 """Physical instrument submodule"""
 
+from .physical_instrument_configuration import (
+    BatchGetterCapability as BatchGetterCapability,
+)
+from .physical_instrument_configuration import (
+    PhysicalInstrumentCapabilities as PhysicalInstrumentCapabilities,
+)
 from .physical_instrument_configuration import (
     PhysicalInstrumentConfiguration as PhysicalInstrumentConfiguration,
 )
 from .physical_instrument_factory import (
     PhysicalInstrumentFactory as PhysicalInstrumentFactory,
 )
+from .physical_instrument_registry import InstantiationRecord as InstantiationRecord
+from .physical_instrument_registry import InstrumentState as InstrumentState
 from .physical_instrument_registry import (
     physical_instrument_registry as physical_instrument_registry,
 )
+from .physical_instrument_session import (
+    PhysicalInstrumentSession as PhysicalInstrumentSession,
+)
+from .physical_instrument_session import PriorityLock as PriorityLock
+from .physical_instrument_session import SessionStatistics as SessionStatistics
@@ -5,6 +5,40 @@ from typing import Annotated, Any, Optional
 from pydantic import BaseModel, Field, model_validator
 
 
+class BatchGetterCapability(BaseModel):
+    """
+    Capability hint: a driver function which reads several values in one transaction, that
+    individual calls of another getter can be merged into.
+
+    For example, with getter_function "read_channel", key_argument "channel", batch_function
+    "read_channels" and batch_argument "channels", concurrent calls read_channel(channel=1) and
+    read_channel(channel=2) are merged into a single read_channels(channels=[1, 2]), which must
+    return the values in the same order. Only calls whose other arguments are identical are merged.
+    """
+
+    getter_function: str
+    key_argument: str
+    batch_function: str
+    batch_argument: str
+    max_batch_size: Optional[int] = Field(default=None, ge=1)
+
+
+class PhysicalInstrumentCapabilities(BaseModel):
+    """
+    Capability hints for a physical instrument, used by its session (see
+    PhysicalInstrumentSession) to schedule access to it.
+
+    Attributes:
+        coalesce_window: Time a poll request waits for others due in the same window to be merged
+            with it, in seconds. Defaults to 0, i.e. only requests made while the instrument is
+            busy are merged.
+        batch_getters: Driver functions reading several values in one transaction.
+    """
+
+    coalesce_window: float = Field(default=0.0, ge=0)
+    batch_getters: list[BatchGetterCapability] = []
+
+
 class PhysicalInstrumentConfiguration(BaseModel):
     """
     Configuration Model of a physical instrument
@@ -15,6 +49,10 @@ class PhysicalInstrumentConfiguration(BaseModel):
     module_name: Annotated[str, Field(alias="module")]
     class_name: Annotated[str, Field(alias="class")]
     arguments: dict[str, Any] = {}
+    # Time allowed for the instrument to be created (e.g. to connect) before it is left pending and
+    # retried in the background, in seconds. Defaults to the registry's default.
+    instantiation_timeout: Optional[float] = Field(default=None, gt=0)
+    capabilities: PhysicalInstrumentCapabilities = PhysicalInstrumentCapabilities()
 
     @model_validator(mode="before")
     @classmethod
@@ -1,43 +1,248 @@
 """Registry for physical instruments."""
 
 import logging
-from typing import Sequence
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, replace
+from enum import Enum
+from threading import Condition, Event, Lock, Thread
+from time import monotonic
+from typing import Callable, ClassVar, Optional, Sequence
 
 from testbenchmanager.common.registry import Registry
 
-from .physical_instrument_configuration import PhysicalInstrumentConfiguration
+from .physical_instrument_configuration import (
+    PhysicalInstrumentCapabilities,
+    PhysicalInstrumentConfiguration,
+)
 from .physical_instrument_factory import PhysicalInstrumentFactory
+from .physical_instrument_session import PhysicalInstrumentSession
 
 logger = logging.getLogger(__name__)
 
 
+class InstrumentState(str, Enum):
+    """
+    State of a physical instrument's instantiation.
+    """
+
+    READY = "ready"  # Created and registered
+    PENDING = "pending"  # Missed its deadline, or failed since; being retried in the background
+    FAILED = "failed"  # Failed within its deadline, not retried
+
+
+@dataclass
+class InstantiationRecord:
+    """
+    Timing of a physical instrument's instantiation.
+    """
+
+    uid: str
+    state: InstrumentState
+    attempts: int
+    duration: Optional[float]  # Last completed attempt, in seconds
+    total_duration: Optional[float]  # From the first attempt until ready, in seconds
+    last_error: Optional[str]
+
+
+class _PendingInstrument:
+    """
+    A physical instrument being retried in the background, and what is waiting on it.
+    """
+
+    def __init__(self, config: PhysicalInstrumentConfiguration) -> None:
+        self.config: PhysicalInstrumentConfiguration = config
+        self.cancelled: Event = Event()
+        self.callbacks: list[Callable[[], None]] = []
+
+
 class PhysicalInstrumentRegistry(Registry[object]):
     """
     Registry for physical instruments.
+
+    Alongside each instrument, the registry keeps its capability hints, and the session (see
+    PhysicalInstrumentSession) through which translators share access to it.
+
+    Instruments are created concurrently, each with a deadline, so one unreachable device doesn't
+    hold up the rest of the bench. Instruments which miss their deadline are left pending: they
+    keep being retried in the background, with backoff, and are registered as soon as they are
+    created. Consumers can wait for them with wait_ready() or when_ready().
     """
 
+    DEFAULT_INSTANTIATION_TIMEOUT: ClassVar[float] = 10.0
+    RETRY_INITIAL_DELAY: ClassVar[float] = 1.0
+    RETRY_MAX_DELAY: ClassVar[float] = 60.0
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._capabilities: dict[str, PhysicalInstrumentCapabilities] = {}
+        self._sessions: dict[str, PhysicalInstrumentSession] = {}
+        self._sessions_lock: Lock = Lock()
+        # Guards the registry itself against registration from background retries, along with the
+        # pending instruments and instantiation records.
+        self._pending_condition: Condition = Condition()
+        self._pending: dict[str, _PendingInstrument] = {}
+        self._records: dict[str, InstantiationRecord] = {}
+
     def fill_from_configuration_sequence(
         self, configs: Sequence[PhysicalInstrumentConfiguration]
     ) -> None:
         """
         Populate the registry from a sequence of physical instrument configuration models.
 
+        Instruments are created concurrently, each on its own thread, and this returns once every
+        instrument is created, has failed, or has missed its deadline (instantiation_timeout).
+        Instruments missing their deadline are left pending, and retried in the background until
+        they are created.
+
         Args:
             configs (Sequence[PhysicalInstrumentConfiguration]): Sequence of physical instrument
             configuration models.
         """
+        started = monotonic()
+        attempts: list[tuple[PhysicalInstrumentConfiguration, Future[object]]] = []
         for config in configs:
+            with self._pending_condition:
+                self._records[config.uid] = InstantiationRecord(
+                    config.uid, InstrumentState.PENDING, 0, None, None, None
+                )
+            future: Future[object] = Future()
+            # Daemon threads rather than a pool, so a constructor which never returns can't hold
+            # up shutdown.
+            Thread(
+                target=self._attempt,
+                args=(config, future, started),
+                name=f"instrument-init-{config.uid}",
+                daemon=True,
+            ).start()
+            attempts.append((config, future))
+
+        for config, future in attempts:
+            timeout = (
+                self.DEFAULT_INSTANTIATION_TIMEOUT
+                if config.instantiation_timeout is None
+                else config.instantiation_timeout
+            )
             try:
-                physical_instrument = PhysicalInstrumentFactory.create_instrument(
-                    config
+                physical_instrument = future.result(
+                    max(started + timeout - monotonic(), 0)
+                )
+            except FutureTimeoutError:
+                logger.warning(
+                    "Physical instrument with UID '%s' not created within %.1f s, "
+                    "retrying in the background",
+                    config.uid,
+                    timeout,
                 )
+                self._start_retrying(config, future, started)
+                continue
             except (ImportError, RuntimeError, AttributeError) as e:
                 logger.warning(
                     "Failed to create physical instrument with UID '%s': %s",
                     config.uid,
                     e,
                 )
+                with self._pending_condition:
+                    self._records[config.uid].state = InstrumentState.FAILED
                 continue
+            self._register_created(config, physical_instrument)
+
+        records = self.instantiation_records()
+        batch = [records[config.uid] for config, _ in attempts if config.uid in records]
+        if not batch:
+            return
+        elapsed = monotonic() - started
+        # Pending devices have no completed attempt yet, but have been going for the whole batch,
+        # so they are named with their elapsed time rather than left out of the summary.
+        pending = [
+            record.uid for record in batch if record.state is InstrumentState.PENDING
+        ]
+        completed = [
+            record
+            for record in batch
+            if record.state is not InstrumentState.PENDING
+            and record.duration is not None
+        ]
+        slowest = max(
+            completed, key=lambda record: record.duration or 0.0, default=None
+        )
+        logger.info(
+            "Instantiated %d physical instruments in %.3f s (slowest: %s), %d pending%s",
+            len(attempts),
+            elapsed,
+            (
+                "none"
+                if slowest is None
+                else f"'{slowest.uid}', {slowest.duration or 0.0:.3f} s"
+            ),
+            len(pending),
+            (
+                f" after {elapsed:.3f} s: " + ", ".join(f"'{uid}'" for uid in pending)
+                if pending
+                else ""
+            ),
+        )
+
+    def _attempt(
+        self,
+        config: PhysicalInstrumentConfiguration,
+        future: Future[object],
+        started: float,
+    ) -> None:
+        """
+        Make one attempt at creating a physical instrument, recording its timing.
+        """
+        attempt_started = monotonic()
+        try:
+            physical_instrument = PhysicalInstrumentFactory.create_instrument(config)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Handed to whoever is waiting on the attempt.
+            self._record_attempt(config.uid, attempt_started, started, e)
+            future.set_exception(e)
+            return
+        self._record_attempt(config.uid, attempt_started, started, None)
+        future.set_result(physical_instrument)
+
+    def _record_attempt(
+        self,
+        uid: str,
+        attempt_started: float,
+        started: float,
+        error: Optional[Exception],
+    ) -> None:
+        """
+        Record the timing of an attempt at creating a physical instrument.
+        """
+        finished = monotonic()
+        with self._pending_condition:
+            record = self._records.get(uid)
+            if record is None:
+                return
+            record.attempts += 1
+            record.duration = finished - attempt_started
+            if error is None:
+                record.total_duration = finished - started
+            else:
+                record.last_error = f"{type(error).__qualname__}: {error}"
+
+    def _register_created(
+        self,
+        config: PhysicalInstrumentConfiguration,
+        physical_instrument: object,
+        pending: Optional[_PendingInstrument] = None,
+    ) -> bool:
+        """
+        Register a newly created physical instrument, unless it was pending and has been given up
+        on in the meantime.
+
+        Returns:
+            bool: True if the instrument was registered.
+        """
+        with self._pending_condition:
+            if pending is not None:
+                if self._pending.get(config.uid) is not pending:
+                    return False
+                del self._pending[config.uid]
             try:
                 self.register(config.uid, physical_instrument)
             except KeyError as e:
@@ -46,12 +251,238 @@ class PhysicalInstrumentRegistry(Registry[object]):
                     config.uid,
                     e,
                 )
+                return False
+            self._capabilities[config.uid] = config.capabilities
+            record = self._records.get(config.uid)
+            if record is not None:
+                record.state = InstrumentState.READY
+            self._pending_condition.notify_all()
+        if pending is not None:
+            for callback in pending.callbacks:
+                try:
+                    callback()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    # One failing consumer mustn't stop the others from being told.
+                    logger.error(
+                        "Error in readiness callback of physical instrument '%s': %s",
+                        config.uid,
+                        e,
+                    )
+        return True
+
+    def _start_retrying(
+        self,
+        config: PhysicalInstrumentConfiguration,
+        attempt: Future[object],
+        started: float,
+    ) -> None:
+        """
+        Leave a physical instrument pending, and keep retrying it in the background.
+        """
+        pending = _PendingInstrument(config)
+        with self._pending_condition:
+            previous = self._pending.get(config.uid)
+            if previous is not None:
+                previous.cancelled.set()
+            self._pending[config.uid] = pending
+        Thread(
+            target=self._retry,
+            args=(pending, attempt, started),
+            name=f"instrument-retry-{config.uid}",
+            daemon=True,
+        ).start()
+
+    def _retry(
+        self, pending: _PendingInstrument, attempt: Future[object], started: float
+    ) -> None:
+        """
+        Background retry loop of a pending physical instrument: waits for the attempt in progress,
+        then retries with backoff until the instrument is created or given up on.
+        """
+        config = pending.config
+        delay = self.RETRY_INITIAL_DELAY
+        while True:
+            try:
+                physical_instrument = attempt.result()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Anything the constructor raises just means another retry.
+                logger.warning(
+                    "Failed to create physical instrument with UID '%s', retrying in %.1f s: %s",
+                    config.uid,
+                    delay,
+                    e,
+                )
+                if pending.cancelled.wait(delay):
+                    return
+                delay = min(delay * 2, self.RETRY_MAX_DELAY)
+                attempt = Future()
+                self._attempt(config, attempt, started)
+                continue
+            if self._register_created(config, physical_instrument, pending):
+                logger.info("Physical instrument with UID '%s' is ready", config.uid)
+            return
+
+    def is_pending(self, name: str) -> bool:
+        """
+        Check whether a physical instrument is pending, i.e. still being retried in the background.
+
+        Args:
+            name (str): UID of the physical instrument.
+
+        Returns:
+            bool: True if the instrument is pending.
+        """
+        with self._pending_condition:
+            return name in self._pending
+
+    @property
+    def pending(self) -> list[str]:
+        """
+        UIDs of the pending physical instruments.
+
+        Returns:
+            list[str]: Pending physical instrument UIDs.
+        """
+        with self._pending_condition:
+            return list(self._pending)
+
+    def wait_ready(self, name: str, timeout: Optional[float] = None) -> object:
+        """
+        Wait for a physical instrument to be ready, if it is pending.
+
+        Args:
+            name (str): UID of the physical instrument.
+            timeout (Optional[float], optional): Maximum time to wait, in seconds. Defaults to
+            None, i.e. wait indefinitely.
+
+        Raises:
+            KeyError: If the instrument is neither registered nor pending, or is given up on while
+            waiting.
+            TimeoutError: If the instrument isn't ready within the timeout.
+
+        Returns:
+            object: The physical instrument.
+        """
+        with self._pending_condition:
+            if not self._pending_condition.wait_for(
+                lambda: name not in self._pending, timeout
+            ):
+                raise TimeoutError(
+                    f"Physical instrument with UID '{name}' is not ready."
+                )
+            return self.get(name)
+
+    def when_ready(self, name: str, callback: Callable[[], None]) -> bool:
+        """
+        Call a function once a pending physical instrument is ready. The callback is called from
+        the instrument's background retry thread, and never if the instrument is given up on.
+
+        Args:
+            name (str): UID of the physical instrument.
+            callback (Callable[[], None]): Function to call.
+
+        Raises:
+            KeyError: If the instrument is neither registered nor pending.
+
+        Returns:
+            bool: True if the callback will be called, False if the instrument is already ready,
+            in which case the callback is not called.
+        """
+        with self._pending_condition:
+            pending = self._pending.get(name)
+            if pending is None:
+                self.get(name)
+                return False
+            pending.callbacks.append(callback)
+            return True
+
+    def instantiation_records(self) -> dict[str, InstantiationRecord]:
+        """
+        Get the instantiation timing of every physical instrument created from configuration.
+
+        Returns:
+            dict[str, InstantiationRecord]: Copies of the records, by UID.
+        """
+        with self._pending_condition:
+            return {uid: replace(record) for uid, record in self._records.items()}
+
+    def capabilities(self, name: str) -> PhysicalInstrumentCapabilities:
+        """
+        Get the capability hints of a physical instrument.
+
+        Args:
+            name (str): UID of the physical instrument.
+
+        Raises:
+            KeyError: If no physical instrument with the given UID is registered.
+
+        Returns:
+            PhysicalInstrumentCapabilities: Capability hints, defaults if none were configured.
+        """
+        self.get(name)
+        return self._capabilities.get(name, PhysicalInstrumentCapabilities())
+
+    def session(self, name: str) -> PhysicalInstrumentSession:
+        """
+        Get the session coordinating access to a physical instrument, creating it if needed.
+
+        Args:
+            name (str): UID of the physical instrument.
+
+        Raises:
+            KeyError: If no physical instrument with the given UID is registered.
+
+        Returns:
+            PhysicalInstrumentSession: Session of the physical instrument.
+        """
+        instrument = self.get(name)
+        with self._sessions_lock:
+            session = self._sessions.get(name)
+            if session is None or session.instrument is not instrument:
+                session = PhysicalInstrumentSession(
+                    name, instrument, self.capabilities(name)
+                )
+                self._sessions[name] = session
+            return session
+
+    def unregister(self, name: str) -> None:
+        """
+        Unregister a physical instrument, along with its capability hints and session. A pending
+        physical instrument is given up on.
+
+        Args:
+            name (str): UID of the physical instrument.
+
+        Raises:
+            KeyError: If no physical instrument with the given UID is registered or pending.
+        """
+        with self._pending_condition:
+            pending = self._pending.pop(name, None)
+            self._records.pop(name, None)
+            if pending is not None:
+                pending.cancelled.set()
+                self._pending_condition.notify_all()
+                if name not in self._registry:
+                    return
+            super().unregister(name)
+            self._capabilities.pop(name, None)
+        with self._sessions_lock:
+            self._sessions.pop(name, None)
 
     def clear(self) -> None:
         """
-        Clear all registered physical instruments.
+        Clear all registered physical instruments, and give up on pending ones.
         """
-        self._registry.clear()
+        with self._pending_condition:
+            for pending in self._pending.values():
+                pending.cancelled.set()
+            self._pending.clear()
+            self._records.clear()
+            self._registry.clear()
+            self._capabilities.clear()
+            self._pending_condition.notify_all()
+        with self._sessions_lock:
+            self._sessions.clear()
 
 
 physical_instrument_registry = PhysicalInstrumentRegistry()  # global singleton instance
@@ -0,0 +1,335 @@
+"""Sessions coordinating access to physical instruments."""
+
+import logging
+from concurrent.futures import Future
+from dataclasses import dataclass
+from threading import Condition
+from time import sleep
+from typing import Any, Hashable, Optional
+
+from .physical_instrument_configuration import (
+    BatchGetterCapability,
+    PhysicalInstrumentCapabilities,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionStatistics:
+    """
+    Counters of the requests a session has handled, and the transactions it made for them.
+    """
+
+    requests: int = 0  # Getter requests made through the session
+    transactions: int = 0  # Driver calls actually made for them, batched or not
+    batched: int = 0  # Requests served by a batch call
+    deduplicated: int = 0  # Requests served by an identical request's call
+
+
+class PriorityLock:
+    """
+    A lock with two priorities: while a priority acquirer is waiting, normal acquirers wait too, so
+    priority acquirers get the lock as soon as it is released. Not reentrant.
+
+    Used as a context manager, it is acquired at normal priority.
+    """
+
+    def __init__(self) -> None:
+        self._condition: Condition = Condition()
+        self._locked: bool = False
+        self._priority_waiting: int = 0
+
+    def acquire(self, priority: bool = False, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire the lock, blocking until it is available.
+
+        Args:
+            priority (bool, optional): Acquire ahead of normal priority acquirers. Defaults to
+            False.
+            timeout (Optional[float], optional): Longest time to wait for the lock, in seconds.
+            Defaults to None, i.e. no limit.
+
+        Returns:
+            bool: True if the lock was acquired, False if the timeout ran out first.
+        """
+        with self._condition:
+            if priority:
+                self._priority_waiting += 1
+                try:
+                    acquired = self._condition.wait_for(
+                        lambda: not self._locked, timeout
+                    )
+                finally:
+                    self._priority_waiting -= 1
+                    if not self._priority_waiting:
+                        # Normal priority acquirers may have been held back by this one.
+                        self._condition.notify_all()
+            else:
+                acquired = self._condition.wait_for(
+                    lambda: not self._locked and not self._priority_waiting, timeout
+                )
+            if acquired:
+                self._locked = True
+            return acquired
+
+    def release(self) -> None:
+        """
+        Release the lock.
+        """
+        with self._condition:
+            self._locked = False
+            self._condition.notify_all()
+
+    def __enter__(self) -> "PriorityLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.release()
+
+
+class _Request:
+    """
+    A pending getter request.
+    """
+
+    __slots__ = ("function", "arguments", "future", "key")
+
+    def __init__(self, function: str, arguments: dict[str, Any]) -> None:
+        self.function: str = function
+        self.arguments: dict[str, Any] = arguments
+        self.future: Future[Any] = Future()
+        # Identity of the request, for deduplication; None if the arguments aren't hashable.
+        self.key: Optional[Hashable]
+        try:
+            self.key = (function, frozenset(arguments.items()))
+            hash(self.key)
+        except TypeError:
+            self.key = None
+
+
+class PhysicalInstrumentSession:
+    """
+    Coordinates access to one physical instrument by all the translators using it.
+
+    Every call to the instrument is made under the session's lock, so translators never access the
+    instrument concurrently. Direct calls (see call()), e.g. setters, take the lock ahead of poll
+    requests waiting for it, so commands aren't held up behind background polls. Getter requests
+    (see request()) are also scheduled: requests made while the instrument is busy, or within the
+    coalesce window of each other, are collected and made together, with
+
+    - identical requests (same getter and arguments) served by a single call;
+    - requests for a getter with a batch capability merged into batch calls (see
+      BatchGetterCapability);
+    - and everything else called in turn, back to back under one acquisition of the lock.
+
+    The first requester in a window makes the calls for everyone, the others wait for its results.
+    """
+
+    def __init__(
+        self,
+        uid: str,
+        instrument: object,
+        capabilities: Optional[PhysicalInstrumentCapabilities] = None,
+    ) -> None:
+        self.uid: str = uid
+        self.instrument: object = instrument
+        self.capabilities: PhysicalInstrumentCapabilities = (
+            capabilities
+            if capabilities is not None
+            else PhysicalInstrumentCapabilities()
+        )
+        self._batch_getters: dict[str, BatchGetterCapability] = {
+            batch_getter.getter_function: batch_getter
+            for batch_getter in self.capabilities.batch_getters
+        }
+        # Held for every call to the instrument.
+        self.lock: PriorityLock = PriorityLock()
+        self._condition: Condition = Condition()
+        self._pending: list[_Request] = []
+        self._collecting: bool = False
+        self._statistics: SessionStatistics = SessionStatistics()
+
+    def call(self, function: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a function of the instrument directly, under the session lock, e.g. a setter. The
+        call takes priority over poll requests waiting for the instrument.
+
+        Args:
+            function (str): Name of the function.
+            *args (Any): Positional arguments.
+            **kwargs (Any): Keyword arguments.
+
+        Returns:
+            Any: Result of the function.
+        """
+        self.lock.acquire(priority=True)
+        try:
+            return getattr(self.instrument, function)(*args, **kwargs)
+        finally:
+            self.lock.release()
+
+    def request(self, function: str, **kwargs: Any) -> Any:
+        """
+        Request a reading from a getter of the instrument. The request may be served together with
+        other requests, deduplicated or batched.
+
+        Args:
+            function (str): Name of the getter.
+            **kwargs (Any): Keyword arguments of the getter.
+
+        Raises:
+            Exception: Whatever the getter (or the batch function serving it) raised.
+
+        Returns:
+            Any: Result of the getter.
+        """
+        request = _Request(function, kwargs)
+        with self._condition:
+            self._pending.append(request)
+            self._statistics.requests += 1
+            leading = not self._collecting
+            self._collecting = True
+
+        if leading:
+            window = self.capabilities.coalesce_window
+            if window > 0:
+                # Let other requests due in the same window join in.
+                sleep(window)
+            with self.lock:
+                with self._condition:
+                    requests, self._pending = self._pending, []
+                    self._collecting = False
+                self._serve(requests)
+        return request.future.result()
+
+    def statistics(self) -> SessionStatistics:
+        """
+        Get a copy of the session's counters.
+
+        Returns:
+            SessionStatistics: Counters of requests and transactions.
+        """
+        with self._condition:
+            return SessionStatistics(**vars(self._statistics))
+
+    def _serve(self, requests: list[_Request]) -> None:
+        """
+        Make the calls serving a set of requests, and complete their futures. Must be called with
+        the session lock held.
+        """
+        # Identical requests share the first one's call.
+        unique: list[_Request] = []
+        duplicates: dict[Hashable, list[_Request]] = {}
+        for request in requests:
+            if request.key is not None and request.key in duplicates:
+                duplicates[request.key].append(request)
+                continue
+            unique.append(request)
+            if request.key is not None:
+                duplicates[request.key] = []
+
+        # Group requests for batchable getters by their other arguments.
+        batches: dict[Hashable, list[_Request]] = {}
+        singles: list[_Request] = []
+        for request in unique:
+            capability = self._batch_getters.get(request.function)
+            if capability is None or capability.key_argument not in request.arguments:
+                singles.append(request)
+                continue
+            try:
+                group = (
+                    request.function,
+                    frozenset(
+                        (name, value)
+                        for name, value in request.arguments.items()
+                        if name != capability.key_argument
+                    ),
+                )
+                hash(group)
+            except TypeError:
+                singles.append(request)
+                continue
+            batches.setdefault(group, []).append(request)
+
+        transactions = 0
+        batched = 0
+        for group_requests in batches.values():
+            if len(group_requests) == 1:
+                singles.append(group_requests[0])
+                continue
+            capability = self._batch_getters[group_requests[0].function]
+            size = capability.max_batch_size or len(group_requests)
+            for start in range(0, len(group_requests), size):
+                chunk = group_requests[start : start + size]
+                self._call_batch(capability, chunk)
+                transactions += 1
+                batched += len(chunk)
+        for request in singles:
+            self._call_single(request)
+            transactions += 1
+
+        deduplicated = 0
+        for request in unique:
+            if request.key is None:
+                continue
+            for duplicate in duplicates[request.key]:
+                deduplicated += 1
+                _copy_outcome(request.future, duplicate.future)
+
+        with self._condition:
+            self._statistics.transactions += transactions
+            self._statistics.batched += batched
+            self._statistics.deduplicated += deduplicated
+
+    def _call_single(self, request: _Request) -> None:
+        """
+        Serve a request with a call to its getter.
+        """
+        try:
+            result = getattr(self.instrument, request.function)(**request.arguments)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Handed to the requester, to handle as if it had called the getter itself.
+            request.future.set_exception(e)
+            return
+        request.future.set_result(result)
+
+    def _call_batch(
+        self, capability: BatchGetterCapability, requests: list[_Request]
+    ) -> None:
+        """
+        Serve requests for a batchable getter with a single call to its batch function.
+        """
+        arguments = {
+            name: value
+            for name, value in requests[0].arguments.items()
+            if name != capability.key_argument
+        }
+        arguments[capability.batch_argument] = [
+            request.arguments[capability.key_argument] for request in requests
+        ]
+        try:
+            results = list(
+                getattr(self.instrument, capability.batch_function)(**arguments)
+            )
+            if len(results) != len(requests):
+                raise ValueError(
+                    f"Batch function '{capability.batch_function}' returned "
+                    f"{len(results)} results for {len(requests)} requests"
+                )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Handed to the requesters, to handle as if they had called the getter themselves.
+            for request in requests:
+                request.future.set_exception(e)
+            return
+        for request, result in zip(requests, results):
+            request.future.set_result(result)
+
+
+def _copy_outcome(source: Future[Any], destination: Future[Any]) -> None:
+    exception = source.exception()
+    if exception is not None:
+        destination.set_exception(exception)
+    else:
+        destination.set_result(source.result())
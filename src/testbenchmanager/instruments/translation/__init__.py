@@ -1,5 +1,31 @@
 """Translation layer submodule."""
 
+from .acquisition_loop import AcquisitionLoop as AcquisitionLoop
+from .acquisition_loop import acquisition_loop as acquisition_loop
+from .acquisition_loop import call_in_session as call_in_session
+from .acquisition_loop import call_maybe_async as call_maybe_async
+from .adaptive_polling import AdaptiveInterval as AdaptiveInterval
+from .adaptive_polling import (
+    AdaptivePollingConfiguration as AdaptivePollingConfiguration,
+)
+from .async_translator import AsyncTranslator as AsyncTranslator
+from .field_extraction import ExtractionFailure as ExtractionFailure
+from .field_extraction import FieldSetExtractor as FieldSetExtractor
+from .field_extraction import compile_field_path as compile_field_path
+from .field_extraction import parse_field_path as parse_field_path
+from .poll_scheduler import PollScheduler as PollScheduler
+from .poll_scheduler import ScheduledPoll as ScheduledPoll
+from .poll_scheduler import poll_scheduler as poll_scheduler
+from .polling_schedule import Histogram as Histogram
+from .polling_schedule import HistogramSnapshot as HistogramSnapshot
+from .polling_schedule import OverrunPolicy as OverrunPolicy
+from .polling_schedule import PollingSchedule as PollingSchedule
+from .polling_schedule import PollingTelemetry as PollingTelemetry
+from .polling_schedule import PollingTelemetrySnapshot as PollingTelemetrySnapshot
+from .supervision import CircuitState as CircuitState
+from .supervision import SupervisionConfiguration as SupervisionConfiguration
+from .supervision import TranslatorHealth as TranslatorHealth
+from .supervision import TranslatorSupervisor as TranslatorSupervisor
 from .translator import Translator as Translator
 from .translator_configuration import TranslatorConfiguration as TranslatorConfiguration
 from .translator_registry import translator_registry as translator_registry
@@ -0,0 +1,148 @@
+"""Dedicated event loop for asynchronous acquisition."""
+
+import asyncio
+import inspect
+from concurrent.futures import Future
+from threading import Lock, Thread
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+from testbenchmanager.instruments.physical import PhysicalInstrumentSession
+
+T = TypeVar("T")
+
+
+class AcquisitionLoop:
+    """
+    An asyncio event loop running on its own thread, shared by all asynchronous translators, so
+    any number of asynchronous instruments can be driven concurrently from a single thread.
+
+    The loop and its thread are created lazily on first use.
+    """
+
+    def __init__(self) -> None:
+        self._lock: Lock = Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[Thread] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """
+        The acquisition event loop, started if it isn't running yet.
+
+        Returns:
+            asyncio.AbstractEventLoop: The acquisition event loop.
+        """
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = Thread(
+                    target=self._loop.run_forever, name="acquisition-loop", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> Future[T]:
+        """
+        Run a coroutine on the acquisition loop, from any thread.
+
+        Args:
+            coroutine (Coroutine[Any, Any, T]): Coroutine to run.
+
+        Returns:
+            Future[T]: Future for the result of the coroutine.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def call_soon(self, function: Callable[[], None]) -> None:
+        """
+        Call a function on the acquisition loop, from any thread.
+
+        Args:
+            function (Callable[[], None]): Function to call.
+        """
+        self.loop.call_soon_threadsafe(function)
+
+
+acquisition_loop = AcquisitionLoop()  # global singleton instance
+
+
+async def call_maybe_async(
+    function: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """
+    Call a physical instrument function from the acquisition loop. Coroutine functions are awaited
+    directly; plain functions are run on a worker thread so they can't block the loop.
+
+    Args:
+        function (Callable[..., Any]): Function to call.
+        *args (Any): Positional arguments.
+        **kwargs (Any): Keyword arguments.
+
+    Returns:
+        Any: Result of the function.
+    """
+    if inspect.iscoroutinefunction(function):
+        return await function(*args, **kwargs)
+    result = await asyncio.to_thread(function, *args, **kwargs)
+    if inspect.isawaitable(result):
+        # e.g. a plain function returning a coroutine or future.
+        return await result
+    return result
+
+
+async def call_in_session(
+    session: PhysicalInstrumentSession,
+    function: str,
+    args: tuple[Any, ...] = (),
+    kwargs: Optional[dict[str, Any]] = None,
+    priority: bool = False,
+    timeout: Optional[float] = None,
+) -> Any:
+    """
+    Call a physical instrument function from the acquisition loop under its session's lock, so
+    asynchronous translators never access an instrument concurrently with each other, or with
+    threaded translators using it.
+
+    The lock is held until the call has really finished: a plain function run on a worker thread
+    can't be interrupted, so if the caller stops waiting for it (on timeout or cancellation), the
+    lock is only released once the thread returns. Coroutine functions are cancelled instead.
+
+    Args:
+        session (PhysicalInstrumentSession): Session of the physical instrument.
+        function (str): Name of the function.
+        args (tuple[Any, ...], optional): Positional arguments. Defaults to ().
+        kwargs (Optional[dict[str, Any]], optional): Keyword arguments. Defaults to None.
+        priority (bool, optional): Take the lock ahead of normal priority callers, e.g. for
+        setters. Defaults to False.
+        timeout (Optional[float], optional): Longest time to wait for the lock and the call
+        together, in seconds. Defaults to None, i.e. no limit.
+
+    Raises:
+        TimeoutError: If the timeout ran out.
+
+    Returns:
+        Any: Result of the function.
+    """
+    method = getattr(session.instrument, function)
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    lock = session.lock
+    if not lock.acquire(priority, timeout=0):
+        # Wait for the lock on a worker thread, up to the deadline, so the loop isn't blocked.
+        acquiring = loop.create_task(asyncio.to_thread(lock.acquire, priority, timeout))
+        try:
+            acquired = await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            acquiring.add_done_callback(
+                lambda task: task.cancelled() or not task.result() or lock.release()
+            )
+            raise
+        if not acquired:
+            raise TimeoutError(f"Timed out waiting for '{session.uid}'")
+
+    call = loop.create_task(call_maybe_async(method, *args, **(kwargs or {})))
+    call.add_done_callback(lambda _: lock.release())
+    remaining = None if deadline is None else max(deadline - loop.time(), 0.0)
+    if inspect.iscoroutinefunction(method):
+        return await asyncio.wait_for(call, remaining)
+    return await asyncio.wait_for(asyncio.shield(call), remaining)
@@ -0,0 +1,142 @@
+"""Adaptive polling rates, driven by how much the polled values are changing."""
+
+from threading import Lock
+from typing import Any, Optional, Sequence
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class AdaptivePollingConfiguration(BaseModel):
+    """
+    Configuration Model for adaptive polling.
+
+    Attributes:
+        min_interval: Interval polled at while values are moving, and during bursts, in seconds.
+        max_interval: Interval backed off to while values are stable, in seconds.
+        deadband: Largest change of a numeric value between two polls still taken as stable.
+            Non-numeric values are stable while they don't change.
+        rate_threshold: Optional largest rate of change of a numeric value (per second) still taken
+            as stable, checked as well as the deadband.
+        stable_polls: Consecutive stable polls before the interval is backed off.
+        backoff_multiplier: Factor the interval grows by each time it is backed off.
+        burst_duration: Time polled at min_interval after a burst request or a command, in
+            seconds.
+    """
+
+    min_interval: float = Field(gt=0)
+    max_interval: float = Field(gt=0)
+    deadband: float = Field(default=0.0, ge=0)
+    rate_threshold: Optional[float] = Field(default=None, ge=0)
+    stable_polls: int = Field(default=3, ge=1)
+    backoff_multiplier: float = Field(default=2.0, gt=1)
+    burst_duration: float = Field(default=10.0, ge=0)
+
+    @model_validator(mode="after")
+    def _check_intervals(self) -> "AdaptivePollingConfiguration":
+        if self.max_interval < self.min_interval:
+            raise ValueError("max_interval must not be less than min_interval")
+        return self
+
+
+class AdaptiveInterval:
+    """
+    Decides the polling interval from the polled values: polls at min_interval while any value is
+    moving (beyond the deadband, or the rate threshold), and backs off geometrically towards
+    max_interval while they are all stable. A burst holds the interval at min_interval for a while,
+    whatever the values are doing.
+
+    Thread safe; bursts are typically requested from other threads than the one polling.
+    """
+
+    def __init__(self, config: AdaptivePollingConfiguration) -> None:
+        self._config: AdaptivePollingConfiguration = config
+        self._lock: Lock = Lock()
+        self._interval: float = config.min_interval
+        self._last_values: Optional[Sequence[Any]] = None
+        self._last_time: float = 0.0
+        self._stable_count: int = 0
+        self._burst_until: float = 0.0
+
+    @property
+    def interval(self) -> float:
+        """
+        Current polling interval.
+
+        Returns:
+            float: Interval, in seconds.
+        """
+        return self._interval
+
+    def observe(self, values: Sequence[Any], now: float) -> float:
+        """
+        Update the interval from the values of a poll.
+
+        Args:
+            values (Sequence[Any]): Polled values.
+            now (float): Monotonic time of the poll.
+
+        Returns:
+            float: Interval until the next poll, in seconds.
+        """
+        config = self._config
+        with self._lock:
+            last_values = self._last_values
+            elapsed = now - self._last_time
+            self._last_values = values
+            self._last_time = now
+            if last_values is None or len(last_values) != len(values):
+                moving = True
+            else:
+                moving = any(
+                    self._moving(previous, value, elapsed)
+                    for previous, value in zip(last_values, values)
+                )
+            if moving or now < self._burst_until:
+                self._stable_count = 0
+                self._interval = config.min_interval
+            else:
+                self._stable_count += 1
+                if self._stable_count >= config.stable_polls:
+                    self._stable_count = 0
+                    self._interval = min(
+                        self._interval * config.backoff_multiplier, config.max_interval
+                    )
+            return self._interval
+
+    def _moving(self, previous: Any, value: Any, elapsed: float) -> bool:
+        """
+        Check whether a value has moved since the previous poll.
+        """
+        numeric = (int, float)
+        if (
+            not isinstance(previous, numeric)
+            or not isinstance(value, numeric)
+            or isinstance(previous, bool)
+            or isinstance(value, bool)
+        ):
+            return bool(previous != value)
+        change = abs(value - previous)
+        if change > self._config.deadband:
+            return True
+        threshold = self._config.rate_threshold
+        return threshold is not None and elapsed > 0 and change / elapsed > threshold
+
+    def burst(self, now: float, duration: Optional[float] = None) -> float:
+        """
+        Snap back to min_interval, and hold it there for a while.
+
+        Args:
+            now (float): Current monotonic time.
+            duration (Optional[float], optional): How long to hold min_interval for, in seconds.
+            Defaults to None, i.e. burst_duration.
+
+        Returns:
+            float: Interval until the next poll, in seconds.
+        """
+        if duration is None:
+            duration = self._config.burst_duration
+        with self._lock:
+            self._burst_until = max(self._burst_until, now + duration)
+            self._stable_count = 0
+            self._interval = self._config.min_interval
+            return self._interval
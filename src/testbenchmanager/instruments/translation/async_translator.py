@@ -0,0 +1,129 @@
+"""Base class for asynchronous translators."""
+
+import asyncio
+from abc import abstractmethod
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Optional
+
+from testbenchmanager.instruments.physical import PhysicalInstrumentSession
+from testbenchmanager.instruments.virtual import VirtualInstrumentValue
+
+from .acquisition_loop import acquisition_loop, call_in_session
+from .translator import Translator
+from .translator_configuration import TranslatorConfiguration
+
+
+class AsyncTranslator(Translator[VirtualInstrumentValue]):
+    """
+    Base class for translators driving asynchronous physical instruments. Instead of a worker
+    thread, each translator runs a task on the shared acquisition event loop (see
+    AcquisitionLoop), so any number of instruments can be driven concurrently from one thread.
+
+    Physical instrument functions may be coroutine functions, which are awaited on the loop, or
+    plain functions, which are run on a worker thread so they don't block it. Either way, they are
+    called under the physical instrument's session lock (see call_in_session), so they never run
+    concurrently with other calls to the same instrument.
+    """
+
+    requires_worker_thread = False
+
+    def __init__(self, config: TranslatorConfiguration) -> None:
+        super().__init__(config)
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @abstractmethod
+    async def run(self) -> None:
+        """
+        Implementation-specific main coroutine, run on the acquisition loop from start() until it
+        is cancelled by stop().
+        """
+        raise NotImplementedError()
+
+    def start(self) -> None:
+        """
+        Start the translator task on the acquisition loop.
+        """
+        super().start()
+        acquisition_loop.call_soon(self._create_task)
+
+    def stop(self) -> None:
+        """
+        Cancel the translator task, and wait for it to finish, at most stop_timeout.
+        """
+        future = acquisition_loop.submit(self._cancel_task())
+        try:
+            future.result(self._stop_timeout)
+        except FutureTimeoutError:
+            self._detach()
+        super().stop()
+
+    def _create_task(self) -> None:
+        """
+        Create the translator task. Must be called on the acquisition loop.
+        """
+        self._task = asyncio.get_running_loop().create_task(
+            self._run_guarded(), name=f"translator-{self.metadata.uid}"
+        )
+
+    async def _cancel_task(self) -> None:
+        """
+        Cancel the translator task and wait for it to finish.
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        # A task cancelled before it started never runs, so wait on it rather than awaiting it.
+        await asyncio.wait([task])
+
+    async def _run_guarded(self) -> None:
+        """
+        Run the main coroutine, logging rather than propagating exceptions.
+        """
+        try:
+            await self.run()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Nothing awaits the task, so anything raised would otherwise go unreported.
+            self._logger.warning("Exception raised in translator task: %s", e)
+
+    def command_callback(
+        self,
+        session: PhysicalInstrumentSession,
+        function: str,
+        arguments: dict[str, Any],
+    ) -> Callable[[VirtualInstrumentValue], Future[Any]]:
+        """
+        Wrap a physical instrument setter as a virtual instrument command callback, which runs the
+        setter on the acquisition loop without waiting for it, and returns a future for it. The
+        setter takes the session lock ahead of polls waiting for it.
+
+        Args:
+            session (PhysicalInstrumentSession): Session of the physical instrument.
+            function (str): Name of the setter, called with the commanded value and arguments.
+            arguments (dict[str, Any]): Keyword arguments for the setter.
+
+        Returns:
+            Callable[[VirtualInstrumentValue], Future[Any]]: Command callback.
+        """
+
+        def command(value: VirtualInstrumentValue) -> Future[Any]:
+            future = acquisition_loop.submit(
+                call_in_session(session, function, (value,), arguments, priority=True)
+            )
+            future.add_done_callback(self._log_command_error)
+            return future
+
+        return command
+
+    def _log_command_error(self, future: Future[Any]) -> None:
+        """
+        Log the exception raised by a setter, if any.
+        """
+        if future.cancelled():
+            return
+        exception = future.exception()
+        if exception is not None:
+            self._logger.warning("Error commanding physical instrument: %s", exception)
@@ -0,0 +1,201 @@
+"""Compiled field paths for extracting values from instrument messages."""
+
+import re
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Hashable, Sequence
+
+# One step of a field path: ".name" or a leading "name" is an attribute, "[3]" a list index, and
+# "['key']", '["key"]' or "[key]" a dictionary key.
+_STEP_PATTERN = re.compile(
+    r"""(?:^|\.)(?P<attribute>[A-Za-z_]\w*)"""
+    r"""|\[(?:(?P<index>-?\d+)|(?P<quote>['"])(?P<quoted>.*?)(?P=quote)|(?P<key>[A-Za-z_]\w*))\]"""
+)
+
+type FieldStep = tuple[bool, Hashable]  # (is_attribute, attribute name or item key)
+
+
+def parse_field_path(path: str) -> list[FieldStep]:
+    """
+    Parse a field path, e.g. "data[3].pressure" or "channels['ch1'].value", into its steps.
+
+    Args:
+        path (str): Field path.
+
+    Raises:
+        ValueError: If the path is empty or malformed.
+
+    Returns:
+        list[FieldStep]: Steps of the path, as (is_attribute, attribute name or item key).
+    """
+    steps: list[FieldStep] = []
+    position = 0
+    while position < len(path):
+        match = _STEP_PATTERN.match(path, position)
+        # A leading "." would match the attribute pattern, but isn't a valid path.
+        if match is None or (position == 0 and path.startswith(".")):
+            raise ValueError(f"Malformed field path '{path}' at position {position}")
+        if match["attribute"] is not None:
+            steps.append((True, match["attribute"]))
+        elif match["index"] is not None:
+            steps.append((False, int(match["index"])))
+        elif match["quote"] is not None:
+            steps.append((False, match["quoted"]))
+        else:
+            steps.append((False, match["key"]))
+        position = match.end()
+    if not steps:
+        raise ValueError("Empty field path")
+    return steps
+
+
+def _compile_steps(steps: Sequence[FieldStep]) -> Callable[[Any], Any]:
+    """
+    Compile field path steps into a single function. Runs of attributes are combined into a single
+    operator.attrgetter, so the common dotted path is a single C-level call.
+    """
+    getters: list[Callable[[Any], Any]] = []
+    attributes: list[str] = []
+    for is_attribute, key in steps:
+        if is_attribute:
+            attributes.append(str(key))
+            continue
+        if attributes:
+            getters.append(attrgetter(".".join(attributes)))
+            attributes = []
+        getters.append(itemgetter(key))
+    if attributes:
+        getters.append(attrgetter(".".join(attributes)))
+
+    if len(getters) == 1:
+        return getters[0]
+
+    def extract(message: Any) -> Any:
+        for getter in getters:
+            message = getter(message)
+        return message
+
+    return extract
+
+
+def compile_field_path(path: str) -> Callable[[Any], Any]:
+    """
+    Compile a field path (see parse_field_path) into a function extracting the field from a
+    message, using operator.attrgetter and operator.itemgetter.
+
+    Args:
+        path (str): Field path.
+
+    Raises:
+        ValueError: If the path is malformed.
+
+    Returns:
+        Callable[[Any], Any]: Function taking a message and returning the field.
+    """
+    return _compile_steps(parse_field_path(path))
+
+
+class ExtractionFailure:
+    """
+    Placeholder for a field which couldn't be extracted from a message.
+    """
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error: Exception = error
+
+
+class _PathNode:
+    """
+    Node of the trie of paths built by FieldSetExtractor.
+    """
+
+    __slots__ = ("outputs", "children")
+
+    def __init__(self) -> None:
+        self.outputs: list[int] = []
+        self.children: dict[FieldStep, "_PathNode"] = {}
+
+
+class FieldSetExtractor:
+    """
+    Extracts several fields from a message in one pass.
+
+    The paths are merged into a trie, so a prefix shared by several paths (e.g. "data[3]" in
+    "data[3].pressure" and "data[3].temperature") is resolved once per message however many
+    fields go through it. The trie is then flattened into a list of compiled steps, each taking
+    its input from an earlier step's result, with runs of steps no other path branches off from
+    compiled together (see compile_field_path).
+    """
+
+    def __init__(self, paths: Sequence[str]) -> None:
+        """
+        Args:
+            paths (Sequence[str]): Field paths (see parse_field_path).
+
+        Raises:
+            ValueError: If a path is malformed.
+        """
+        root = _PathNode()
+        for output, path in enumerate(paths):
+            node = root
+            for step in parse_field_path(path):
+                node = node.children.setdefault(step, _PathNode())
+            node.outputs.append(output)
+
+        # Flattened trie: step i computes result i + 1 from result `source` (result 0 being the
+        # message itself), and output j is result _output_results[j].
+        self._steps: list[tuple[Callable[[Any], Any], int]] = []
+        self._output_results: list[int] = [0] * len(paths)
+        self._flatten(root, 0)
+
+    def _flatten(self, node: _PathNode, result: int) -> None:
+        """
+        Append the steps below a trie node, whose value is the given result, to the step list.
+        """
+        for output in node.outputs:
+            self._output_results[output] = result
+        for step, child in node.children.items():
+            steps = [step]
+            # Fold in the following steps for as long as nothing branches off.
+            while not child.outputs and len(child.children) == 1:
+                ((step, child),) = child.children.items()
+                steps.append(step)
+            self._steps.append((_compile_steps(steps), result))
+            self._flatten(child, len(self._steps))
+
+    def extract(self, message: Any) -> list[Any]:
+        """
+        Extract every field from a message.
+
+        Args:
+            message (Any): Message to extract from.
+
+        Returns:
+            list[Any]: The fields, in the order of the paths. Fields which couldn't be extracted
+            are ExtractionFailure instances.
+        """
+        results = [message]
+        try:
+            for getter, source in self._steps:
+                results.append(getter(results[source]))
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Some field is missing; go again, isolating the failure to the fields affected.
+            return self._extract_isolated(message)
+        return [results[result] for result in self._output_results]
+
+    def _extract_isolated(self, message: Any) -> list[Any]:
+        """
+        Extract every field from a message, with failures replaced by ExtractionFailure instances
+        and propagated to every step depending on them.
+        """
+        results = [message]
+        for getter, source in self._steps:
+            value = results[source]
+            if not isinstance(value, ExtractionFailure):
+                try:
+                    value = getter(value)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    value = ExtractionFailure(e)
+            results.append(value)
+        return [results[result] for result in self._output_results]
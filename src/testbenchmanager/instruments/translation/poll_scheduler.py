@@ -0,0 +1,223 @@
+"""Shared scheduler for periodic polls."""
+
+import heapq
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from threading import Condition, Thread, get_ident
+from time import monotonic
+from typing import Callable, Hashable, Optional
+
+from .polling_schedule import PollingSchedule
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledPoll:
+    """
+    Handle for a periodic poll registered with a PollScheduler.
+    """
+
+    def __init__(
+        self,
+        poll: Callable[[], object],
+        schedule: PollingSchedule,
+        key: Optional[Hashable],
+    ) -> None:
+        self.poll = poll
+        self.schedule: PollingSchedule = schedule
+        self.key: Optional[Hashable] = key
+        self.due: float = 0.0  # monotonic time the poll is next due
+        self.cancelled: bool = False
+        self.running: bool = False
+        # Whether the poll is waiting in the heap, at due.
+        self.scheduled: bool = False
+        # Ident of the thread running the poll, if any.
+        self.thread: Optional[int] = None
+
+
+# pylint: disable=too-many-instance-attributes
+# Scheduler state, the worker pool and its lifecycle; splitting it up wouldn't make it simpler.
+class PollScheduler:
+    """
+    Runs periodic polls on a bounded pool of worker threads, instead of a thread per poller.
+
+    Polls are kept in a heap ordered by due time, and a single scheduler thread dispatches them to
+    the pool as they come due, so the number of threads scales with the number of polls running
+    at the same time rather than with the number of pollers.
+
+    Polls sharing a serialization key (e.g. the UID of the physical instrument they poll) never run
+    concurrently: a poll which comes due while another with the same key is running waits for it,
+    and then runs on the same worker thread.
+
+    Polls are kept on an absolute schedule (see PollingSchedule), with what happens when a poll
+    overruns its interval decided by its overrun policy. The scheduler thread and pool are created
+    lazily.
+    """
+
+    def __init__(self, max_workers: int = 8) -> None:
+        self._max_workers: int = max_workers
+        self._condition: Condition = Condition()
+        self._heap: list[tuple[float, int, ScheduledPoll]] = []
+        self._counter = count()
+        # Keys with a poll currently running, and the polls waiting on them.
+        self._busy_keys: dict[Hashable, deque[ScheduledPoll]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[Thread] = None
+
+    def schedule(
+        self,
+        poll: Callable[[], object],
+        schedule: PollingSchedule,
+        key: Optional[Hashable] = None,
+        delay: float = 0.0,
+    ) -> ScheduledPoll:
+        """
+        Register a periodic poll.
+
+        Args:
+            poll (Callable[[], object]): Function to call on every poll. Exceptions are logged. A
+            poll returning False is taken as skipped, and isn't recorded in the telemetry.
+            schedule (PollingSchedule): Schedule of the polls, and telemetry to record their
+            timing in, if any.
+            key (Optional[Hashable], optional): Serialization key; polls with the same key never
+            run concurrently. Defaults to None, i.e. no serialization.
+            delay (float, optional): Time until the first poll, in seconds. Defaults to 0.0.
+
+        Returns:
+            ScheduledPoll: Handle to cancel the poll with.
+        """
+        job = ScheduledPoll(poll, schedule, key)
+        with self._condition:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="poll-worker"
+                )
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name="poll-scheduler", daemon=True
+                )
+                self._thread.start()
+            job.due = schedule.start(monotonic() + delay)
+            self._push(job)
+        return job
+
+    def cancel(
+        self, job: ScheduledPoll, wait: bool = True, timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Cancel a periodic poll.
+
+        Args:
+            job (ScheduledPoll): Poll to cancel.
+            wait (bool, optional): Block until the poll is no longer running. Ignored when called
+            from within the poll itself. Defaults to True.
+            timeout (Optional[float], optional): Maximum time to wait, in seconds. Defaults to
+            None, i.e. wait indefinitely.
+
+        Returns:
+            bool: False if the poll was still running when the timeout expired, True otherwise.
+        """
+        with self._condition:
+            job.cancelled = True
+            if not wait or job.thread == get_ident():
+                return True
+            return self._condition.wait_for(lambda: not job.running, timeout)
+
+    def expedite(self, job: ScheduledPoll, due: float) -> None:
+        """
+        Bring a periodic poll forward, e.g. to react to a burst request. The schedule carries on
+        from the new deadline. Does nothing if the poll is already due earlier, or is running (in
+        which case its schedule decides when it runs next).
+
+        Args:
+            job (ScheduledPoll): Poll to bring forward.
+            due (float): Monotonic time it is now due.
+        """
+        with self._condition:
+            if job.cancelled or not job.scheduled or due >= job.due:
+                return
+            # The heap entry at the old due time is left behind, and skipped when it is reached.
+            job.due = due
+            job.schedule.deadline = due
+            self._push(job)
+
+    def _push(self, job: ScheduledPoll) -> None:
+        """
+        Add a poll to the heap, waking the scheduler thread if it is now the next one due. Must be
+        called with the condition held.
+        """
+        job.scheduled = True
+        heapq.heappush(self._heap, (job.due, next(self._counter), job))
+        if self._heap[0][2] is job:
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        """
+        Scheduler thread, dispatches polls to the pool as they come due.
+        """
+        with self._condition:
+            while True:
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                due, _, job = self._heap[0]
+                remaining = due - monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                heapq.heappop(self._heap)
+                if job.cancelled or not job.scheduled or due != job.due:
+                    # Cancelled, or left behind when the poll was brought forward.
+                    continue
+                job.scheduled = False
+                if job.key is not None:
+                    waiting = self._busy_keys.get(job.key)
+                    if waiting is not None:
+                        waiting.append(job)
+                        continue
+                    self._busy_keys[job.key] = deque()
+                job.running = True
+                if self._executor is not None:
+                    self._executor.submit(self._execute, job)
+
+    def _execute(self, job: ScheduledPoll) -> None:
+        """
+        Run a poll on a pool thread, followed by any polls that queued up behind it on its key.
+        """
+        while True:
+            job.thread = get_ident()
+            started = monotonic()
+            polled = True
+            try:
+                polled = job.poll() is not False
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # A failing poll mustn't take the worker thread down with it.
+                logger.warning(
+                    "%s raised in scheduled poll: %s", type(e).__qualname__, e
+                )
+            finished = monotonic()
+            if polled and job.schedule.telemetry is not None:
+                job.schedule.telemetry.record_poll(job.due, started, finished)
+            with self._condition:
+                job.running = False
+                job.thread = None
+                if not job.cancelled:
+                    job.due = job.schedule.advance(finished)
+                    self._push(job)
+                # Wake anyone waiting in cancel().
+                self._condition.notify_all()
+                if job.key is None:
+                    return
+                waiting = self._busy_keys[job.key]
+                while waiting and waiting[0].cancelled:
+                    waiting.popleft()
+                if not waiting:
+                    del self._busy_keys[job.key]
+                    return
+                job = waiting.popleft()
+                job.running = True
+
+
+poll_scheduler = PollScheduler()  # global singleton instance
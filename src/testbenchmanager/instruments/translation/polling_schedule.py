@@ -0,0 +1,296 @@
+"""Absolute-deadline polling schedules, and telemetry on how well they are kept."""
+
+import math
+from bisect import bisect_left
+from dataclasses import dataclass
+from enum import Enum
+from threading import Lock
+from typing import Optional
+
+
+class OverrunPolicy(str, Enum):
+    """
+    What a polling schedule does when a poll overruns, i.e. finishes after the next poll was due.
+    """
+
+    SKIP = "skip"  # Drop the ticks that were missed, and carry on from the next one on the grid
+    CATCH_UP = "catch_up"  # Poll back to back until the missed ticks are made up (up to a limit)
+    STRETCH = "stretch"  # Poll straight away, and shift the grid to start from there
+
+
+class PollingSchedule:
+    """
+    A schedule of polls on an absolute grid: poll n is due at start + n * interval, however long
+    each poll takes, so the schedule doesn't drift. The overrun policy decides what happens when a
+    poll overruns.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        policy: OverrunPolicy = OverrunPolicy.SKIP,
+        max_catch_up: int = 10,
+        telemetry: Optional["PollingTelemetry"] = None,
+    ) -> None:
+        """
+        Args:
+            interval (float): Time between polls, in seconds.
+            policy (OverrunPolicy, optional): Overrun policy. Defaults to OverrunPolicy.SKIP.
+            max_catch_up (int, optional): Most missed ticks made up with OverrunPolicy.CATCH_UP;
+            any beyond that are skipped. Defaults to 10.
+            telemetry (Optional[PollingTelemetry], optional): Telemetry to record polls and
+            overruns in. Defaults to None.
+        """
+        self.interval: float = interval
+        self.policy: OverrunPolicy = policy
+        self.max_catch_up: int = max_catch_up
+        self.deadline: float = 0.0  # Monotonic time the next poll is due
+        # Monotonic time the schedule was last started or advanced, i.e. the earliest a poll still
+        # catching up on missed ticks can have started.
+        self._advanced: float = 0.0
+        self.overruns: int = 0
+        self.skipped: int = 0
+        self.telemetry: Optional[PollingTelemetry] = telemetry
+
+    def start(self, now: float) -> float:
+        """
+        Start the schedule, with the first poll due now.
+
+        Args:
+            now (float): Current monotonic time.
+
+        Returns:
+            float: Deadline of the first poll.
+        """
+        self.deadline = now
+        self._advanced = now
+        return self.deadline
+
+    def advance(self, now: float, earliest: Optional[float] = None) -> float:
+        """
+        Move on to the next poll, after a poll completes.
+
+        An overrun is counted when a poll misses a tick: a poll on schedule finishing after the
+        next one was due, or a poll catching up on missed ticks taking longer than an interval, so
+        the backlog grows. Polls working through a backlog within their interval aren't overruns.
+
+        Args:
+            now (float): Current monotonic time.
+            earliest (Optional[float], optional): Monotonic time before which the next poll mustn't
+            be made, e.g. while backing off after failures. Ticks before it are skipped, without
+            counting as overruns. Defaults to None.
+
+        Returns:
+            float: Deadline of the next poll.
+        """
+        interval = self.interval
+        # The poll started at its deadline, or if that had already passed, when it was advanced to.
+        started = max(self.deadline, self._advanced)
+        self._advanced = now
+        deadline = self.deadline + interval
+        if deadline < now:
+            behind = math.ceil((now - deadline) / interval)  # Ticks since missed
+            skipped = 0
+            if self.policy is OverrunPolicy.SKIP:
+                skipped = behind
+                deadline += behind * interval
+            elif self.policy is OverrunPolicy.CATCH_UP:
+                skipped = max(0, behind - self.max_catch_up)
+                deadline += skipped * interval
+            else:
+                deadline = now
+            if skipped or started + interval < now:
+                self.overruns += 1
+                self.skipped += skipped
+                if self.telemetry is not None:
+                    self.telemetry.record_overrun(skipped)
+        if earliest is not None and deadline < earliest:
+            if self.policy is OverrunPolicy.STRETCH:
+                deadline = earliest
+            else:
+                deadline += math.ceil((earliest - deadline) / interval) * interval
+        self.deadline = deadline
+        return deadline
+
+
+@dataclass
+class HistogramSnapshot:
+    """
+    Point-in-time copy of a Histogram. Statistics are None until there is data.
+    """
+
+    count: int
+    mean: Optional[float]
+    std: Optional[float]  # Sample standard deviation
+    minimum: Optional[float]
+    maximum: Optional[float]
+    # Percentiles, estimated as the upper bound of the bucket they fall in.
+    p50: Optional[float]
+    p90: Optional[float]
+    p99: Optional[float]
+    bucket_bounds: list[float]  # Upper bound of each non-empty bucket, in seconds
+    bucket_counts: list[int]
+
+
+class Histogram:
+    """
+    Histogram of durations, in log-spaced buckets (four per doubling, from 1 µs to about 2 minutes,
+    so within about 19% of the true value), plus the exact mean, standard deviation, minimum and
+    maximum. Durations below the first bucket (including negative ones) count in the first.
+
+    This class is not thread safe, the owner is expected to hold its own lock.
+    """
+
+    BUCKET_BOUNDS: list[float] = [1e-6 * 2 ** (i / 4) for i in range(108)]
+
+    def __init__(self) -> None:
+        self._counts: list[int] = [0] * (len(self.BUCKET_BOUNDS) + 1)
+        self._count: int = 0
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+        self._minimum: float = math.inf
+        self._maximum: float = -math.inf
+
+    def add(self, value: float) -> None:
+        """
+        Record a duration.
+
+        Args:
+            value (float): Duration, in seconds.
+        """
+        self._counts[bisect_left(self.BUCKET_BOUNDS, value)] += 1
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        self._minimum = min(self._minimum, value)
+        self._maximum = max(self._maximum, value)
+
+    def _percentile(self, fraction: float) -> float:
+        rank = fraction * self._count
+        cumulative = 0
+        for index, count in enumerate(self._counts):
+            cumulative += count
+            if cumulative >= rank:
+                break
+        if index < len(self.BUCKET_BOUNDS):
+            return min(self.BUCKET_BOUNDS[index], self._maximum)
+        return self._maximum
+
+    def snapshot(self) -> HistogramSnapshot:
+        """
+        Get a copy of the histogram.
+
+        Returns:
+            HistogramSnapshot: The histogram and its statistics.
+        """
+        if self._count == 0:
+            return HistogramSnapshot(
+                0, None, None, None, None, None, None, None, [], []
+            )
+        bounds = self.BUCKET_BOUNDS + [math.inf]
+        non_empty = [index for index, count in enumerate(self._counts) if count]
+        return HistogramSnapshot(
+            count=self._count,
+            mean=self._mean,
+            std=math.sqrt(self._m2 / (self._count - 1)) if self._count > 1 else None,
+            minimum=self._minimum,
+            maximum=self._maximum,
+            p50=self._percentile(0.5),
+            p90=self._percentile(0.9),
+            p99=self._percentile(0.99),
+            bucket_bounds=[bounds[index] for index in non_empty],
+            bucket_counts=[self._counts[index] for index in non_empty],
+        )
+
+
+@dataclass
+class PollingTelemetrySnapshot:
+    """
+    Point-in-time copy of a translator's polling telemetry.
+    """
+
+    # Current target interval (adapted, with adaptive polling), in seconds
+    polling_interval: float
+    overrun_policy: OverrunPolicy
+    polls: int
+    overruns: int  # Polls which finished after the next poll was due
+    skipped: int  # Ticks skipped because of overruns
+    interval: HistogramSnapshot  # Actual time between the starts of consecutive polls
+    duration: HistogramSnapshot  # Time each poll took
+    lateness: HistogramSnapshot  # Time each poll started after it was due
+
+
+class PollingTelemetry:
+    """
+    Telemetry on how well a polling translator keeps to its schedule: histograms of the actual
+    interval between polls, of poll durations and of lateness, plus overrun counts. Recording a
+    poll is O(log buckets).
+    """
+
+    def __init__(self, polling_interval: float, overrun_policy: OverrunPolicy) -> None:
+        self._polling_interval: float = polling_interval
+        self._overrun_policy: OverrunPolicy = overrun_policy
+        self._lock: Lock = Lock()
+        self._interval: Histogram = Histogram()
+        self._duration: Histogram = Histogram()
+        self._lateness: Histogram = Histogram()
+        self._overruns: int = 0
+        self._skipped: int = 0
+        self._last_start: Optional[float] = None
+
+    def record_poll(self, deadline: float, started: float, finished: float) -> None:
+        """
+        Record a poll.
+
+        Args:
+            deadline (float): Monotonic time the poll was due.
+            started (float): Monotonic time the poll started.
+            finished (float): Monotonic time the poll finished.
+        """
+        with self._lock:
+            if self._last_start is not None:
+                self._interval.add(started - self._last_start)
+            self._last_start = started
+            self._duration.add(finished - started)
+            self._lateness.add(started - deadline)
+
+    def set_polling_interval(self, polling_interval: float) -> None:
+        """
+        Update the target interval, e.g. when it is adapted to signal activity.
+
+        Args:
+            polling_interval (float): Target interval, in seconds.
+        """
+        self._polling_interval = polling_interval
+
+    def record_overrun(self, skipped: int) -> None:
+        """
+        Record an overrun.
+
+        Args:
+            skipped (int): Number of ticks skipped because of it.
+        """
+        with self._lock:
+            self._overruns += 1
+            self._skipped += skipped
+
+    def snapshot(self) -> PollingTelemetrySnapshot:
+        """
+        Get a copy of the telemetry.
+
+        Returns:
+            PollingTelemetrySnapshot: The telemetry.
+        """
+        with self._lock:
+            duration = self._duration.snapshot()
+            return PollingTelemetrySnapshot(
+                polling_interval=self._polling_interval,
+                overrun_policy=self._overrun_policy,
+                polls=duration.count,
+                overruns=self._overruns,
+                skipped=self._skipped,
+                interval=self._interval.snapshot(),
+                duration=duration,
+                lateness=self._lateness.snapshot(),
+            )
@@ -0,0 +1,260 @@
+"""Failure supervision for translators: backoff, circuit breaking and rate-limited logging."""
+
+import random
+from dataclasses import dataclass
+from enum import Enum
+from logging import LoggerAdapter
+from threading import Lock
+from time import monotonic
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+
+class CircuitState(str, Enum):
+    """
+    State of a translator's circuit breaker.
+    """
+
+    CLOSED = "closed"  # Healthy, or failing but still retrying with backoff
+    OPEN = "open"  # Failing persistently, attempts suspended until a recovery probe
+    HALF_OPEN = "half_open"  # Probing for recovery with a single attempt
+
+
+class SupervisionConfiguration(BaseModel):
+    """
+    Configuration Model for translator failure supervision.
+
+    Attributes:
+        initial_backoff: Delay before retrying after the first failure, in seconds.
+        max_backoff: Maximum delay before retrying, in seconds.
+        backoff_multiplier: Factor the delay grows by with each consecutive failure.
+        jitter: Random variation of each delay, as a fraction of it, so that many translators
+            failing together (e.g. on a shared bus) don't all retry in lockstep.
+        failure_threshold: Consecutive failures after which the circuit opens.
+        recovery_timeout: Time the circuit stays open before probing for recovery, in seconds.
+        log_interval: Minimum time between logging repeated failures, in seconds.
+    """
+
+    initial_backoff: float = Field(default=0.5, ge=0)
+    max_backoff: float = Field(default=30.0, ge=0)
+    backoff_multiplier: float = Field(default=2.0, ge=1)
+    jitter: float = Field(default=0.2, ge=0, le=1)
+    failure_threshold: int = Field(default=5, ge=1)
+    recovery_timeout: float = Field(default=30.0, ge=0)
+    log_interval: float = Field(default=60.0, ge=0)
+
+
+@dataclass
+class TranslatorHealth:
+    """
+    Snapshot of a translator's failure supervision state.
+    """
+
+    state: CircuitState
+    consecutive_failures: int
+    total_failures: int
+    last_error: Optional[str]
+    seconds_since_failure: Optional[float]
+    seconds_since_success: Optional[float]
+    retry_in: float  # Seconds until the next attempt is allowed
+
+
+# pylint: disable=too-many-instance-attributes
+# Circuit state, failure counts and logging state; splitting them up wouldn't make it simpler.
+class TranslatorSupervisor:
+    """
+    Tracks the failures of a translator's attempts to reach its source (e.g. polls), and decides
+    when the next attempt may be made.
+
+    Consecutive failures back off exponentially, with jitter. After failure_threshold consecutive
+    failures the circuit opens, and attempts are suspended for recovery_timeout; the circuit then
+    goes half-open, and allows a single probe attempt. If the probe succeeds the circuit closes
+    again, otherwise it reopens for another recovery_timeout.
+
+    Repeated failures are logged at most once per log_interval, with a count of those suppressed,
+    while circuit state changes are always logged.
+    """
+
+    def __init__(
+        self,
+        configuration: SupervisionConfiguration,
+        logger: LoggerAdapter[Any],
+    ) -> None:
+        self._configuration = configuration
+        self._logger = logger
+        self._lock: Lock = Lock()
+        self._state: CircuitState = CircuitState.CLOSED
+        self._consecutive_failures: int = 0
+        self._total_failures: int = 0
+        self._last_error: Optional[str] = None
+        self._last_failure_time: Optional[float] = None
+        self._last_success_time: Optional[float] = None
+        self._next_attempt_time: float = 0.0
+        self._probing: bool = False
+        self._last_log_time: Optional[float] = None
+        self._suppressed_logs: int = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """
+        Current circuit state.
+        """
+        return self._state
+
+    @property
+    def total_failures(self) -> int:
+        """
+        Total number of failures recorded.
+        """
+        return self._total_failures
+
+    def retry_delay(self) -> float:
+        """
+        Time until the next attempt is allowed, in seconds.
+
+        Returns:
+            float: Seconds until the next attempt, or 0.0 if one is allowed now.
+        """
+        return max(0.0, self._next_attempt_time - monotonic())
+
+    def attempt_allowed(self) -> bool:
+        """
+        Check whether an attempt may be made now. When the circuit is open and its recovery
+        timeout has passed, this moves it to half-open and allows the caller a single probe.
+
+        Returns:
+            bool: True if the caller should make an attempt, and record its outcome.
+        """
+        with self._lock:
+            if monotonic() < self._next_attempt_time:
+                return False
+            if self._state is CircuitState.CLOSED:
+                return True
+            if self._probing:
+                return False
+            if self._state is CircuitState.OPEN:
+                self._state = CircuitState.HALF_OPEN
+                self._logger.info("Circuit half-open, probing for recovery")
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        """
+        Record a successful attempt, closing the circuit and resetting the backoff.
+        """
+        with self._lock:
+            self._last_success_time = monotonic()
+            if self._consecutive_failures == 0 and self._state is CircuitState.CLOSED:
+                return
+            if self._state is not CircuitState.CLOSED:
+                self._logger.info(
+                    "Circuit closed, recovered after %d consecutive failures",
+                    self._consecutive_failures,
+                )
+            elif self._suppressed_logs:
+                self._logger.info(
+                    "Recovered after %d consecutive failures",
+                    self._consecutive_failures,
+                )
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._next_attempt_time = 0.0
+            self._probing = False
+            self._last_log_time = None
+            self._suppressed_logs = 0
+
+    def record_failure(self, error: BaseException) -> float:
+        """
+        Record a failed attempt, backing off or opening the circuit as appropriate.
+
+        Args:
+            error (BaseException): The error the attempt failed with.
+
+        Returns:
+            float: Time until the next attempt is allowed, in seconds.
+        """
+        configuration = self._configuration
+        with self._lock:
+            now = monotonic()
+            self._consecutive_failures += 1
+            self._total_failures += 1
+            self._last_error = f"{type(error).__qualname__}: {error}"
+            self._last_failure_time = now
+            self._probing = False
+
+            if (
+                self._state is not CircuitState.CLOSED
+                or self._consecutive_failures >= configuration.failure_threshold
+            ):
+                if self._state is CircuitState.CLOSED:
+                    self._logger.warning(
+                        "Circuit opened after %d consecutive failures, last: %s",
+                        self._consecutive_failures,
+                        self._last_error,
+                    )
+                    self._last_log_time = now
+                elif self._state is CircuitState.HALF_OPEN:
+                    self._logger.info("Recovery probe failed: %s", self._last_error)
+                self._state = CircuitState.OPEN
+                delay = configuration.recovery_timeout
+            else:
+                delay = min(
+                    configuration.initial_backoff
+                    * configuration.backoff_multiplier
+                    ** (self._consecutive_failures - 1),
+                    configuration.max_backoff,
+                )
+                self._log_failure(now)
+            delay *= random.uniform(1 - configuration.jitter, 1 + configuration.jitter)
+            self._next_attempt_time = now + delay
+            return delay
+
+    def _log_failure(self, now: float) -> None:
+        """
+        Log the last failure, unless another was logged within the log interval. Must be called
+        with the lock held.
+        """
+        if (
+            self._last_log_time is not None
+            and now - self._last_log_time < self._configuration.log_interval
+        ):
+            self._suppressed_logs += 1
+            return
+        if self._suppressed_logs:
+            self._logger.warning(
+                "Failure: %s (%d similar failures suppressed)",
+                self._last_error,
+                self._suppressed_logs,
+            )
+        else:
+            self._logger.warning("Failure: %s", self._last_error)
+        self._last_log_time = now
+        self._suppressed_logs = 0
+
+    def health(self) -> TranslatorHealth:
+        """
+        Get a snapshot of the supervision state.
+
+        Returns:
+            TranslatorHealth: Current supervision state.
+        """
+        with self._lock:
+            now = monotonic()
+            return TranslatorHealth(
+                state=self._state,
+                consecutive_failures=self._consecutive_failures,
+                total_failures=self._total_failures,
+                last_error=self._last_error,
+                seconds_since_failure=(
+                    None
+                    if self._last_failure_time is None
+                    else now - self._last_failure_time
+                ),
+                seconds_since_success=(
+                    None
+                    if self._last_success_time is None
+                    else now - self._last_success_time
+                ),
+                retry_in=max(0.0, self._next_attempt_time - now),
+            )
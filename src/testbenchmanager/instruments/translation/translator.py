@@ -3,7 +3,7 @@
 import logging
 from abc import ABC, abstractmethod
 from threading import Event, Thread
-from typing import Generic
+from typing import ClassVar, Generic, Optional
 
 from testbenchmanager.common.logging import PrefixAdaptor
 from testbenchmanager.instruments.virtual import (
@@ -12,6 +12,8 @@ from testbenchmanager.instruments.virtual import (
     virtual_instrument_registry,
 )
 
+from .polling_schedule import PollingTelemetry
+from .supervision import TranslatorSupervisor
 from .translator_configuration import TranslatorConfiguration
 
 logger = logging.getLogger(__name__)
@@ -23,8 +25,22 @@ class Translator(ABC, Generic[VirtualInstrumentValue]):
     (physical or virtual) and output (always virtual) instruments. They have a worker loop to
     perform the necessary logic to gather data from source instruments and update output virtual
     instruments accordingly.
+
+    Purely event-driven translators, which do all their work in callbacks, can set
+    requires_worker_thread to False to run without a worker thread at all.
+
+    Waits in the worker loop are made on the stop event, so stopping is prompt. A worker stuck in a
+    driver call is waited on for at most stop_timeout, then detached from: stop() returns and the
+    (daemon) thread is left to finish, or not, on its own.
+
+    Each translator has a supervisor tracking failures to reach its sources. The worker loop backs
+    off on the supervisor when the translation loop raises, rather than retrying straight away.
+    Returning from the translation loop isn't taken as a success, since it may not have reached its
+    sources at all: translators record their successes themselves (e.g. after a poll).
     """
 
+    requires_worker_thread: ClassVar[bool] = True
+
     def __init__(self, config: TranslatorConfiguration) -> None:
         self.metadata = config.metadata
         self.virtual_instruments: dict[
@@ -35,8 +51,20 @@ class Translator(ABC, Generic[VirtualInstrumentValue]):
         ] = {}  # UID: VirtualInstrument mapping
         self._thread: Thread = Thread(target=self._worker_thread, daemon=True)
         self._stop_event: Event = Event()
+        self._stop_timeout: float = config.stop_timeout
+        self._registered: bool = False
+        # Set if stop() gave up waiting for the translator's work to finish.
+        self.detached: bool = False
 
         self._logger = PrefixAdaptor(logger, f"[{self.metadata.uid}] ")
+        self.supervisor: TranslatorSupervisor = TranslatorSupervisor(
+            config.supervision, self._logger
+        )
+        # Schedule telemetry, for translators which poll.
+        self.telemetry: Optional[PollingTelemetry] = None
+        # What the translator depends on, so it can be rebuilt or restarted when they are reloaded.
+        self.physical_instrument_uids: set[str] = set()
+        self.source_virtual_instrument_uids: set[str] = set()
 
     @classmethod
     @abstractmethod
@@ -52,10 +80,33 @@ class Translator(ABC, Generic[VirtualInstrumentValue]):
         """
         raise NotImplementedError()
 
-    def start(self) -> None:
+    @classmethod
+    def required_physical_instruments(
+        cls, configuration: TranslatorConfiguration
+    ) -> set[str]:
         """
-        Start the translator core working loop.
+        UIDs of the physical instruments which must be ready before a translator can be created
+        from a configuration. By default, the one named by its physical_instrument_uid, if any.
+
+        Args:
+            configuration (TranslatorConfiguration): Configuration of the translator.
+
+        Returns:
+            set[str]: Physical instrument UIDs.
+        """
+        uid = getattr(configuration, "physical_instrument_uid", None)
+        return {uid} if isinstance(uid, str) else set()
+
+    def register_virtual_instruments(self) -> None:
+        """
+        Register the output virtual instruments of this translator in the virtual instrument
+        registry. This is done by start() if it hasn't been already, but can be done separately so
+        that every translator's outputs are registered before any translator starts, e.g. for
+        translators which consume other translators' outputs.
         """
+        if self._registered:
+            return
+        self._registered = True
         for uid, virtual_instrument in self.virtual_instruments.items():
             try:
                 virtual_instrument_registry.register(uid, virtual_instrument)
@@ -65,16 +116,44 @@ class Translator(ABC, Generic[VirtualInstrumentValue]):
                     uid,
                     e,
                 )
-        self._thread.start()
+
+    def start(self) -> None:
+        """
+        Start the translator core working loop.
+        """
+        self.register_virtual_instruments()
+        if self.requires_worker_thread:
+            self._thread.start()
 
     def stop(self) -> None:
         """
-        Stop the translator core working loop
+        Stop the translator core working loop, waiting at most stop_timeout for it to finish.
         """
         self._stop_event.set()
-        self._thread.join()
-        for virtual_instrument in self.virtual_instruments.values():
-            virtual_instrument_registry.unregister(virtual_instrument.metadata.uid)
+        if self._thread.is_alive():
+            self._thread.join(self._stop_timeout)
+            if self._thread.is_alive():
+                self._detach()
+        if not self._registered:
+            return
+        self._registered = False
+        for uid, virtual_instrument in self.virtual_instruments.items():
+            try:
+                if virtual_instrument_registry.get(uid) is virtual_instrument:
+                    virtual_instrument_registry.unregister(uid)
+            except KeyError:
+                # Never made it into the registry, e.g. a duplicate UID.
+                pass
+
+    def _detach(self) -> None:
+        """
+        Give up waiting for the translator's work to finish, e.g. a stuck driver call.
+        """
+        self.detached = True
+        self._logger.warning(
+            "Translator did not stop within %.1f seconds, detaching from it",
+            self._stop_timeout,
+        )
 
     def _worker_thread(self) -> None:
         """
@@ -85,13 +164,13 @@ class Translator(ABC, Generic[VirtualInstrumentValue]):
             try:
                 self.translation_loop()
             except Exception as e:  # pylint: disable=broad-exception-caught
-                # We need to catch all exceptions here to prevent the thread from dying
-                self._logger.warning("Exception raised in translation loop: %s", e)
+                # We need to catch all exceptions here to prevent the thread from dying, and back
+                # off so a persistent failure doesn't turn into a busy loop.
+                self._stop_event.wait(self.supervisor.record_failure(e))
 
-    @abstractmethod
     def translation_loop(self) -> None:
         """
         Implementation-specific implementation to gather data from the source instruments and
-        update the output virtual instruments accordingly.
+        update the output virtual instruments accordingly. Translators with a worker thread must
+        override it; purely event-driven ones can leave this no-op.
         """
-        raise NotImplementedError()
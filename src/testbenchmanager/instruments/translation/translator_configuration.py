@@ -4,6 +4,8 @@ from typing import Annotated, Optional
 
 from pydantic import AliasChoices, BaseModel, Field
 
+from .supervision import SupervisionConfiguration
+
 
 class TranslatorMetadata(BaseModel):
     """Configuration Model for Translator Metadata"""
@@ -20,6 +22,10 @@ class TranslatorConfiguration(BaseModel):
     class_name: Annotated[
         str, Field(validation_alias=AliasChoices("class", "class_name"))
     ]
+    supervision: SupervisionConfiguration = SupervisionConfiguration()
+    # Time to wait for the translator to stop, e.g. for a driver call in progress to return, before
+    # detaching from it, in seconds.
+    stop_timeout: float = Field(default=5.0, gt=0)
 
     # pylint: disable=too-few-public-methods
     # This is internal pydantic configuration. Has to be like this.
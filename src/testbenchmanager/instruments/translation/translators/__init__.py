@@ -1,4 +1,12 @@
 """Concrete translator implementations."""
 
+from .async_polling_translator import AsyncPollingTranslator as AsyncPollingTranslator
+from .async_subscription_translator import (
+    AsyncSubscriptionTranslator as AsyncSubscriptionTranslator,
+)
+from .command_driven_translator import (
+    CommandDrivenTranslator as CommandDrivenTranslator,
+)
+from .composite_translator import CompositeTranslator as CompositeTranslator
 from .polling_translator import PollingTranslator as PollingTranslator
 from .subscription_translator import SubscriptionTranslator as SubscriptionTranslator
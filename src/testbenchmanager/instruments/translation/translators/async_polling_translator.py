@@ -0,0 +1,203 @@
+"""Asynchronous Polling Translator implementation."""
+
+import asyncio
+import math
+from typing import Any, Optional
+
+from pydantic import Field
+
+from testbenchmanager.instruments.physical import physical_instrument_registry
+from testbenchmanager.instruments.translation import (
+    AsyncTranslator,
+    OverrunPolicy,
+    PollingSchedule,
+    PollingTelemetry,
+    TranslatorConfiguration,
+    call_in_session,
+    translator_registry,
+)
+from testbenchmanager.instruments.virtual import (
+    TranslatorUpdateBatch,
+    VirtualInstrument,
+)
+
+from .polling_translator import EntityConfiguration
+
+
+class AsyncPollingTranslatorConfiguration(TranslatorConfiguration):
+    """
+    Configuration Model for an Asynchronous Polling Translator (see AsyncPollingTranslator).
+    """
+
+    physical_instrument_uid: str
+
+    getter_function: str
+    getter_arguments: dict[str, Any] = {}
+
+    polling_interval: float = 1.0  # in seconds
+
+    # As for the PollingTranslator, polls are due on an absolute grid of polling_interval.
+    overrun_policy: OverrunPolicy = OverrunPolicy.SKIP
+    max_catch_up: int = Field(default=10, ge=0)
+
+    # Time after which a poll is abandoned, in seconds. Defaults to the polling interval.
+    poll_timeout: Optional[float] = None
+
+    # The getter returns either a list of values, mapped to the virtual instruments in order, or
+    # a single value, which is only valid with a single entity.
+    entities: list[EntityConfiguration] = []
+
+
+# Origin of the polling grid of each interval, by interval. Translators polling at the same interval
+# start on a shared grid, so their polls fall due together and run concurrently on the acquisition
+# loop. Only used on the acquisition loop.
+_grid_origins: dict[float, float] = {}
+
+
+@translator_registry.register_class()
+class AsyncPollingTranslator(AsyncTranslator):
+    """
+    The asynchronous counterpart of the PollingTranslator, for physical instruments with coroutine
+    getters and setters (e.g. network instruments).
+
+    Each translator polls on its own schedule, from a task on the acquisition loop, so hundreds of
+    instruments can be polled concurrently from a single thread. Translators with the same polling
+    interval share the grid their schedules start on, so their polls fall due together, but each
+    handles its own overruns: a stalled instrument only delays its own polls. Polls go through the
+    physical instrument's session, so they are serialized with every other access to it, and each
+    poll is abandoned after poll_timeout. An abandoned getter running on a worker thread keeps the
+    instrument locked until it returns.
+
+    Getters and setters can also be plain functions, in which case they're run on a worker thread.
+    """
+
+    @classmethod
+    def configuration(cls) -> type[AsyncPollingTranslatorConfiguration]:
+        return AsyncPollingTranslatorConfiguration
+
+    def __init__(self, configuration: AsyncPollingTranslatorConfiguration) -> None:
+        super().__init__(configuration)
+        self.physical_instrument_uids = {configuration.physical_instrument_uid}
+        try:
+            self._physical_instrument = physical_instrument_registry.get(
+                configuration.physical_instrument_uid
+            )
+        except KeyError as e:
+            raise RuntimeError(
+                f"Physical instrument with UID "
+                f"'{configuration.physical_instrument_uid}' not found in registry."
+            ) from e
+
+        self._session = physical_instrument_registry.session(
+            configuration.physical_instrument_uid
+        )
+        self._telemetry = PollingTelemetry(
+            configuration.polling_interval, configuration.overrun_policy
+        )
+        self.telemetry = self._telemetry
+        self._schedule = PollingSchedule(
+            configuration.polling_interval,
+            configuration.overrun_policy,
+            configuration.max_catch_up,
+            telemetry=self._telemetry,
+        )
+        self._poll_timeout = (
+            configuration.poll_timeout
+            if configuration.poll_timeout is not None
+            else configuration.polling_interval
+        )
+        self._getter_name = configuration.getter_function
+        self._getter_arguments = configuration.getter_arguments
+        self._poll_task: Optional[asyncio.Task[None]] = None
+
+        for entity_config in configuration.entities:
+            command_callback = None
+            if entity_config.setter_function is not None:
+                command_callback = self.command_callback(
+                    self._session,
+                    entity_config.setter_function,
+                    entity_config.setter_arguments,
+                )
+            self.virtual_instruments[entity_config.virtual_instrument.uid] = (
+                VirtualInstrument(
+                    metadata=entity_config.virtual_instrument,
+                    command_callback=command_callback,
+                )
+            )
+
+    async def run(self) -> None:
+        """
+        Poll on our schedule until cancelled, then wait for any poll in progress. While polls are
+        failing, the next poll may be delayed further by the supervisor's backoff.
+        """
+        loop = asyncio.get_running_loop()
+        schedule = self._schedule
+        now = loop.time()
+        origin = _grid_origins.setdefault(schedule.interval, now)
+        deadline = schedule.start(
+            origin + math.ceil((now - origin) / schedule.interval) * schedule.interval
+        )
+        try:
+            while True:
+                await asyncio.sleep(deadline - loop.time())
+                # A task of its own, so stopping waits for the poll rather than cancelling it.
+                self._poll_task = loop.create_task(self._timed_poll(deadline))
+                await asyncio.shield(self._poll_task)
+                finished = loop.time()
+                deadline = schedule.advance(
+                    finished, earliest=finished + self.supervisor.retry_delay()
+                )
+        finally:
+            if self._poll_task is not None:
+                await asyncio.wait([self._poll_task])
+
+    async def _timed_poll(self, deadline: float) -> None:
+        """
+        Poll once, and record the poll's timing.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        if await self.poll_once():
+            self._telemetry.record_poll(deadline, started, loop.time())
+
+    async def poll_once(self) -> bool:
+        """
+        Poll the physical instrument once, and update the virtual instruments accordingly.
+
+        Returns:
+            bool: False if the poll was skipped while the supervisor is backing off, True
+            otherwise.
+        """
+        if not self.supervisor.attempt_allowed():
+            return False
+        try:
+            try:
+                values = await call_in_session(
+                    self._session,
+                    self._getter_name,
+                    kwargs=self._getter_arguments,
+                    timeout=self._poll_timeout,
+                )
+            except TimeoutError as e:
+                raise TimeoutError(
+                    f"Poll timed out after {self._poll_timeout:.3f} seconds"
+                ) from e
+            if not isinstance(values, list):
+                values = [values]
+            if len(values) != len(self.virtual_instruments):
+                raise ValueError(
+                    f"Polled {len(values)} values but have "
+                    f"{len(self.virtual_instruments)} virtual instruments configured"
+                )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.supervisor.record_failure(e)
+            return True
+        self.supervisor.record_success()
+
+        # All values from one poll share a timestamp and are published together.
+        with TranslatorUpdateBatch() as batch:
+            for value, virtual_instrument in zip(
+                values, self.virtual_instruments.values()
+            ):
+                batch.add(virtual_instrument, value)
+        return True
@@ -0,0 +1,137 @@
+"""Asynchronous Subscription Translator implementation."""
+
+import asyncio
+from typing import Any, AsyncIterator, Callable
+
+from testbenchmanager.instruments.physical import physical_instrument_registry
+from testbenchmanager.instruments.translation import (
+    AsyncTranslator,
+    ExtractionFailure,
+    TranslatorConfiguration,
+    translator_registry,
+)
+from testbenchmanager.instruments.virtual import (
+    TranslatorUpdateBatch,
+    VirtualInstrument,
+    VirtualInstrumentValue,
+)
+
+from .subscription_translator import EntityConfiguration, MessageExtractor
+
+
+class AsyncSubscriptionTranslatorConfiguration(TranslatorConfiguration):
+    """
+    Configuration Model for an Asynchronous Subscription Translator.
+
+    Attributes:
+        physical_instrument_uid: UID of the physical instrument providing the stream.
+        stream_function: Name of the method on the physical instrument returning an asynchronous
+            iterator of messages, e.g. an async generator.
+        stream_arguments: Additional keyword arguments to pass to the stream function.
+        entities: List of output entities (virtual instruments) and their mappings.
+    """
+
+    physical_instrument_uid: str
+    stream_function: str
+    stream_arguments: dict[str, Any] = {}
+    entities: list[EntityConfiguration] = []
+
+
+@translator_registry.register_class()
+class AsyncSubscriptionTranslator(AsyncTranslator):
+    """
+    The asynchronous counterpart of the SubscriptionTranslator, for physical instruments which
+    stream messages through an asynchronous iterator rather than a callback.
+
+    The stream is consumed on the acquisition loop, and each message is mapped to the virtual
+    instruments with the same extractors as the SubscriptionTranslator. If the stream ends or
+    fails, it is reopened after the supervisor's backoff.
+    """
+
+    @classmethod
+    def configuration(cls) -> type[AsyncSubscriptionTranslatorConfiguration]:
+        return AsyncSubscriptionTranslatorConfiguration
+
+    def __init__(self, configuration: AsyncSubscriptionTranslatorConfiguration) -> None:
+        super().__init__(configuration)
+        self.physical_instrument_uids = {configuration.physical_instrument_uid}
+        try:
+            self._physical_instrument = physical_instrument_registry.get(
+                configuration.physical_instrument_uid
+            )
+        except KeyError as e:
+            raise RuntimeError(
+                f"Physical instrument with UID "
+                f"'{configuration.physical_instrument_uid}' not found in registry."
+            ) from e
+
+        self._session = physical_instrument_registry.session(
+            configuration.physical_instrument_uid
+        )
+        self._stream_function: Callable[..., AsyncIterator[Any]] = getattr(
+            self._physical_instrument, configuration.stream_function
+        )
+        self._stream_arguments = configuration.stream_arguments
+
+        self._extractor = MessageExtractor(
+            self._physical_instrument, configuration.entities
+        )
+        # Output virtual instruments, in the order of the entities.
+        self._outputs: list[VirtualInstrument[VirtualInstrumentValue]] = []
+        for entity_config in configuration.entities:
+            command_callback = None
+            if entity_config.setter_function is not None:
+                command_callback = self.command_callback(
+                    self._session,
+                    entity_config.setter_function,
+                    entity_config.setter_arguments,
+                )
+            virtual_instrument: VirtualInstrument[VirtualInstrumentValue] = (
+                VirtualInstrument(
+                    metadata=entity_config.virtual_instrument,
+                    command_callback=command_callback,
+                )
+            )
+            self.virtual_instruments[entity_config.virtual_instrument.uid] = (
+                virtual_instrument
+            )
+            self._outputs.append(virtual_instrument)
+
+    async def run(self) -> None:
+        """
+        Consume the stream until cancelled, reopening it with backoff whenever it ends or fails.
+        """
+        while True:
+            receiving = False
+            try:
+                async for message in self._stream_function(**self._stream_arguments):
+                    if not receiving:
+                        # The stream is (back) up.
+                        receiving = True
+                        self.supervisor.record_success()
+                    self._on_message(message)
+                raise EOFError("Physical instrument stream ended")
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                await asyncio.sleep(self.supervisor.record_failure(e))
+
+    def _on_message(self, message: Any) -> None:
+        """
+        Extract values from a stream message and update the virtual instruments.
+
+        Args:
+            message: The message from the physical instrument.
+        """
+        # All values extracted from one message share a timestamp and are published together.
+        with TranslatorUpdateBatch() as batch:
+            for virtual_instrument, value in zip(
+                self._outputs, self._extractor.extract(message)
+            ):
+                if isinstance(value, ExtractionFailure):
+                    self._logger.warning(
+                        "Error extracting virtual instrument '%s' value from stream "
+                        "message: %s",
+                        virtual_instrument.metadata.uid,
+                        value.error,
+                    )
+                    continue
+                batch.add(virtual_instrument, value)
@@ -0,0 +1,285 @@
+"""Command Driven Translator implementation."""
+
+import math
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Condition
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel, Field
+
+from testbenchmanager.instruments.physical import physical_instrument_registry
+from testbenchmanager.instruments.translation import (
+    CircuitState,
+    Translator,
+    TranslatorConfiguration,
+    translator_registry,
+)
+from testbenchmanager.instruments.virtual import (
+    VirtualInstrument,
+    VirtualInstrumentMetadata,
+    VirtualInstrumentValue,
+)
+
+
+class CommandEntityConfiguration(BaseModel):
+    """
+    Configuration Model for a single commanded entity in the command driven translator, e.g. a
+    virtual instrument representing a setpoint, like a supply voltage or a valve position.
+
+    Attributes:
+        setter_function: Physical instrument function called with the commanded value.
+        setter_arguments: Keyword arguments for the setter.
+        readback_function: Optional physical instrument function reading the value back after it
+            is set, to verify the command took effect.
+        readback_arguments: Keyword arguments for the read-back function.
+        readback_tolerance: Largest difference between a numeric read-back and the commanded value
+            still taken as a match. Non-numeric values must match exactly.
+        virtual_instrument: Metadata for the virtual instrument this entity maps to.
+    """
+
+    setter_function: str
+    setter_arguments: dict[str, Any] = {}
+    readback_function: Optional[str] = None
+    readback_arguments: dict[str, Any] = {}
+    readback_tolerance: float = Field(default=0.0, ge=0)
+    virtual_instrument: VirtualInstrumentMetadata
+
+
+class CommandDrivenTranslatorConfiguration(TranslatorConfiguration):
+    """
+    Configuration Model for a Command Driven Translator (see CommandDrivenTranslator).
+    """
+
+    physical_instrument_uid: str
+
+    entities: list[CommandEntityConfiguration] = []
+
+
+class _PendingCommand:
+    """
+    A command waiting in the queue, and the futures of every caller it answers.
+    """
+
+    __slots__ = ("value", "futures")
+
+    def __init__(self, value: Any, future: Future[Any]) -> None:
+        self.value: Any = value
+        self.futures: list[Future[Any]] = [future]
+
+
+@translator_registry.register_class()
+class CommandDrivenTranslator(Translator[VirtualInstrumentValue]):
+    """
+    A command driven translator maps commands on its virtual instruments to setters of one physical
+    instrument, e.g. the setpoints of a power supply, through a queue run by its worker thread.
+
+    Commands are coalesced per virtual instrument, latest value wins: a command arriving while an
+    earlier one for the same virtual instrument is still queued replaces its value, so a burst of
+    setpoint changes (e.g. from a slider) turns into as few device writes as the device can keep up
+    with, always ending on the last value. Every caller is answered, superseded commands with the
+    outcome of the command that replaced them.
+
+    After setting a value the translator can read it back to verify the command took effect. The
+    virtual instrument is updated with the read-back value (or the commanded value, without a
+    read-back) once the command has been carried out, and a mismatch fails the command.
+
+    Commands are acknowledged through futures: VirtualInstrument.submit_command returns one which
+    completes when the command has been carried out, or fails with the reason it couldn't be.
+
+    While the supervisor's circuit is open, commands fail straight away instead of being sent.
+
+    Device calls go through the physical instrument's session, where they take priority over
+    background polls of the same instrument waiting for it.
+    """
+
+    @classmethod
+    def configuration(cls) -> type[CommandDrivenTranslatorConfiguration]:
+        return CommandDrivenTranslatorConfiguration
+
+    def __init__(self, configuration: CommandDrivenTranslatorConfiguration) -> None:
+        super().__init__(configuration)
+        self.physical_instrument_uids = {configuration.physical_instrument_uid}
+        try:
+            physical_instrument_registry.get(configuration.physical_instrument_uid)
+        except KeyError as e:
+            raise RuntimeError(
+                f"Physical instrument with UID "
+                f"'{configuration.physical_instrument_uid}' not found in registry."
+            ) from e
+
+        self._session = physical_instrument_registry.session(
+            configuration.physical_instrument_uid
+        )
+        self._entities: dict[str, CommandEntityConfiguration] = {}
+        # Queued commands by virtual instrument UID, oldest first.
+        self._queue: OrderedDict[str, _PendingCommand] = OrderedDict()
+        self._queue_condition: Condition = Condition()
+        self._accepting: bool = True
+
+        for entity_config in configuration.entities:
+            uid = entity_config.virtual_instrument.uid
+            if uid in self._entities:
+                raise ValueError(f"Duplicate virtual instrument UID '{uid}'")
+            self._entities[uid] = entity_config
+            self.virtual_instruments[uid] = VirtualInstrument(
+                metadata=entity_config.virtual_instrument,
+                command_callback=self._build_command_callback(uid),
+            )
+
+    def _build_command_callback(
+        self, uid: str
+    ) -> Callable[[VirtualInstrumentValue], Future[Any]]:
+        """
+        Build the command callback of a virtual instrument, which queues the command.
+
+        Args:
+            uid (str): UID of the virtual instrument.
+
+        Returns:
+            Callable[[VirtualInstrumentValue], Future[Any]]: Command callback.
+        """
+
+        def command(value: VirtualInstrumentValue) -> Future[Any]:
+            return self.submit(uid, value)
+
+        return command
+
+    def submit(self, uid: str, value: Any) -> Future[Any]:
+        """
+        Queue a command, replacing the value of any command for the same virtual instrument which
+        hasn't been started yet.
+
+        Args:
+            uid (str): UID of the virtual instrument commanded.
+            value (Any): Commanded value.
+
+        Returns:
+            Future[Any]: Future completed with the value the virtual instrument was set to once the
+            command (or a later one replacing it) has been carried out.
+        """
+        future: Future[Any] = Future()
+        with self._queue_condition:
+            if not self._accepting:
+                future.set_exception(RuntimeError("Translator stopped"))
+                return future
+            pending = self._queue.get(uid)
+            if pending is None:
+                self._queue[uid] = _PendingCommand(value, future)
+            else:
+                pending.value = value
+                pending.futures.append(future)
+            self._queue_condition.notify()
+        return future
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Number of commands (after coalescing) waiting to be carried out.
+
+        Returns:
+            int: Queue depth.
+        """
+        with self._queue_condition:
+            return len(self._queue)
+
+    def stop(self) -> None:
+        """
+        Stop the translator, failing any commands still queued.
+        """
+        with self._queue_condition:
+            self._accepting = False
+            self._stop_event.set()
+            self._queue_condition.notify_all()
+        super().stop()
+        with self._queue_condition:
+            pending_commands = list(self._queue.values())
+            self._queue.clear()
+        for pending in pending_commands:
+            for future in pending.futures:
+                future.set_exception(RuntimeError("Translator stopped"))
+
+    def translation_loop(self) -> None:
+        """
+        Carry out the oldest queued command.
+        """
+        with self._queue_condition:
+            while not self._queue:
+                if self._stop_event.is_set():
+                    return
+                self._queue_condition.wait()
+            uid, pending = self._queue.popitem(last=False)
+
+        # Commands aren't held back by the backoff after an isolated failure, but fail fast while
+        # the circuit is open, rather than each waiting on an unreachable device.
+        if (
+            self.supervisor.state is not CircuitState.CLOSED
+            and not self.supervisor.attempt_allowed()
+        ):
+            for future in pending.futures:
+                future.set_exception(
+                    RuntimeError(
+                        f"Physical instrument unreachable: {self.supervisor.health().last_error}"
+                    )
+                )
+            return
+
+        try:
+            value = self._execute(uid, pending.value)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Handed to the callers through their futures; the command isn't retried.
+            self.supervisor.record_failure(e)
+            for future in pending.futures:
+                future.set_exception(e)
+            return
+        self.supervisor.record_success()
+        for future in pending.futures:
+            future.set_result(value)
+
+    def _execute(self, uid: str, value: Any) -> Any:
+        """
+        Set a value on the physical instrument, read it back if configured to, and update the
+        virtual instrument.
+
+        Args:
+            uid (str): UID of the virtual instrument commanded.
+            value (Any): Commanded value.
+
+        Raises:
+            ValueError: If the read-back value doesn't match the commanded value.
+
+        Returns:
+            Any: Value the virtual instrument was set to.
+        """
+        entity_config = self._entities[uid]
+        self._session.call(
+            entity_config.setter_function, value, **entity_config.setter_arguments
+        )
+        if entity_config.readback_function is not None:
+            readback = self._session.call(
+                entity_config.readback_function,
+                **entity_config.readback_arguments,
+            )
+            if not self._matches(readback, value, entity_config.readback_tolerance):
+                raise ValueError(
+                    f"Read back {readback!r} from '{entity_config.readback_function}' "
+                    f"after setting {value!r}"
+                )
+            value = readback
+        self.virtual_instruments[uid].update_state(value)
+        return value
+
+    @staticmethod
+    def _matches(readback: Any, value: Any, tolerance: float) -> bool:
+        """
+        Check a read-back value against the commanded value.
+        """
+        numeric = (int, float)
+        if (
+            isinstance(readback, numeric)
+            and isinstance(value, numeric)
+            and not isinstance(readback, bool)
+            and not isinstance(value, bool)
+        ):
+            return math.isclose(readback, value, rel_tol=0.0, abs_tol=tolerance)
+        return bool(readback == value)
@@ -0,0 +1,345 @@
+"""Composite Translator implementation."""
+
+import ast
+import math
+from graphlib import CycleError, TopologicalSorter
+from threading import Lock
+from types import CodeType
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel
+
+from testbenchmanager.instruments.translation import (
+    Translator,
+    TranslatorConfiguration,
+    translator_registry,
+)
+from testbenchmanager.instruments.virtual import (
+    BatchStates,
+    TranslatorUpdateBatch,
+    VirtualInstrument,
+    VirtualInstrumentMetadata,
+    VirtualInstrumentValue,
+    virtual_instrument_registry,
+)
+
+
+def _mean(*values: float) -> float:
+    return math.fsum(values) / len(values)
+
+
+# Functions and constants available to expressions.
+EXPRESSION_FUNCTIONS: dict[str, Any] = {
+    "abs": abs,
+    "min": min,
+    "max": max,
+    "round": round,
+    "pow": pow,
+    "float": float,
+    "int": int,
+    "bool": bool,
+    "mean": _mean,
+    "sqrt": math.sqrt,
+    "exp": math.exp,
+    "log": math.log,
+    "log10": math.log10,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "atan2": math.atan2,
+    "hypot": math.hypot,
+    "pi": math.pi,
+    "e": math.e,
+}
+
+# Syntax allowed in expressions: arithmetic, comparisons, boolean logic, conditionals, and calls
+# to the functions above. No attribute access, subscripts, comprehensions or lambdas.
+_ALLOWED_NODES: tuple[type[ast.AST], ...] = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.BoolOp,
+    ast.Compare,
+    ast.IfExp,
+    ast.Call,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+    ast.Tuple,
+    ast.operator,
+    ast.unaryop,
+    ast.boolop,
+    ast.cmpop,
+)
+
+
+class CompiledExpression:
+    """
+    An expression over named inputs, validated and compiled once.
+    """
+
+    def __init__(self, source: str, available_names: set[str]) -> None:
+        """
+        Args:
+            source (str): Expression source, e.g. "v * i".
+            available_names (set[str]): Input names the expression may reference.
+
+        Raises:
+            ValueError: If the expression is invalid, uses disallowed syntax, or references unknown
+            names.
+        """
+        try:
+            tree = ast.parse(source, mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid expression '{source}': {e}") from e
+
+        inputs: set[str] = set()
+        for node in ast.walk(tree):
+            if not isinstance(node, _ALLOWED_NODES):
+                raise ValueError(
+                    f"Expression '{source}' uses disallowed syntax: {type(node).__name__}"
+                )
+            if isinstance(node, ast.Call) and not (
+                isinstance(node.func, ast.Name) and node.func.id in EXPRESSION_FUNCTIONS
+            ):
+                raise ValueError(
+                    f"Expression '{source}' calls something other than a known function"
+                )
+            if isinstance(node, ast.Name) and node.id not in EXPRESSION_FUNCTIONS:
+                if node.id not in available_names:
+                    raise ValueError(
+                        f"Expression '{source}' references unknown input '{node.id}'"
+                    )
+                inputs.add(node.id)
+
+        self.source: str = source
+        self.inputs: frozenset[str] = frozenset(inputs)
+        self._code: CodeType = compile(tree, f"<expression {source!r}>", "eval")
+
+    def evaluate(self, namespace: dict[str, Any]) -> Any:
+        """
+        Evaluate the expression.
+
+        Args:
+            namespace (dict[str, Any]): Current input values, plus EXPRESSION_FUNCTIONS.
+
+        Returns:
+            Any: Result of the expression.
+        """
+        # pylint: disable=eval-used
+        # The expression was validated against a whitelist of syntax and names when compiled.
+        return eval(self._code, {"__builtins__": {}}, namespace)
+
+
+class CompositeEntityConfiguration(BaseModel):
+    """
+    Configuration Model for a single output entity in the composite translator.
+
+    Attributes:
+        name: Optional name other entities' expressions can refer to this entity's value by.
+        expression: Expression computing the value, over source aliases and entity names, e.g.
+            "v * i" or "mean(tc1, tc2, tc3)".
+        virtual_instrument: Metadata for the virtual instrument this entity maps to.
+    """
+
+    name: Optional[str] = None
+    expression: str
+    virtual_instrument: VirtualInstrumentMetadata
+
+
+class CompositeTranslatorConfiguration(TranslatorConfiguration):
+    """
+    Configuration Model for a Composite Translator (see CompositeTranslator).
+
+    Attributes:
+        sources: Source virtual instruments, as expression alias: virtual instrument UID.
+        entities: List of output entities and the expressions computing them.
+    """
+
+    sources: dict[str, str] = {}
+    entities: list[CompositeEntityConfiguration] = []
+
+
+@translator_registry.register_class()
+class CompositeTranslator(Translator[VirtualInstrumentValue]):
+    """
+    A composite translator computes derived virtual instruments from other virtual instruments,
+    e.g. power from a voltage and a current, or the average of several thermocouples.
+
+    Each output is an expression over source instruments (by alias) and other outputs (by name),
+    compiled once at load time. Outputs are ordered by their dependencies, and when sources update
+    only the outputs which depend on them are re-evaluated, in dependency order.
+
+    Updates are glitch-free: sources updated together in one TranslatorUpdateBatch (e.g. several
+    channels of one poll) are applied together before anything is re-evaluated, so no output is
+    ever computed from a mix of old and new values from the same batch, and all the outputs are
+    themselves published together in one batch.
+
+    Outputs are only computed once all of their inputs have a value. The translator is driven
+    entirely by source updates, it has no worker thread.
+    """
+
+    requires_worker_thread = False
+
+    @classmethod
+    def configuration(cls) -> type[CompositeTranslatorConfiguration]:
+        return CompositeTranslatorConfiguration
+
+    def __init__(self, configuration: CompositeTranslatorConfiguration) -> None:
+        super().__init__(configuration)
+
+        self._sources: dict[str, str] = dict(configuration.sources)
+        self.source_virtual_instrument_uids = set(self._sources.values())
+        self._source_aliases: dict[str, list[str]] = {}
+        for alias, uid in self._sources.items():
+            if alias in EXPRESSION_FUNCTIONS:
+                raise ValueError(f"Composite input name '{alias}' shadows a function")
+            self._source_aliases.setdefault(uid, []).append(alias)
+
+        entity_names: dict[str, int] = {}
+        for index, entity_config in enumerate(configuration.entities):
+            name = entity_config.name
+            if name is None:
+                continue
+            if name in self._sources or name in entity_names:
+                raise ValueError(f"Duplicate composite input name '{name}'")
+            if name in EXPRESSION_FUNCTIONS:
+                raise ValueError(f"Composite input name '{name}' shadows a function")
+            entity_names[name] = index
+
+        available_names = set(self._sources) | set(entity_names)
+        expressions = [
+            CompiledExpression(entity_config.expression, available_names)
+            for entity_config in configuration.entities
+        ]
+
+        # Order the entities so every entity comes after the entities it depends on.
+        sorter: TopologicalSorter[int] = TopologicalSorter()
+        for index, expression in enumerate(expressions):
+            sorter.add(
+                index,
+                *(
+                    entity_names[name]
+                    for name in expression.inputs
+                    if name in entity_names
+                ),
+            )
+        try:
+            order: list[int] = list(sorter.static_order())
+        except CycleError as e:
+            raise ValueError(
+                f"Composite expressions have a circular dependency: {e.args[1]}"
+            ) from e
+
+        self._entities: list[
+            tuple[Optional[str], CompiledExpression, VirtualInstrument[Any]]
+        ] = []
+        for index in order:
+            entity_config = configuration.entities[index]
+            virtual_instrument: VirtualInstrument[Any] = VirtualInstrument(
+                metadata=entity_config.virtual_instrument
+            )
+            self.virtual_instruments[entity_config.virtual_instrument.uid] = (
+                virtual_instrument
+            )
+            self._entities.append(
+                (entity_config.name, expressions[index], virtual_instrument)
+            )
+
+        # For each input name, the positions (in dependency order) of every entity affected by a
+        # change to it, directly or through other entities.
+        self._affected: dict[str, frozenset[int]] = {}
+        for alias in self._sources:
+            self._affected[alias] = self._affected_by(alias)
+
+        # Current input values, plus the expression functions, used directly as the namespace.
+        self._namespace: dict[str, Any] = dict(EXPRESSION_FUNCTIONS)
+        self._evaluation_lock: Lock = Lock()
+        self._unsubscribe_callbacks: list[Callable[[], None]] = []
+
+    def _affected_by(self, name: str) -> frozenset[int]:
+        """
+        Positions of the entities that must be re-evaluated when an input changes.
+        """
+        affected: set[int] = set()
+        changed = {name}
+        for position, (entity_name, expression, _) in enumerate(self._entities):
+            if expression.inputs & changed:
+                affected.add(position)
+                if entity_name is not None:
+                    changed.add(entity_name)
+        return frozenset(affected)
+
+    def start(self) -> None:
+        """
+        Subscribe to the source virtual instruments, and compute the initial outputs from their
+        current states.
+        """
+        super().start()
+        sources: list[VirtualInstrument[Any]] = []
+        for uid in self._source_aliases:
+            try:
+                sources.append(virtual_instrument_registry.get(uid))
+            except KeyError:
+                self._logger.warning(
+                    "Source virtual instrument '%s' not found in registry", uid
+                )
+
+        initial_states: BatchStates = {}
+        for source in sources:
+            self._unsubscribe_callbacks.append(source.subscribe_batch(self._on_batch))
+            try:
+                initial_states[source.metadata.uid] = source.get_latest_state()
+            except RuntimeError:
+                # No state yet, the output will be computed on the first update.
+                pass
+        if initial_states:
+            self._on_batch(initial_states)
+
+    def stop(self) -> None:
+        """
+        Unsubscribe from the source virtual instruments.
+        """
+        for unsubscribe in self._unsubscribe_callbacks:
+            unsubscribe()
+        self._unsubscribe_callbacks = []
+        super().stop()
+
+    def _on_batch(self, states: BatchStates) -> None:
+        """
+        Batch subscriber callback for the source virtual instruments. Applies every source update
+        in the batch, then re-evaluates the affected outputs in dependency order.
+
+        Args:
+            states (BatchStates): Updated source states, keyed by virtual instrument UID.
+        """
+        with self._evaluation_lock:
+            namespace = self._namespace
+            affected: set[int] = set()
+            for uid, state in states.items():
+                for alias in self._source_aliases.get(uid, ()):
+                    namespace[alias] = state.value
+                    affected |= self._affected[alias]
+            if not affected:
+                return
+
+            with TranslatorUpdateBatch() as batch:
+                for position in sorted(affected):
+                    name, expression, virtual_instrument = self._entities[position]
+                    if not expression.inputs <= namespace.keys():
+                        continue
+                    try:
+                        value = expression.evaluate(namespace)
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        # e.g. a division by zero; skip this output (and leave its dependents
+                        # on the previous value) rather than failing the whole batch.
+                        self._logger.warning(
+                            "Error evaluating '%s' for virtual instrument '%s': %s",
+                            expression.source,
+                            virtual_instrument.metadata.uid,
+                            e,
+                        )
+                        continue
+                    if name is not None:
+                        namespace[name] = value
+                    batch.add(virtual_instrument, value)
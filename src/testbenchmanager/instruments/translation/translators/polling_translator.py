@@ -1,17 +1,26 @@
 """Polling Translator implementation."""
 
-from time import monotonic, sleep
+from threading import Event
+from time import monotonic
 from typing import Any, Callable, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from testbenchmanager.instruments.physical import physical_instrument_registry
 from testbenchmanager.instruments.translation import (
+    AdaptiveInterval,
+    AdaptivePollingConfiguration,
+    OverrunPolicy,
+    PollingSchedule,
+    PollingTelemetry,
+    ScheduledPoll,
     Translator,
     TranslatorConfiguration,
+    poll_scheduler,
     translator_registry,
 )
 from testbenchmanager.instruments.virtual import (
+    TranslatorUpdateBatch,
     VirtualInstrument,
     VirtualInstrumentMetadata,
     VirtualInstrumentValue,
@@ -41,6 +50,19 @@ class PollingTranslatorConfiguration(TranslatorConfiguration):
 
     polling_interval: float = 1.0  # in seconds
 
+    # Adapt the interval to signal activity instead: poll fast while values move, and back off
+    # while they are stable. Replaces polling_interval.
+    adaptive: Optional[AdaptivePollingConfiguration] = None
+
+    # Polls are due on an absolute grid of polling_interval. What to do when a poll overruns:
+    # skip the missed ticks, catch up on them (at most max_catch_up), or stretch the interval.
+    overrun_policy: OverrunPolicy = OverrunPolicy.SKIP
+    max_catch_up: int = Field(default=10, ge=0)
+
+    # Poll on the shared poll scheduler's worker pool instead of a dedicated thread. Polls of the
+    # same physical instrument (from any translator) are then never run concurrently.
+    shared_scheduler: bool = False
+
     # We assume that the getter will be appropriately configured to return either:
     # - a single value, which is then applied to all virtual instruments
     # - a list/tuple of values, which are then mapped to the virtual instruments in the order
@@ -68,6 +90,21 @@ class PollingTranslator(Translator[VirtualInstrumentValue]):
     which are then mapped to the output virtual instruments in the order they are defined in the
     configuration.
 
+    All access to the physical instrument goes through its session (see
+    PhysicalInstrumentSession), shared with every other translator using it: polls of one
+    instrument from several translators never overlap, and polls due together are merged,
+    deduplicated or batched according to the instrument's capability hints.
+
+    With adaptive polling configured, the interval follows signal activity: polls are made at the
+    minimum interval while any value moves beyond its deadband (or rate threshold), and back off
+    geometrically towards the maximum interval while they are all stable. Commands, and burst
+    requests (see VirtualInstrument.request_burst), snap the rate back to the minimum interval
+    straight away, and hold it there for the burst duration.
+
+    By default each polling translator polls from its own worker thread. With shared_scheduler set,
+    polls are instead run by the shared poll scheduler, so many polled instruments don't need
+    many threads.
+
     At this time I cannot be bothered to implement more complex mapping logic like the demux BS
     the old implementation had. That was a colossal pain.
 
@@ -79,6 +116,7 @@ class PollingTranslator(Translator[VirtualInstrumentValue]):
 
     def __init__(self, configuration: PollingTranslatorConfiguration) -> None:
         super().__init__(configuration)
+        self.physical_instrument_uids = {configuration.physical_instrument_uid}
         try:
             self._physical_instrument = physical_instrument_registry.get(
                 configuration.physical_instrument_uid
@@ -89,12 +127,35 @@ class PollingTranslator(Translator[VirtualInstrumentValue]):
                 f"'{configuration.physical_instrument_uid}' not found in registry."
             ) from e
 
-        self._polling_interval = configuration.polling_interval
+        self._physical_instrument_uid = configuration.physical_instrument_uid
+        self._shared_scheduler = configuration.shared_scheduler
+        self._scheduled_poll: Optional[ScheduledPoll] = None
+        self._adaptive: Optional[AdaptiveInterval] = None
+        polling_interval = configuration.polling_interval
+        if configuration.adaptive is not None:
+            self._adaptive = AdaptiveInterval(configuration.adaptive)
+            polling_interval = self._adaptive.interval
+        # Set to wake the worker thread early, to stop or for a burst.
+        self._wake_event: Event = Event()
+        self._telemetry = PollingTelemetry(
+            polling_interval, configuration.overrun_policy
+        )
+        self.telemetry = self._telemetry
+        self._schedule = PollingSchedule(
+            polling_interval,
+            configuration.overrun_policy,
+            configuration.max_catch_up,
+            telemetry=self._telemetry,
+        )
+
+        self._session = physical_instrument_registry.session(
+            configuration.physical_instrument_uid
+        )
 
         self._getter_function: Callable[[], list[VirtualInstrumentValue]] = (
             lambda: self._as_list(
-                getattr(self._physical_instrument, configuration.getter_function)(
-                    **configuration.getter_arguments
+                self._session.request(
+                    configuration.getter_function, **configuration.getter_arguments
                 )
             )
         )
@@ -104,20 +165,60 @@ class PollingTranslator(Translator[VirtualInstrumentValue]):
             setter_name = entity_config.setter_function
             if setter_name is not None:
                 setter_args = entity_config.setter_arguments
-                self._setter_function = (
-                    lambda value, _setter=setter_name, _args=setter_args: getattr(
-                        self._physical_instrument, _setter
-                    )(value, **_args)
-                )
+                self._setter_function = self._build_setter(setter_name, setter_args)
 
             virtual_instrument = VirtualInstrument(
                 metadata=entity_config.virtual_instrument,
                 command_callback=self._setter_function,
+                burst_callback=(None if self._adaptive is None else self.request_burst),
             )
             self.virtual_instruments[entity_config.virtual_instrument.uid] = (
                 virtual_instrument
             )
 
+    def _build_setter(
+        self, setter_name: str, setter_arguments: dict[str, Any]
+    ) -> Callable[[VirtualInstrumentValue], None]:
+        """
+        Build the command callback calling a physical instrument setter. With adaptive polling,
+        commands also start a burst, so their effect is seen at the fastest rate.
+
+        Args:
+            setter_name (str): Name of the setter function.
+            setter_arguments (dict[str, Any]): Keyword arguments for the setter.
+
+        Returns:
+            Callable[[VirtualInstrumentValue], None]: Command callback.
+        """
+
+        def setter(value: VirtualInstrumentValue) -> None:
+            self._session.call(setter_name, value, **setter_arguments)
+            if self._adaptive is not None:
+                self.request_burst()
+
+        return setter
+
+    def request_burst(self, duration: Optional[float] = None) -> None:
+        """
+        Poll at the minimum interval for a while, starting straight away. Ignored unless polling
+        is adaptive.
+
+        Args:
+            duration (Optional[float], optional): How long to poll at the minimum interval for, in
+            seconds. Defaults to None, i.e. the configured burst duration.
+        """
+        if self._adaptive is None:
+            return
+        now = monotonic()
+        interval = self._adaptive.burst(now, duration)
+        self._schedule.interval = interval
+        self._telemetry.set_polling_interval(interval)
+        if self._scheduled_poll is not None:
+            poll_scheduler.expedite(self._scheduled_poll, now)
+        elif self._schedule.deadline > now:
+            self._schedule.deadline = now
+            self._wake_event.set()
+
     def _as_list(
         self, value: VirtualInstrumentValue | list[VirtualInstrumentValue]
     ) -> list[VirtualInstrumentValue]:
@@ -136,51 +237,95 @@ class PollingTranslator(Translator[VirtualInstrumentValue]):
             return value
         return [value]
 
+    def start(self) -> None:
+        """
+        Start polling, either on the worker thread or on the shared poll scheduler.
+        """
+        if not self._shared_scheduler:
+            self._schedule.start(monotonic())
+            super().start()
+            return
+        self.register_virtual_instruments()
+        self._scheduled_poll = poll_scheduler.schedule(
+            self.poll_once, self._schedule, key=self._physical_instrument_uid
+        )
+
+    def stop(self) -> None:
+        """
+        Stop polling. Waits for a poll in progress to complete, at most stop_timeout.
+        """
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._scheduled_poll is not None:
+            if not poll_scheduler.cancel(
+                self._scheduled_poll, timeout=self._stop_timeout
+            ):
+                self._detach()
+            self._scheduled_poll = None
+        super().stop()
+
     def translation_loop(self) -> None:
         """
-        Polling implementation of the translation loop.
+        Polling implementation of the translation loop, when polling from the worker thread.
+
+        Waits until the next poll is due on the schedule, then polls the physical instrument once
+        and records the poll's timing. Overruns are handled by the schedule's overrun policy, and
+        counted in the telemetry. While polls are failing, the next poll may be delayed further by
+        the supervisor's backoff.
+        """
+        while True:
+            deadline = self._schedule.deadline
+            delay = deadline - monotonic()
+            if delay <= 0:
+                break
+            # Woken early to stop, or brought forward by a burst.
+            self._wake_event.wait(delay)
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                return
+        started = monotonic()
+        polled = self.poll_once()
+        finished = monotonic()
+        if polled:
+            self._telemetry.record_poll(deadline, started, finished)
+        self._schedule.advance(
+            finished, earliest=finished + self.supervisor.retry_delay()
+        )
 
-        The core logic here is to poll the physical instrument at the configured interval,
-        retrieve the values, and update the virtual instruments accordingly.
+    def poll_once(self) -> bool:
+        """
+        Poll the physical instrument once, retrieve the values, and update the virtual instruments
+        accordingly.
 
         We perform some basic checks to ensure the number of values returned matches the number
-        of virtual instruments configured, and log warnings if there are any issues or we're missing
-        the polling interval.
+        of virtual instruments configured. Failures are recorded with the supervisor, and the poll
+        is skipped altogether while the supervisor is backing off.
+
+        Returns:
+            bool: False if the poll was skipped, True otherwise.
         """
-        next_poll_time = monotonic() + self._polling_interval
+        if not self.supervisor.attempt_allowed():
+            return False
         try:
             values = self._getter_function()
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self._logger.warning(
-                "Error polling physical instrument '%s': %s",
-                self._physical_instrument,
-                e,
-            )
-            return
-
-        if len(values) != len(self.virtual_instruments):
-            self._logger.warning(
-                "Polled %d values but have %d virtual instruments configured. Skipping update.",
-                len(values),
-                len(self.virtual_instruments),
-            )
-            return
-
-        for value, virtual_instrument in zip(values, self.virtual_instruments.values()):
-
-            try:
-                virtual_instrument.update_state(value)
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                self._logger.warning(
-                    "Error updating virtual instrument '%s' state: %s",
-                    virtual_instrument.metadata.uid,
-                    e,
+            if len(values) != len(self.virtual_instruments):
+                raise ValueError(
+                    f"Polled {len(values)} values but have "
+                    f"{len(self.virtual_instruments)} virtual instruments configured"
                 )
-        sleep_duration = next_poll_time - monotonic()
-        if sleep_duration > 0:
-            sleep(sleep_duration)
-        else:
-            # We missed the polling interval, log a warning
-            self._logger.warning(
-                "Polling loop missed its interval by %.3f seconds", -sleep_duration
-            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.supervisor.record_failure(e)
+            return True
+        self.supervisor.record_success()
+        if self._adaptive is not None:
+            interval = self._adaptive.observe(values, monotonic())
+            self._schedule.interval = interval
+            self._telemetry.set_polling_interval(interval)
+
+        # All values from one poll share a timestamp and are published together.
+        with TranslatorUpdateBatch() as batch:
+            for value, virtual_instrument in zip(
+                values, self.virtual_instruments.values()
+            ):
+                batch.add(virtual_instrument, value)
+        return True
@@ -1,20 +1,24 @@
 """Subscription Translator implementation."""
 
-from typing import Any, Callable, Optional
+from functools import partial
+from time import monotonic
+from typing import Any, Callable, Optional, Sequence
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from testbenchmanager.instruments.physical import physical_instrument_registry
 from testbenchmanager.instruments.translation import (
+    ExtractionFailure,
+    FieldSetExtractor,
     Translator,
     TranslatorConfiguration,
     translator_registry,
 )
 from testbenchmanager.instruments.virtual import (
+    TranslatorUpdateBatch,
     VirtualInstrument,
     VirtualInstrumentMetadata,
     VirtualInstrumentValue,
-    virtual_instrument_registry,
 )
 
 
@@ -25,7 +29,9 @@ class EntityConfiguration(BaseModel):
     Attributes:
         extractor_field: Optional attribute/field name to extract from the subscription message.
             For simple field extraction (e.g., state.pressure), specify this instead of
-            extractor_function. Supports dot notation for nested attributes (e.g., "meta.version").
+            extractor_function. Supports dot notation for nested attributes (e.g., "meta.version"),
+            and brackets for list indices and dictionary keys (e.g., "data[3].pressure" or
+            "channels['ch1']").
         extractor_function: Optional name of a method to call on the physical instrument
             to transform the subscription message. If both extractor_field and extractor_function
             are None, the entire message is used as the value.
@@ -56,14 +62,110 @@ class SubscriptionTranslatorConfiguration(TranslatorConfiguration):
         physical_instrument_uid: UID of the physical instrument providing the subscription.
         subscribe_function: Name of the method on the physical instrument to call to register
             a subscription callback.
+        stale_after: Optional time without a message after which the virtual instruments are
+            marked stale, in seconds. Defaults to None, i.e. no staleness detection.
         entities: List of output entities (virtual instruments) and their mappings.
     """
 
     physical_instrument_uid: str
     subscribe_function: str
+    stale_after: Optional[float] = Field(default=None, gt=0)
     entities: list[EntityConfiguration] = []
 
 
+class MessageExtractor:
+    """
+    Extracts every entity's value from a subscription message, with the extraction compiled once
+    up front rather than resolved per message:
+
+    - extractor_field paths are compiled to operator.attrgetter/itemgetter steps (see
+      field_extraction), and all of them are walked together in a single pass over the message,
+      so shared prefixes are only resolved once.
+    - extractor_function methods are looked up on the physical instrument once, and the bound
+      method is kept.
+    - Entities with neither get the message itself.
+    """
+
+    def __init__(
+        self, physical_instrument: object, entity_configs: Sequence[EntityConfiguration]
+    ) -> None:
+        """
+        Args:
+            physical_instrument (object): Physical instrument providing the messages.
+            entity_configs (Sequence[EntityConfiguration]): Configuration of the entities.
+
+        Raises:
+            ValueError: If an extractor_field path is malformed.
+            AttributeError: If an extractor_function doesn't exist on the physical instrument.
+        """
+        self._count: int = len(entity_configs)
+        self._field_outputs: list[int] = []
+        field_paths: list[str] = []
+        self._function_outputs: list[tuple[int, Callable[[Any], Any]]] = []
+        for output, entity_config in enumerate(entity_configs):
+            if entity_config.extractor_field is not None:
+                self._field_outputs.append(output)
+                field_paths.append(entity_config.extractor_field)
+            elif entity_config.extractor_function is not None:
+                method = getattr(physical_instrument, entity_config.extractor_function)
+                if entity_config.extractor_arguments:
+                    method = partial(method, **entity_config.extractor_arguments)
+                self._function_outputs.append((output, method))
+            else:
+                self._function_outputs.append((output, _identity))
+
+        self._fields: FieldSetExtractor = FieldSetExtractor(field_paths)
+
+    def extract(self, message: Any) -> list[Any]:
+        """
+        Extract every entity's value from a message.
+
+        Args:
+            message (Any): Subscription message.
+
+        Returns:
+            list[Any]: Values, in the order of the entities. Values which couldn't be extracted
+            are ExtractionFailure instances.
+        """
+        results: list[Any] = [None] * self._count
+        if self._field_outputs:
+            for output, value in zip(
+                self._field_outputs, self._fields.extract(message)
+            ):
+                results[output] = value
+        for output, function in self._function_outputs:
+            try:
+                results[output] = function(message)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                results[output] = ExtractionFailure(e)
+        return results
+
+
+def _identity(message: Any) -> Any:
+    return message
+
+
+def build_setter(
+    physical_instrument: object, entity_config: EntityConfiguration
+) -> Optional[Callable[[Any], Any]]:
+    """
+    Build the function called when an entity's virtual instrument is commanded.
+
+    Args:
+        physical_instrument (object): Physical instrument providing the subscription.
+        entity_config (EntityConfiguration): Configuration of the entity.
+
+    Returns:
+        Optional[Callable[[Any], Any]]: Setter function, or None if the entity has no setter.
+    """
+    if entity_config.setter_function is None:
+        return None
+    setter = getattr(physical_instrument, entity_config.setter_function)
+    if entity_config.setter_arguments:
+        return partial(setter, **entity_config.setter_arguments)
+    return setter
+
+
 @translator_registry.register_class()
 class SubscriptionTranslator(Translator[VirtualInstrumentValue]):
     """
@@ -83,14 +185,22 @@ class SubscriptionTranslator(Translator[VirtualInstrumentValue]):
     - InficonBGP400 vacuum gauge that pushes pressure/status updates
     - DAQ devices that stream sensor data
     - IoT sensors with live telemetry
+
+    Updates are driven entirely by the subscription callback, so the translator has no worker
+    thread, unless stale_after is set: then a watchdog thread marks the virtual instruments stale
+    whenever no message arrives for that long. It sleeps until the next message is due, so it
+    only wakes about once per stale_after.
     """
 
+    requires_worker_thread = False
+
     @classmethod
     def configuration(cls) -> type[SubscriptionTranslatorConfiguration]:
         return SubscriptionTranslatorConfiguration
 
     def __init__(self, configuration: SubscriptionTranslatorConfiguration) -> None:
         super().__init__(configuration)
+        self.physical_instrument_uids = {configuration.physical_instrument_uid}
 
         try:
             self._physical_instrument = physical_instrument_registry.get(
@@ -104,47 +214,20 @@ class SubscriptionTranslator(Translator[VirtualInstrumentValue]):
 
         # Build extractors and setters for each entity
         self._entity_configs = configuration.entities
-        self._extractors: dict[str, Callable[[Any], VirtualInstrumentValue]] = {}
+        self._extractor = MessageExtractor(
+            self._physical_instrument, self._entity_configs
+        )
         self._setters: dict[str, Optional[Callable[[VirtualInstrumentValue], None]]] = (
             {}
         )
+        # Output virtual instruments, in the order of the entities.
+        self._outputs: list[VirtualInstrument[VirtualInstrumentValue]] = []
 
         for entity_config in self._entity_configs:
             virtual_instrument_uid = entity_config.virtual_instrument.uid
-
-            # Build extractor function
-            if entity_config.extractor_field is not None:
-                # Direct field extraction using dot notation
-                field_path = entity_config.extractor_field
-                self._extractors[virtual_instrument_uid] = (
-                    lambda value, _field=field_path: self._extract_field(value, _field)
-                )
-            elif entity_config.extractor_function is not None:
-                # Custom extractor function on physical instrument
-                extractor_name = entity_config.extractor_function
-                extractor_args = entity_config.extractor_arguments
-                self._extractors[virtual_instrument_uid] = (
-                    lambda value, _extractor=extractor_name, _args=extractor_args: getattr(
-                        self._physical_instrument, _extractor
-                    )(
-                        value, **_args
-                    )
-                )
-            else:
-                # No extractor, use the entire message
-                self._extractors[virtual_instrument_uid] = lambda value: value
-
-            # Build setter function
-            if entity_config.setter_function is not None:
-                setter_name = entity_config.setter_function
-                setter_args = entity_config.setter_arguments
-                self._setters[virtual_instrument_uid] = (
-                    lambda value, _setter=setter_name, _args=setter_args: getattr(
-                        self._physical_instrument, _setter
-                    )(value, **_args)
-                )
-            else:
-                self._setters[virtual_instrument_uid] = None
+            self._setters[virtual_instrument_uid] = build_setter(
+                self._physical_instrument, entity_config
+            )
 
             # Create and register virtual instrument
             virtual_instrument = VirtualInstrument(
@@ -152,43 +235,16 @@ class SubscriptionTranslator(Translator[VirtualInstrumentValue]):
                 command_callback=self._setters[virtual_instrument_uid],
             )
             self.virtual_instruments[virtual_instrument_uid] = virtual_instrument
-            try:
-                virtual_instrument_registry.register(
-                    virtual_instrument_uid, virtual_instrument
-                )
-            except KeyError as e:
-                self._logger.warning(
-                    "Failed to register virtual instrument with UID '%s': %s",
-                    virtual_instrument_uid,
-                    e,
-                )
+            self._outputs.append(virtual_instrument)
+
+        self._stale_after = configuration.stale_after
+        self._last_message_time: float = monotonic()
 
         # Register the subscription callback with the physical instrument
         subscribe_function_name = configuration.subscribe_function
         subscribe_function = getattr(self._physical_instrument, subscribe_function_name)
         self._unsubscribe = subscribe_function(self._on_subscription_update)
 
-    def _extract_field(self, obj: Any, field_path: str) -> VirtualInstrumentValue:
-        """
-        Extract a field from an object using dot notation.
-
-        Supports nested attribute access, e.g., "state.nested.field".
-
-        Args:
-            obj: The object to extract from.
-            field_path: Dot-separated field path (e.g., "pressure" or "meta.version").
-
-        Returns:
-            VirtualInstrumentValue: The extracted field value.
-
-        Raises:
-            AttributeError: If the field path cannot be resolved.
-        """
-        current = obj
-        for field in field_path.split("."):
-            current = getattr(current, field)
-        return current
-
     def _on_subscription_update(self, message: Any) -> None:
         """
         Callback invoked when the physical instrument pushes an update.
@@ -199,32 +255,43 @@ class SubscriptionTranslator(Translator[VirtualInstrumentValue]):
         Args:
             message: The message/state object from the physical instrument.
         """
-        for (
-            virtual_instrument_uid,
-            virtual_instrument,
-        ) in self.virtual_instruments.items():
-            try:
-                extractor = self._extractors[virtual_instrument_uid]
-                value = extractor(message)
-                virtual_instrument.update_state(value)
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                self._logger.warning(
-                    "Error updating virtual instrument '%s' from subscription message: %s",
-                    virtual_instrument_uid,
-                    e,
-                )
+        self._last_message_time = monotonic()
+        # All values extracted from one message share a timestamp and are published together.
+        with TranslatorUpdateBatch() as batch:
+            for virtual_instrument, value in zip(
+                self._outputs, self._extractor.extract(message)
+            ):
+                if isinstance(value, ExtractionFailure):
+                    self._logger.warning(
+                        "Error extracting virtual instrument '%s' value from subscription "
+                        "message: %s",
+                        virtual_instrument.metadata.uid,
+                        value.error,
+                    )
+                    continue
+                batch.add(virtual_instrument, value)
 
-    def translation_loop(self) -> None:
+    def start(self) -> None:
         """
-        For subscription-based translators, the worker thread simply waits without
-        doing anything, since all updates are driven by the subscription callback.
-
-        We could potentially add housekeeping logic here in the future (e.g., heartbeat
-        checks, timeout detection), but for now the translator is purely callback-driven.
+        Start the staleness watchdog, if configured.
         """
-        # The subscription mechanism is event-driven; nothing to do in this loop.
-        # The _on_subscription_update callback handles all the work.
-        # We just sleep to prevent spinning and let the event loop handle updates.
-        import time
+        super().start()
+        if self._stale_after is not None:
+            self._last_message_time = monotonic()
+            self._thread.start()
 
-        time.sleep(0.1)
+    def translation_loop(self) -> None:
+        """
+        Staleness watchdog, only run if stale_after is set. Sleeps on the stop event until a
+        message is next due, and marks the virtual instruments stale if none has arrived by then.
+        """
+        if self._stale_after is None:
+            return
+        remaining = self._last_message_time + self._stale_after - monotonic()
+        if remaining > 0:
+            self._stop_event.wait(remaining)
+            return
+        for virtual_instrument in self.virtual_instruments.values():
+            virtual_instrument.mark_stale()
+        # Check again in another stale_after; a message in the meantime clears the staleness.
+        self._stop_event.wait(self._stale_after)
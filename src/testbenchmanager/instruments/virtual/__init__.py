@@ -1,5 +1,19 @@
 """Virtual instrument submodule."""
 
+from .history_buffer import HistoryMemoryUsage as HistoryMemoryUsage
+from .history_reader import HistoryBatch as HistoryBatch
+from .history_reader import HistoryReader as HistoryReader
+from .history_tiers import HistoryBucket as HistoryBucket
+from .history_tiers import HistoryRange as HistoryRange
+from .history_tiers import HistoryTierConfiguration as HistoryTierConfiguration
+from .running_statistics import (
+    RunningStatisticsConfiguration as RunningStatisticsConfiguration,
+)
+from .running_statistics import RunningStatisticsSnapshot as RunningStatisticsSnapshot
+from .subscriber_dispatch import MailboxStatistics as MailboxStatistics
+from .subscriber_dispatch import OverflowPolicy as OverflowPolicy
+from .update_batch import BatchStates as BatchStates
+from .update_batch import TranslatorUpdateBatch as TranslatorUpdateBatch
 from .virtual_instrument import VirtualInstrument as VirtualInstrument
 from .virtual_instrument import VirtualInstrumentMetadata as VirtualInstrumentMetadata
 from .virtual_instrument_registry import (
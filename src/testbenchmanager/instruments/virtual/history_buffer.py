@@ -0,0 +1,342 @@
+"""Columnar ring buffer backing Virtual Instrument history."""
+
+import sys
+from array import array
+from dataclasses import dataclass
+from typing import Any, Generic, Optional
+
+from .virtual_instrument_state import VirtualInstrumentState, VirtualInstrumentValue
+
+# array typecodes for value types that can be stored unboxed. Anything else (i.e. str) falls back
+# to a plain object list.
+_VALUE_TYPECODES: dict[type, str] = {bool: "b", int: "q", float: "d"}
+
+
+@dataclass
+class HistoryMemoryUsage:
+    """Size and memory usage of a virtual instrument's history."""
+
+    length: int  # Number of retained states
+    capacity: int  # Number of states currently allocated for
+    max_length: int  # Number of states the history may grow to
+    retention: Optional[float]  # Retention duration in seconds, if any
+    history_bytes: int  # Raw history
+    tier_bytes: int  # Downsampled history tiers
+
+
+class HistoryBuffer(Generic[VirtualInstrumentValue]):
+    """
+    Preallocated ring buffer of virtual instrument states, stored column-wise.
+
+    Sequence numbers and epoch-nanosecond timestamps are kept in parallel typed arrays, and values
+    are kept in a typed array chosen from the type of the first value appended (or an object list
+    for e.g. strings). VirtualInstrumentState objects are only materialized when they are read.
+
+    If a value arrives that does not fit the current value column (e.g. a float into an int column,
+    or an int too large for 64 bits) the column is converted to an object list, so no value is ever
+    coerced into a different type.
+
+    With a retention duration, the buffer starts small and grows on demand (up to max_capacity)
+    whenever it is full but its oldest state is still within the retention duration, so its size
+    follows the actual update rate. Without one, the buffer is allocated at max_capacity up front.
+
+    This class is not thread safe, the owner is expected to hold its own lock.
+    """
+
+    # Estimated size of one state (sequence, timestamp and an unboxed value), for budgeting.
+    STATE_SIZE_ESTIMATE: int = 24
+    # Initial capacity of buffers with a retention duration.
+    INITIAL_GROWABLE_CAPACITY: int = 64
+
+    def __init__(self, max_capacity: int, retention_ns: Optional[int] = None) -> None:
+        if max_capacity < 1:
+            raise ValueError(
+                f"History capacity must be at least 1, got {max_capacity}."
+            )
+        self._max_capacity: int = max_capacity
+        self._retention_ns: Optional[int] = retention_ns
+        capacity = (
+            max_capacity
+            if retention_ns is None
+            else min(self.INITIAL_GROWABLE_CAPACITY, max_capacity)
+        )
+        self._capacity: int = capacity
+        self._sequences: array[int] = array("q", bytes(8 * capacity))
+        self._timestamps: array[int] = array("q", bytes(8 * capacity))
+        self._values: array[Any] | list[Any] = []  # allocated on the first append
+        # object once the column is an object list
+        self._value_type: Optional[type] = None
+        self._head: int = 0  # physical index of the next write
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """
+        Maximum number of states the buffer retains.
+
+        Returns:
+            int: capacity of the buffer.
+        """
+        return self._capacity
+
+    @property
+    def max_capacity(self) -> int:
+        """
+        Maximum number of states the buffer may grow to.
+
+        Returns:
+            int: maximum capacity of the buffer.
+        """
+        return self._max_capacity
+
+    @property
+    def memory_usage(self) -> int:
+        """
+        Number of bytes used by the buffer. Object values (e.g. strings) are counted at their full
+        size, even if they are shared with other objects.
+
+        Returns:
+            int: Size of the buffer in bytes.
+        """
+        usage = self._sequences.itemsize * len(
+            self._sequences
+        ) + self._timestamps.itemsize * len(self._timestamps)
+        values = self._values
+        if isinstance(values, array):
+            return usage + values.itemsize * len(values)
+        usage += sys.getsizeof(values)
+        for index in range(self._size):
+            usage += sys.getsizeof(values[self._physical_index(index)])
+        return usage
+
+    def set_max_capacity(self, max_capacity: int) -> None:
+        """
+        Change the maximum capacity of the buffer. If the buffer currently holds more states than
+        the new maximum, the oldest states are dropped. Buffers without a retention duration are
+        resized to the new maximum straight away.
+
+        Args:
+            max_capacity (int): New maximum capacity.
+        """
+        if max_capacity < 1:
+            raise ValueError(
+                f"History capacity must be at least 1, got {max_capacity}."
+            )
+        self._max_capacity = max_capacity
+        if self._retention_ns is None or self._capacity > max_capacity:
+            self._resize(max_capacity)
+
+    def append(
+        self, sequence: int, timestamp_ns: int, value: VirtualInstrumentValue
+    ) -> None:
+        """
+        Append a state to the buffer, overwriting the oldest state if the buffer is full.
+
+        Args:
+            sequence (int): Sequence number of the state.
+            timestamp_ns (int): Epoch timestamp of the state, in nanoseconds.
+            value (VirtualInstrumentValue): Value of the state.
+        """
+        if (
+            self._size == self._capacity
+            and self._retention_ns is not None
+            and self._capacity < self._max_capacity
+            and timestamp_ns - self._timestamps[self._head] < self._retention_ns
+        ):
+            # Full, but the oldest state (at the write head) is still within retention.
+            self._resize(min(self._capacity * 2, self._max_capacity))
+        value_type = self._value_type
+        if value_type is not object and value_type is not type(value):
+            self._adapt_value_column(value)
+        index = self._head
+        try:
+            self._values[index] = value
+        except OverflowError:
+            # e.g. an int that doesn't fit in 64 bits.
+            self._convert_to_object_column()
+            self._values[index] = value
+        self._sequences[index] = sequence
+        self._timestamps[index] = timestamp_ns
+        self._head = 0 if index + 1 == self._capacity else index + 1
+        if self._size < self._capacity:
+            self._size += 1
+
+    @property
+    def first_sequence(self) -> Optional[int]:
+        """
+        Sequence number of the oldest retained state.
+
+        Returns:
+            Optional[int]: Oldest retained sequence number, or None if the buffer is empty.
+        """
+        if self._size == 0:
+            return None
+        return self._sequences[self._physical_index(0)]
+
+    @property
+    def oldest_timestamp_ns(self) -> Optional[int]:
+        """
+        Timestamp of the oldest retained state.
+
+        Returns:
+            Optional[int]: Epoch timestamp in nanoseconds, or None if the buffer is empty.
+        """
+        if self._size == 0:
+            return None
+        return self._timestamps[self._physical_index(0)]
+
+    def index_of_sequence(self, sequence: int) -> int:
+        """
+        Get the logical index of a sequence number in O(1), relying on the fact that sequence
+        numbers are appended contiguously. Sequences older than the oldest retained state map to 0,
+        and sequences newer than the most recent state map to len(self).
+
+        Args:
+            sequence (int): Sequence number to locate.
+
+        Returns:
+            int: Logical index of the state with the given sequence number, clamped to the buffer.
+        """
+        first_sequence = self.first_sequence
+        if first_sequence is None:
+            return 0
+        return min(max(sequence - first_sequence, 0), self._size)
+
+    def index_of_timestamp(self, timestamp_ns: int) -> int:
+        """
+        Binary search for the logical index of the first state recorded at or after a timestamp.
+
+        Args:
+            timestamp_ns (int): Epoch timestamp in nanoseconds.
+
+        Returns:
+            int: Logical index of the first state at or after the timestamp, or len(self) if there
+            is none.
+        """
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            if self._timestamps[self._physical_index(middle)] < timestamp_ns:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def latest(self) -> Optional[VirtualInstrumentState[VirtualInstrumentValue]]:
+        """
+        Get the most recently appended state.
+
+        Returns:
+            Optional[VirtualInstrumentState[VirtualInstrumentValue]]: Most recent state, or None if
+            the buffer is empty.
+        """
+        if self._size == 0:
+            return None
+        return self._materialize(self._size - 1)
+
+    def states(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> list[VirtualInstrumentState[VirtualInstrumentValue]]:
+        """
+        Materialize a range of states, indexed logically from the oldest retained state.
+
+        Args:
+            start (int, optional): Logical index of the first state. Defaults to 0.
+            stop (Optional[int], optional): Logical index one past the last state. Defaults to
+            None, i.e. up to and including the most recent state.
+
+        Returns:
+            list[VirtualInstrumentState[VirtualInstrumentValue]]: States, oldest first.
+        """
+        start, stop, _ = slice(start, stop).indices(self._size)
+        return [self._materialize(index) for index in range(start, stop)]
+
+    def clear(self) -> None:
+        """
+        Drop all retained states. The value column type is reset as well.
+        """
+        self._values = []
+        self._value_type = None
+        self._head = 0
+        self._size = 0
+
+    def _resize(self, capacity: int) -> None:
+        """
+        Reallocate the columns with a new capacity, keeping the most recent states.
+        """
+        if capacity == self._capacity:
+            return
+        keep = min(self._size, capacity)
+        first = self._physical_index(self._size - keep)
+        padding = capacity - keep
+
+        def rebuild(column: Any) -> Any:
+            if first + keep <= self._capacity:
+                retained = column[first : first + keep]
+            else:
+                retained = column[first:] + column[: first + keep - self._capacity]
+            if isinstance(column, array):
+                return retained + array(
+                    column.typecode, bytes(column.itemsize * padding)
+                )
+            return retained + [None] * padding
+
+        self._sequences = rebuild(self._sequences)
+        self._timestamps = rebuild(self._timestamps)
+        if self._value_type is not None:
+            self._values = rebuild(self._values)
+        self._capacity = capacity
+        self._size = keep
+        self._head = keep % capacity
+
+    def _physical_index(self, index: int) -> int:
+        """
+        Convert a logical index (0 is the oldest retained state) to a physical array index.
+        """
+        return (self._head - self._size + index) % self._capacity
+
+    def _materialize(
+        self, index: int
+    ) -> VirtualInstrumentState[VirtualInstrumentValue]:
+        """
+        Build a VirtualInstrumentState from the columns at a logical index.
+        """
+        physical_index = self._physical_index(index)
+        value = self._values[physical_index]
+        if self._value_type is bool:
+            value = bool(value)
+        return VirtualInstrumentState(
+            value=value,
+            sequence=self._sequences[physical_index],
+            timestamp_ns=self._timestamps[physical_index],
+        )
+
+    def _adapt_value_column(self, value: VirtualInstrumentValue) -> None:
+        """
+        Allocate the value column for the first value, or fall back to an object column if the
+        type of the values changes.
+        """
+        if self._value_type is None:
+            typecode = _VALUE_TYPECODES.get(type(value))
+            if typecode is None:
+                self._values = [None] * self._capacity
+                self._value_type = object
+            else:
+                column = array(typecode)
+                self._values = array(typecode, bytes(column.itemsize * self._capacity))
+                self._value_type = type(value)
+            return
+        self._convert_to_object_column()
+
+    def _convert_to_object_column(self) -> None:
+        """
+        Convert a typed value column to an object list, preserving the retained values.
+        """
+        value_type = self._value_type
+        if value_type is None or value_type is object:
+            return
+        self._values = [value_type(value) for value in self._values]
+        self._value_type = object
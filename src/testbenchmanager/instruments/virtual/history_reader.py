@@ -0,0 +1,142 @@
+"""Cursor-based readers over Virtual Instrument history."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic, Optional
+
+from .virtual_instrument_state import VirtualInstrumentState, VirtualInstrumentValue
+
+if TYPE_CHECKING:
+    # Only needed for annotations, virtual_instrument imports this module.
+    from .virtual_instrument import VirtualInstrument
+
+
+@dataclass
+class HistoryBatch(Generic[VirtualInstrumentValue]):
+    """A batch of consecutive states read by a HistoryReader."""
+
+    states: list[VirtualInstrumentState[VirtualInstrumentValue]]
+    # Number of states which were dropped from the history before the reader got to them, i.e.
+    # the gap between the previous batch and this one.
+    missed: int
+
+
+class HistoryReader(Generic[VirtualInstrumentValue]):
+    """
+    Cursor over the history of a virtual instrument, for consumers which want to process every
+    state in order.
+
+    Readers pull states straight out of the shared history, so state updates cost the same no
+    matter how many readers there are, and nothing is copied until a reader asks for it. The
+    instrument holds no reference to its readers, so an abandoned reader is simply garbage
+    collected.
+
+    If a reader falls so far behind that states have been dropped from the history before it read
+    them, the next batch reports how many were missed and carries on from the oldest retained
+    state.
+
+    Usage:
+        reader = instrument.reader()
+        while running:
+            batch = reader.read_batch(100, timeout=1.0)
+            ...
+    """
+
+    def __init__(
+        self,
+        instrument: "VirtualInstrument[VirtualInstrumentValue]",
+        start_sequence: int,
+    ) -> None:
+        self._instrument = instrument
+        self._next_sequence: int = start_sequence
+        self._missed: int = 0
+
+    @property
+    def position(self) -> int:
+        """
+        Sequence number of the next state the reader will read.
+
+        Returns:
+            int: Next sequence number.
+        """
+        return self._next_sequence
+
+    @property
+    def missed(self) -> int:
+        """
+        Total number of states the reader has missed by falling behind.
+
+        Returns:
+            int: Number of missed states.
+        """
+        return self._missed
+
+    @property
+    def lag(self) -> int:
+        """
+        Number of states recorded by the instrument which the reader has not read yet.
+
+        Returns:
+            int: Number of unread states.
+        """
+        return max(self._instrument.next_sequence - self._next_sequence, 0)
+
+    def read_batch(
+        self, max_n: int = 100, timeout: Optional[float] = None
+    ) -> HistoryBatch[VirtualInstrumentValue]:
+        """
+        Read the next states, waiting for at least one if there are none yet.
+
+        Args:
+            max_n (int, optional): Maximum number of states to read. Defaults to 100.
+            timeout (Optional[float], optional): Maximum time to wait for a state if there are
+            none yet. Defaults to None, i.e. wait indefinitely. 0 never waits.
+
+        Returns:
+            HistoryBatch[VirtualInstrumentValue]: States read, oldest first. Empty if the timeout
+            was reached.
+        """
+        batch = self._read(max_n)
+        if batch.states or timeout == 0:
+            return batch
+        try:
+            self._instrument.wait_for_sequence(self._next_sequence, timeout)
+        except TimeoutError:
+            return batch
+        return self._read(max_n)
+
+    async def read_batch_async(
+        self, max_n: int = 100, timeout: Optional[float] = None
+    ) -> HistoryBatch[VirtualInstrumentValue]:
+        """
+        Asyncio equivalent of read_batch.
+
+        Args:
+            max_n (int, optional): Maximum number of states to read. Defaults to 100.
+            timeout (Optional[float], optional): Maximum time to wait for a state if there are
+            none yet. Defaults to None, i.e. wait indefinitely. 0 never waits.
+
+        Returns:
+            HistoryBatch[VirtualInstrumentValue]: States read, oldest first. Empty if the timeout
+            was reached.
+        """
+        batch = self._read(max_n)
+        if batch.states or timeout == 0:
+            return batch
+        try:
+            await self._instrument.wait_for_sequence_async(self._next_sequence, timeout)
+        except TimeoutError:
+            return batch
+        return self._read(max_n)
+
+    def _read(self, max_n: int) -> HistoryBatch[VirtualInstrumentValue]:
+        """
+        Read up to max_n states from the cursor without waiting, and advance the cursor.
+        """
+        # pylint: disable=protected-access
+        first_sequence, states = self._instrument._read_history(
+            self._next_sequence, max_n
+        )
+        missed = max(first_sequence - self._next_sequence, 0)
+        self._missed += missed
+        self._next_sequence = first_sequence + len(states)
+        return HistoryBatch(states=states, missed=missed)
@@ -0,0 +1,263 @@
+"""Downsampled history tiers for Virtual Instruments."""
+
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from testbenchmanager.common.clock import timestamp_from_ns
+
+from .virtual_instrument_state import (
+    VirtualInstrumentState,
+    VirtualInstrumentValueTypes,
+)
+
+
+class HistoryTierConfiguration(BaseModel):
+    """
+    Configuration Model for a single downsampled history tier.
+    """
+
+    resolution: float = Field(gt=0)  # Width of each bucket, in seconds.
+    length: int = Field(ge=1)  # Number of buckets retained.
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryBucket:
+    """Aggregate of all numeric samples recorded within one bucket of a history tier."""
+
+    start_ns: int  # Start of the bucket, epoch nanoseconds
+    minimum: float
+    maximum: float
+    mean: float
+    count: int
+    last: float  # Most recent value in the bucket
+
+    @property
+    def start(self) -> datetime:
+        """
+        Start of the bucket, as a (naive, local) datetime.
+
+        Returns:
+            datetime: Start of the bucket.
+        """
+        return timestamp_from_ns(self.start_ns)
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryRange:
+    """
+    Result of a history range query. Exactly one of states (raw history) or buckets (a downsampled
+    tier) is populated, depending on the resolution which was picked.
+    """
+
+    resolution: Optional[float]  # Bucket width in seconds, or None for raw states.
+    states: list[VirtualInstrumentState[VirtualInstrumentValueTypes]]
+    buckets: list[HistoryBucket]
+
+
+# pylint: disable=too-many-instance-attributes
+# One attribute per column, plus the ring bookkeeping.
+class HistoryTier:
+    """
+    Ring of fixed-width time buckets holding min/max/sum/count/last of the samples in each bucket,
+    stored column-wise. Samples are folded in as they arrive, in O(1).
+
+    Buckets are only allocated for time ranges which actually contain samples, so the tier covers
+    at least length * resolution seconds (more if the instrument was quiet for a while).
+
+    This class is not thread safe, the owner is expected to hold its own lock.
+    """
+
+    def __init__(self, configuration: HistoryTierConfiguration) -> None:
+        self.resolution: float = configuration.resolution
+        self._width_ns: int = round(configuration.resolution * 1_000_000_000)
+        self._capacity: int = configuration.length
+        # Columns are allocated on the first sample, so tiers cost nothing on instruments which
+        # never record a numeric value.
+        self._starts: array[int] = array("q")
+        self._minimums: array[float] = array("d")
+        self._maximums: array[float] = array("d")
+        self._sums: array[float] = array("d")
+        self._counts: array[int] = array("q")
+        self._lasts: array[float] = array("d")
+        self._head: int = -1  # physical index of the current (most recent) bucket
+        self._size: int = 0
+        self._current_bucket: Optional[int] = None
+        self._wrapped: bool = False
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def wrapped(self) -> bool:
+        """
+        Whether the tier has discarded any buckets. If not, it holds every sample ever added.
+
+        Returns:
+            bool: True if the oldest bucket has been overwritten at least once.
+        """
+        return self._wrapped
+
+    @property
+    def oldest_ns(self) -> Optional[int]:
+        """
+        Start of the oldest retained bucket.
+
+        Returns:
+            Optional[int]: Epoch timestamp in nanoseconds, or None if the tier is empty.
+        """
+        if self._size == 0:
+            return None
+        return self._starts[self._physical_index(0)]
+
+    @property
+    def memory_usage(self) -> int:
+        """
+        Number of bytes used by the bucket columns.
+
+        Returns:
+            int: Size of the columns in bytes.
+        """
+        return sum(
+            column.itemsize * len(column)
+            for column in (
+                self._starts,
+                self._minimums,
+                self._maximums,
+                self._sums,
+                self._counts,
+                self._lasts,
+            )
+        )
+
+    @property
+    def max_memory_usage(self) -> int:
+        """
+        Number of bytes the bucket columns use once allocated.
+
+        Returns:
+            int: Size of the allocated columns in bytes.
+        """
+        return 6 * 8 * self._capacity
+
+    def add(self, timestamp_ns: int, value: float) -> None:
+        """
+        Fold a sample into the tier.
+
+        Args:
+            timestamp_ns (int): Epoch timestamp of the sample, in nanoseconds.
+            value (float): Value of the sample.
+        """
+        bucket = timestamp_ns // self._width_ns
+        current = self._current_bucket
+        # Samples from before the current bucket (the clock went backwards) are folded into it.
+        if current is not None and bucket <= current:
+            index = self._head
+            if value < self._minimums[index]:
+                self._minimums[index] = value
+            if value > self._maximums[index]:
+                self._maximums[index] = value
+            self._sums[index] += value
+            self._counts[index] += 1
+            self._lasts[index] = value
+            return
+
+        if not self._starts:
+            self._allocate()
+        index = self._head + 1
+        if index == self._capacity:
+            index = 0
+            self._wrapped = True
+        self._head = index
+        if self._size < self._capacity:
+            self._size += 1
+        self._current_bucket = bucket
+        self._starts[index] = bucket * self._width_ns
+        self._minimums[index] = value
+        self._maximums[index] = value
+        self._sums[index] = value
+        self._counts[index] = 1
+        self._lasts[index] = value
+
+    def count_between(self, start_ns: int, end_ns: int) -> int:
+        """
+        Number of buckets overlapping a time range.
+
+        Args:
+            start_ns (int): Start of the range, epoch nanoseconds.
+            end_ns (int): End of the range (inclusive), epoch nanoseconds.
+
+        Returns:
+            int: Number of buckets.
+        """
+        first, stop = self._range(start_ns, end_ns)
+        return max(stop - first, 0)
+
+    def buckets_between(self, start_ns: int, end_ns: int) -> list[HistoryBucket]:
+        """
+        Get the buckets overlapping a time range.
+
+        Args:
+            start_ns (int): Start of the range, epoch nanoseconds.
+            end_ns (int): End of the range (inclusive), epoch nanoseconds.
+
+        Returns:
+            list[HistoryBucket]: Buckets, oldest first.
+        """
+        first, stop = self._range(start_ns, end_ns)
+        buckets: list[HistoryBucket] = []
+        for logical_index in range(first, stop):
+            index = self._physical_index(logical_index)
+            count = self._counts[index]
+            buckets.append(
+                HistoryBucket(
+                    start_ns=self._starts[index],
+                    minimum=self._minimums[index],
+                    maximum=self._maximums[index],
+                    mean=self._sums[index] / count,
+                    count=count,
+                    last=self._lasts[index],
+                )
+            )
+        return buckets
+
+    def _allocate(self) -> None:
+        """
+        Allocate the bucket columns.
+        """
+        self._starts = array("q", bytes(8 * self._capacity))
+        self._minimums = array("d", bytes(8 * self._capacity))
+        self._maximums = array("d", bytes(8 * self._capacity))
+        self._sums = array("d", bytes(8 * self._capacity))
+        self._counts = array("q", bytes(8 * self._capacity))
+        self._lasts = array("d", bytes(8 * self._capacity))
+
+    def _physical_index(self, index: int) -> int:
+        """
+        Convert a logical index (0 is the oldest retained bucket) to a physical array index.
+        """
+        return (self._head - self._size + 1 + index) % self._capacity
+
+    def _bisect(self, timestamp_ns: int) -> int:
+        """
+        Logical index of the first bucket starting after a timestamp.
+        """
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            if self._starts[self._physical_index(middle)] <= timestamp_ns:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _range(self, start_ns: int, end_ns: int) -> tuple[int, int]:
+        """
+        Logical index range of the buckets overlapping a time range.
+        """
+        # The bucket containing start_ns starts at or before it.
+        first = self._bisect(start_ns - self._width_ns)
+        return first, self._bisect(end_ns)
@@ -0,0 +1,200 @@
+"""Streaming statistics for Virtual Instruments."""
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class RunningStatisticsConfiguration(BaseModel):
+    """
+    Configuration Model for the running statistics of a virtual instrument.
+    """
+
+    window: float = Field(default=60.0, gt=0)  # Sliding window length, in seconds.
+    # Time constants of the exponentially weighted moving averages, in seconds.
+    ewma_time_constants: list[float] = Field(default_factory=lambda: [1.0, 10.0])
+
+
+# pylint: disable=too-many-instance-attributes
+# It's a flat snapshot of every statistic.
+@dataclass
+class RunningStatisticsSnapshot:
+    """
+    Point-in-time copy of the running statistics of a virtual instrument. Statistics are None until
+    there is enough data to compute them.
+    """
+
+    count: int  # Number of numeric samples recorded
+    mean: Optional[float]
+    std: Optional[float]  # Sample standard deviation
+    minimum: Optional[float]
+    maximum: Optional[float]
+    window: float  # Sliding window length, in seconds
+    window_count: int
+    window_mean: Optional[float]
+    window_std: Optional[float]
+    window_minimum: Optional[float]
+    window_maximum: Optional[float]
+    rate_of_change: Optional[float]  # Per second, across the sliding window
+    ewma: dict[float, float]  # Time constant (seconds): average
+
+
+class RunningStatistics:
+    """
+    Statistics over the numeric values of a virtual instrument, updated in O(1) (amortized) per
+    sample:
+
+    - lifetime count, mean and variance with Welford's algorithm, plus lifetime min and max;
+    - the same over a sliding time window, with Welford's update reversed as samples leave the
+      window, and monotonic deques for the window min and max;
+    - rate of change across the window;
+    - exponentially weighted moving averages for irregularly spaced samples, one per time
+      constant.
+
+    This class is not thread safe, the owner is expected to hold its own lock.
+    """
+
+    def __init__(self, configuration: RunningStatisticsConfiguration) -> None:
+        self._window_ns: int = round(configuration.window * 1_000_000_000)
+        self._time_constants: list[float] = list(configuration.ewma_time_constants)
+
+        self._count: int = 0
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+        self._minimum: float = math.inf
+        self._maximum: float = -math.inf
+
+        self._window_samples: deque[tuple[int, float]] = deque()
+        self._window_mean: float = 0.0
+        self._window_m2: float = 0.0
+        # Candidates for the window min/max, values strictly increasing/decreasing.
+        self._window_minima: deque[tuple[int, float]] = deque()
+        self._window_maxima: deque[tuple[int, float]] = deque()
+
+        self._ewma: list[float] = [0.0] * len(self._time_constants)
+        self._last_timestamp_ns: Optional[int] = None
+
+    def add(self, timestamp_ns: int, value: float) -> None:
+        """
+        Fold a sample into the statistics.
+
+        Args:
+            timestamp_ns (int): Epoch timestamp of the sample, in nanoseconds.
+            value (float): Value of the sample.
+        """
+        value = float(value)
+
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        if value < self._minimum:
+            self._minimum = value
+        if value > self._maximum:
+            self._maximum = value
+
+        last_timestamp_ns = self._last_timestamp_ns
+        if last_timestamp_ns is None:
+            self._ewma = [value] * len(self._time_constants)
+        else:
+            elapsed = max(timestamp_ns - last_timestamp_ns, 0) / 1_000_000_000
+            for index, time_constant in enumerate(self._time_constants):
+                alpha = 1.0 - math.exp(-elapsed / time_constant)
+                self._ewma[index] += alpha * (value - self._ewma[index])
+        self._last_timestamp_ns = timestamp_ns
+
+        self._window_samples.append((timestamp_ns, value))
+        window_count = len(self._window_samples)
+        delta = value - self._window_mean
+        self._window_mean += delta / window_count
+        self._window_m2 += delta * (value - self._window_mean)
+        minima = self._window_minima
+        while minima and minima[-1][1] >= value:
+            minima.pop()
+        minima.append((timestamp_ns, value))
+        maxima = self._window_maxima
+        while maxima and maxima[-1][1] <= value:
+            maxima.pop()
+        maxima.append((timestamp_ns, value))
+
+        self._evict(timestamp_ns)
+
+    def snapshot(self, now_ns: Optional[int] = None) -> RunningStatisticsSnapshot:
+        """
+        Get a copy of the current statistics.
+
+        Args:
+            now_ns (Optional[int], optional): Current epoch time in nanoseconds, to expire samples
+            which have left the window since the last update. Defaults to None, i.e. relative to
+            the last sample.
+
+        Returns:
+            RunningStatisticsSnapshot: Current statistics.
+        """
+        if now_ns is not None:
+            self._evict(now_ns)
+        count = self._count
+        window_samples = self._window_samples
+        window_count = len(window_samples)
+
+        rate_of_change: Optional[float] = None
+        if window_count > 1:
+            first_timestamp_ns, first_value = window_samples[0]
+            last_timestamp_ns, last_value = window_samples[-1]
+            if last_timestamp_ns > first_timestamp_ns:
+                rate_of_change = (
+                    (last_value - first_value)
+                    * 1_000_000_000
+                    / (last_timestamp_ns - first_timestamp_ns)
+                )
+
+        return RunningStatisticsSnapshot(
+            count=count,
+            mean=self._mean if count else None,
+            std=math.sqrt(max(self._m2, 0.0) / (count - 1)) if count > 1 else None,
+            minimum=self._minimum if count else None,
+            maximum=self._maximum if count else None,
+            window=self._window_ns / 1_000_000_000,
+            window_count=window_count,
+            window_mean=self._window_mean if window_count else None,
+            window_std=(
+                math.sqrt(max(self._window_m2, 0.0) / (window_count - 1))
+                if window_count > 1
+                else None
+            ),
+            window_minimum=self._window_minima[0][1] if window_count else None,
+            window_maximum=self._window_maxima[0][1] if window_count else None,
+            rate_of_change=rate_of_change,
+            ewma=(
+                dict(zip(self._time_constants, self._ewma))
+                if self._last_timestamp_ns is not None
+                else {}
+            ),
+        )
+
+    def _evict(self, now_ns: int) -> None:
+        """
+        Remove samples which have left the sliding window.
+        """
+        cutoff = now_ns - self._window_ns
+        samples = self._window_samples
+        while samples and samples[0][0] < cutoff:
+            _, value = samples.popleft()
+            remaining = len(samples)
+            if remaining == 0:
+                self._window_mean = 0.0
+                self._window_m2 = 0.0
+                break
+            # Welford's update, reversed.
+            old_mean = self._window_mean
+            self._window_mean = old_mean - (value - old_mean) / remaining
+            self._window_m2 -= (value - old_mean) * (value - self._window_mean)
+        minima = self._window_minima
+        while minima and minima[0][0] < cutoff:
+            minima.popleft()
+        maxima = self._window_maxima
+        while maxima and maxima[0][0] < cutoff:
+            maxima.popleft()
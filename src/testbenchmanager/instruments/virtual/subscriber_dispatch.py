@@ -0,0 +1,206 @@
+"""Off-thread dispatch of Virtual Instrument subscriber callbacks."""
+
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from threading import Condition, Lock, get_ident
+from typing import Callable, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class OverflowPolicy(str, Enum):
+    """
+    What a mailbox does with a new item when it is already full.
+    """
+
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest pending item to make room.
+    DROP_NEWEST = "drop_newest"  # Discard the new item.
+    BLOCK = "block"  # Block the producer until there is room.
+    COALESCE = "coalesce"  # Discard everything pending, keep only the new item.
+
+
+@dataclass
+class MailboxStatistics:
+    """Delivery counters for a single mailbox subscription."""
+
+    name: str
+    mailbox_size: int
+    overflow_policy: OverflowPolicy
+    pending: int
+    delivered: int
+    dropped: int
+    failed: int
+
+
+class SubscriberDispatcher:
+    """
+    Shared pool of threads that subscriber mailboxes are drained on. The pool is created lazily, so
+    processes that never use mailbox subscriptions never start any threads.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._max_workers: int = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock: Lock = Lock()
+
+    def submit(self, function: Callable[[], None]) -> None:
+        """
+        Run a function on the dispatcher pool.
+
+        Args:
+            function (Callable[[], None]): Function to run.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="subscriber-dispatch",
+                )
+            executor = self._executor
+        executor.submit(function)
+
+
+subscriber_dispatcher = SubscriberDispatcher()  # global singleton instance
+
+
+# pylint: disable=too-many-instance-attributes
+# Most of these are the delivery counters.
+class Mailbox(Generic[T]):
+    """
+    Bounded mailbox for one subscription. Items are posted by the producer (cheaply, without
+    running the callback) and delivered in order on the dispatcher pool. At most one pool thread
+    drains a given mailbox at a time.
+    """
+
+    # Maximum number of items delivered in one go before yielding the pool thread to other
+    # mailboxes.
+    DRAIN_BATCH_SIZE = 64
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        callback: Callable[[T], None],
+        maxsize: int,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        dispatcher: SubscriberDispatcher = subscriber_dispatcher,
+        name: Optional[str] = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(f"Mailbox size must be at least 1, got {maxsize}.")
+        self.name: str = name or getattr(callback, "__qualname__", repr(callback))
+        self._callback = callback
+        self._maxsize: int = maxsize
+        self._overflow_policy: OverflowPolicy = overflow_policy
+        self._dispatcher: SubscriberDispatcher = dispatcher
+        self._items: deque[T] = deque()
+        self._condition: Condition = Condition()
+        self._scheduled: bool = False
+        self._closed: bool = False
+        self._draining_thread: Optional[int] = None
+        self._delivered: int = 0
+        self._dropped: int = 0
+        self._failed: int = 0
+
+    @property
+    def statistics(self) -> MailboxStatistics:
+        """
+        Snapshot of the delivery counters of this mailbox.
+
+        Returns:
+            MailboxStatistics: Current counters.
+        """
+        with self._condition:
+            return MailboxStatistics(
+                name=self.name,
+                mailbox_size=self._maxsize,
+                overflow_policy=self._overflow_policy,
+                pending=len(self._items),
+                delivered=self._delivered,
+                dropped=self._dropped,
+                failed=self._failed,
+            )
+
+    def post(self, item: T) -> None:
+        """
+        Post an item for delivery, applying the overflow policy if the mailbox is full.
+
+        Args:
+            item (T): Item to deliver to the callback.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            if len(self._items) >= self._maxsize:
+                match self._overflow_policy:
+                    case OverflowPolicy.DROP_OLDEST:
+                        self._items.popleft()
+                        self._dropped += 1
+                    case OverflowPolicy.DROP_NEWEST:
+                        self._dropped += 1
+                        return
+                    case OverflowPolicy.COALESCE:
+                        self._dropped += len(self._items)
+                        self._items.clear()
+                    case OverflowPolicy.BLOCK:
+                        while len(self._items) >= self._maxsize and not self._closed:
+                            self._condition.wait()
+                        if self._closed:
+                            return
+            self._items.append(item)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._dispatcher.submit(self._drain)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop accepting new items. Items already posted are still delivered.
+
+        Args:
+            wait (bool, optional): Block until all pending items are delivered. Ignored when
+            called from within the callback itself. Defaults to True.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            if not wait or self._draining_thread == get_ident():
+                return
+            while self._scheduled:
+                self._condition.wait()
+
+    def _drain(self) -> None:
+        """
+        Deliver pending items in order. Runs on the dispatcher pool.
+        """
+        for _ in range(self.DRAIN_BATCH_SIZE):
+            with self._condition:
+                if not self._items:
+                    self._scheduled = False
+                    self._draining_thread = None
+                    self._condition.notify_all()
+                    return
+                item = self._items.popleft()
+                self._draining_thread = get_ident()
+                # Wake any producer blocked on a full mailbox.
+                self._condition.notify_all()
+            try:
+                self._callback(item)
+                self._delivered += 1
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Same as synchronous subscribers, a failing callback is only logged.
+                self._failed += 1
+                logger.warning(
+                    "%s raised in subscriber '%s': %s",
+                    type(e).__qualname__,
+                    self.name,
+                    e,
+                )
+        # Still items left, requeue ourselves behind the other mailboxes.
+        with self._condition:
+            self._draining_thread = None
+        self._dispatcher.submit(self._drain)
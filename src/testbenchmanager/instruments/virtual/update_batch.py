@@ -0,0 +1,131 @@
+"""Batched state updates across several Virtual Instruments."""
+
+import logging
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+from testbenchmanager.common.clock import wall_clock
+
+from .virtual_instrument_state import VirtualInstrumentState
+
+if TYPE_CHECKING:
+    # Only needed for annotations, virtual_instrument imports this module.
+    from .virtual_instrument import VirtualInstrument
+
+logger = logging.getLogger(__name__)
+
+type BatchStates = dict[str, VirtualInstrumentState[Any]]
+type BatchCallback = Callable[[BatchStates], None]
+
+
+def publish_batch(states: BatchStates, callbacks: Iterable[BatchCallback]) -> None:
+    """
+    Call batch subscriber callbacks with a set of states, logging (rather than raising) any errors.
+
+    Args:
+        states (BatchStates): States to publish, keyed by virtual instrument UID.
+        callbacks (Iterable[BatchCallback]): Callbacks to call.
+    """
+    for callback in callbacks:
+        try:
+            callback(states)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Same as per-instrument subscribers, a failing callback is only logged.
+            logger.warning(
+                "%s raised during batch subscriber callback: %s",
+                type(e).__qualname__,
+                e,
+            )
+
+
+class TranslatorUpdateBatch:
+    """
+    Collects state updates for several virtual instruments (e.g. every channel read in one poll of
+    a physical instrument) and applies them together when the context exits:
+
+    - every state gets the same timestamp;
+    - all states are recorded before anyone is notified, so per-instrument subscribers and waiters
+      observe a consistent snapshot;
+    - each batch subscriber is called once, with all the states of the instruments in the batch it
+      is subscribed to.
+
+    If the context exits with an exception, nothing is applied.
+
+    Usage:
+        with TranslatorUpdateBatch() as batch:
+            for value, instrument in zip(values, instruments):
+                batch.add(instrument, value)
+    """
+
+    def __init__(self) -> None:
+        self._updates: list[tuple["VirtualInstrument[Any]", Any]] = []
+
+    def __enter__(self) -> "TranslatorUpdateBatch":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.commit()
+        self._updates = []
+
+    def __len__(self) -> int:
+        return len(self._updates)
+
+    def add(self, instrument: "VirtualInstrument[Any]", value: Any) -> None:
+        """
+        Add an update to the batch.
+
+        Args:
+            instrument (VirtualInstrument[Any]): Virtual instrument to update.
+            value (Any): Value to update the instrument to.
+        """
+        self._updates.append((instrument, value))
+
+    def commit(self, timestamp_ns: Optional[int] = None) -> None:
+        """
+        Apply all updates in the batch. This is called automatically when the context exits.
+
+        Args:
+            timestamp_ns (Optional[int], optional): Epoch timestamp to record the states with, in
+            nanoseconds. Defaults to None, i.e. now.
+        """
+        updates, self._updates = self._updates, []
+        if not updates:
+            return
+        if timestamp_ns is None:
+            timestamp_ns = wall_clock.now_ns()
+
+        recorded: list[tuple["VirtualInstrument[Any]", Any]] = []
+        for instrument, value in updates:
+            try:
+                recorded.append(
+                    # pylint: disable=protected-access
+                    (instrument, instrument._record_update(value, timestamp_ns))
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning(
+                    "Error updating virtual instrument '%s' state: %s",
+                    instrument.metadata.uid,
+                    e,
+                )
+
+        callback_states: dict[BatchCallback, BatchStates] = {}
+        for instrument, update in recorded:
+            # pylint: disable=protected-access
+            batch_callbacks = tuple(instrument._batch_callbacks)
+            state = instrument._publish_update(
+                update, force_state=bool(batch_callbacks)
+            )
+            if state is None:
+                continue
+            uid = instrument.metadata.uid
+            for callback in batch_callbacks:
+                callback_states.setdefault(callback, {})[uid] = state
+
+        for callback, subscribed_states in callback_states.items():
+            publish_batch(subscribed_states, (callback,))
@@ -1,21 +1,49 @@
 """Virtual Instrument implementation."""
 
+import asyncio
 import logging
-from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
 from datetime import datetime
 from queue import Empty, Full, Queue
-from threading import Condition, Event, Lock
-from time import monotonic
-from typing import Callable, ClassVar, Generic, Iterator, Optional
+from threading import Event, Lock
+from typing import Any, Callable, ClassVar, Generic, Iterator, Optional
+from weakref import WeakSet
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from testbenchmanager.common.clock import timestamp_to_ns, wall_clock
 from testbenchmanager.common.logging import PrefixAdaptor
 
+from .history_buffer import HistoryBuffer, HistoryMemoryUsage
+from .history_reader import HistoryReader
+from .history_tiers import HistoryRange, HistoryTier, HistoryTierConfiguration
+from .running_statistics import (
+    RunningStatistics,
+    RunningStatisticsConfiguration,
+    RunningStatisticsSnapshot,
+)
+from .subscriber_dispatch import Mailbox, MailboxStatistics, OverflowPolicy
+from .update_batch import BatchCallback, publish_batch
 from .virtual_instrument_state import VirtualInstrumentState, VirtualInstrumentValue
+from .waiter_index import Waiter, WaiterIndex
 
 logger = logging.getLogger(__name__)
 
+# Value types which are folded into the downsampled history tiers.
+_NUMERIC_TYPES: frozenset[type] = frozenset((int, float, bool))
+
+
+@dataclass(slots=True)
+class _RecordedUpdate(Generic[VirtualInstrumentValue]):
+    """A state update which has been recorded in the history, but not yet published."""
+
+    value: VirtualInstrumentValue
+    sequence: int
+    timestamp_ns: int
+    due_waiters: list[Waiter[VirtualInstrumentValue]]
+    predicate_waiters: tuple[Waiter[VirtualInstrumentValue], ...]
+
 
 class VirtualInstrumentMetadata(BaseModel):
     """
@@ -26,6 +54,16 @@ class VirtualInstrumentMetadata(BaseModel):
     name: Optional[str] = None
     unit: Optional[str] = None
     description: Optional[str] = None
+    # Raw history retention. With only a length, exactly that many states are retained. With a
+    # duration (in seconds), the history grows on demand to cover it, up to the length if given.
+    # With neither, VirtualInstrument.MAX_HISTORY_LENGTH states are retained.
+    history_length: Optional[int] = Field(default=None, ge=1)
+    history_duration: Optional[float] = Field(default=None, gt=0)
+    # Downsampled history tiers, finest first. None uses VirtualInstrument.DEFAULT_HISTORY_TIERS,
+    # an empty list disables downsampled history.
+    history_tiers: Optional[list[HistoryTierConfiguration]] = None
+    # Running statistics over numeric values. None disables them.
+    statistics: Optional[RunningStatisticsConfiguration] = None
 
 
 # pylint: disable=too-many-instance-attributes
@@ -45,11 +83,19 @@ class VirtualInstrument(Generic[VirtualInstrumentValue]):
     """
 
     MAX_HISTORY_LENGTH: ClassVar[int] = 1000
+    # Upper bound on the history of instruments with a retention duration but no length.
+    MAX_DURATION_HISTORY_LENGTH: ClassVar[int] = 1_000_000
+    DEFAULT_HISTORY_TIERS: ClassVar[list[HistoryTierConfiguration]] = [
+        HistoryTierConfiguration(resolution=1.0, length=600),  # 10 minutes
+        HistoryTierConfiguration(resolution=10.0, length=360),  # 1 hour
+        HistoryTierConfiguration(resolution=60.0, length=360),  # 6 hours
+    ]
 
     def __init__(
         self,
         metadata: VirtualInstrumentMetadata,
-        command_callback: Optional[Callable[[VirtualInstrumentValue], None]] = None,
+        command_callback: Optional[Callable[[VirtualInstrumentValue], Any]] = None,
+        burst_callback: Optional[Callable[[Optional[float]], None]] = None,
     ) -> None:
         self.metadata: VirtualInstrumentMetadata = metadata
 
@@ -58,17 +104,49 @@ class VirtualInstrument(Generic[VirtualInstrumentValue]):
         self._subscriber_callbacks: set[
             Callable[[VirtualInstrumentState[VirtualInstrumentValue]], None]
         ] = set()
-        self._history: deque[VirtualInstrumentState[VirtualInstrumentValue]] = deque(
-            maxlen=self.MAX_HISTORY_LENGTH
+        self._mailboxes: set[
+            Mailbox[VirtualInstrumentState[VirtualInstrumentValue]]
+        ] = set()
+        if metadata.history_length is not None:
+            self._requested_history_length: int = metadata.history_length
+        elif metadata.history_duration is not None:
+            self._requested_history_length = self.MAX_DURATION_HISTORY_LENGTH
+        else:
+            self._requested_history_length = self.MAX_HISTORY_LENGTH
+        self._history: HistoryBuffer[VirtualInstrumentValue] = HistoryBuffer(
+            self._requested_history_length,
+            retention_ns=(
+                None
+                if metadata.history_duration is None
+                else round(metadata.history_duration * 1_000_000_000)
+            ),
+        )
+        tier_configurations = (
+            self.DEFAULT_HISTORY_TIERS
+            if metadata.history_tiers is None
+            else metadata.history_tiers
+        )
+        self._history_tiers: list[HistoryTier] = sorted(
+            (HistoryTier(configuration) for configuration in tier_configurations),
+            key=lambda tier: tier.resolution,
+        )
+        self._statistics: Optional[RunningStatistics] = (
+            None
+            if metadata.statistics is None
+            else RunningStatistics(metadata.statistics)
         )
         self._state_lock: Lock = Lock()
-        self._condition: Condition = Condition(self._state_lock)
+        self._waiters: WaiterIndex[VirtualInstrumentValue] = WaiterIndex()
         self._sequence: int = 0
-        self._consumer_queues: set[
+        self._stale: bool = False
+        # Weak, so a queue abandoned by its consumer is garbage collected.
+        self._consumer_queues: WeakSet[
             Queue[VirtualInstrumentState[VirtualInstrumentValue]]
-        ] = set()
+        ] = WeakSet()
+        self._batch_callbacks: set[BatchCallback] = set()
 
         self._command_callback = command_callback
+        self._burst_callback = burst_callback
 
     @property
     def _state(self) -> VirtualInstrumentState[VirtualInstrumentValue]:
@@ -80,10 +158,61 @@ class VirtualInstrument(Generic[VirtualInstrumentValue]):
         Returns:
             VirtualInstrumentState[VirtualInstrumentValue]: The current state of the virtual instrument.
         """
-        if len(self._history) > 0:
-            return self._history[-1]
-        else:
+        state = self._history.latest()
+        if state is None:
             raise RuntimeError("VirtualInstrument has no state yet")
+        return state
+
+    @property
+    def requested_history_length(self) -> int:
+        """
+        Number of states the history would retain without any memory budget applied.
+
+        Returns:
+            int: Requested maximum history length.
+        """
+        return self._requested_history_length
+
+    @property
+    def history_tier_memory(self) -> int:
+        """
+        Number of bytes the downsampled history tiers use once allocated.
+
+        Returns:
+            int: Size of the history tiers in bytes.
+        """
+        return sum(tier.max_memory_usage for tier in self._history_tiers)
+
+    def set_history_limit(self, length: Optional[int]) -> None:
+        """
+        Limit the history to fewer states than requested in the metadata, e.g. to fit a memory
+        budget. If more states are currently retained, the oldest are dropped.
+
+        Args:
+            length (Optional[int]): Maximum number of states to retain, or None to lift the limit.
+        """
+        max_length = self._requested_history_length
+        if length is not None:
+            max_length = max(min(length, max_length), 1)
+        with self._state_lock:
+            self._history.set_max_capacity(max_length)
+
+    def memory_usage(self) -> HistoryMemoryUsage:
+        """
+        Get the current size and memory usage of the history of this virtual instrument.
+
+        Returns:
+            HistoryMemoryUsage: Current history size and memory usage.
+        """
+        with self._state_lock:
+            return HistoryMemoryUsage(
+                length=len(self._history),
+                capacity=self._history.capacity,
+                max_length=self._history.max_capacity,
+                retention=self.metadata.history_duration,
+                history_bytes=self._history.memory_usage,
+                tier_bytes=sum(tier.memory_usage for tier in self._history_tiers),
+            )
 
     @property
     def history(self) -> list[VirtualInstrumentState[VirtualInstrumentValue]]:
@@ -94,7 +223,218 @@ class VirtualInstrument(Generic[VirtualInstrumentValue]):
             list[VirtualInstrumentState[VirtualInstrumentValue]]: List of historical states.
         """
         with self._state_lock:
-            return list(self._history)
+            return self._history.states()
+
+    def history_since(
+        self, sequence: int, limit: Optional[int] = None
+    ) -> list[VirtualInstrumentState[VirtualInstrumentValue]]:
+        """
+        Get the retained states from a given sequence number onwards. Only the requested states are
+        copied out of the history.
+
+        If the sequence is older than the oldest retained state, the history starts from the
+        oldest retained state instead.
+
+        Args:
+            sequence (int): Earliest sequence number to include.
+            limit (Optional[int], optional): Maximum number of states to return, counted from the
+            earliest included state. Defaults to None, i.e. no limit.
+
+        Returns:
+            list[VirtualInstrumentState[VirtualInstrumentValue]]: States, oldest first.
+        """
+        with self._state_lock:
+            start = self._history.index_of_sequence(sequence)
+            stop = None if limit is None else start + max(limit, 0)
+            return self._history.states(start, stop)
+
+    @property
+    def next_sequence(self) -> int:
+        """
+        Sequence number the next state update will be recorded with.
+
+        Returns:
+            int: Next sequence number.
+        """
+        return self._sequence
+
+    def reader(
+        self, start_sequence: Optional[int] = None
+    ) -> HistoryReader[VirtualInstrumentValue]:
+        """
+        Get a cursor-based reader over the history of this virtual instrument, which reads every
+        state in order (or reports exactly how many it missed, if it falls behind the history).
+
+        This is ideal for consumers that want to process every state, and is cheaper than as_queue
+        since states are only copied out of the history when read.
+
+        Args:
+            start_sequence (Optional[int], optional): Sequence number of the first state to read.
+            Defaults to None, i.e. only states recorded from now on. 0 reads the whole retained
+            history first.
+
+        Returns:
+            HistoryReader[VirtualInstrumentValue]: Reader positioned at start_sequence.
+        """
+        if start_sequence is None:
+            start_sequence = self._sequence
+        return HistoryReader(self, start_sequence)
+
+    def _read_history(
+        self, sequence: int, limit: int
+    ) -> tuple[int, list[VirtualInstrumentState[VirtualInstrumentValue]]]:
+        """
+        Read states from a sequence number onwards for a HistoryReader, clamped to the oldest
+        retained state.
+
+        Args:
+            sequence (int): Earliest sequence number to read.
+            limit (int): Maximum number of states to read.
+
+        Returns:
+            tuple[int, list[VirtualInstrumentState[VirtualInstrumentValue]]]: Sequence number
+            the read actually started from, and the states read.
+        """
+        with self._state_lock:
+            first_sequence = self._history.first_sequence
+            if first_sequence is not None and first_sequence > sequence:
+                sequence = first_sequence
+            start = self._history.index_of_sequence(sequence)
+            return sequence, self._history.states(start, start + max(limit, 0))
+
+    def history_between(
+        self, start_time: datetime, end_time: datetime
+    ) -> list[VirtualInstrumentState[VirtualInstrumentValue]]:
+        """
+        Get the retained states recorded within a time range (inclusive at both ends).
+
+        Args:
+            start_time (datetime): Earliest timestamp to include.
+            end_time (datetime): Latest timestamp to include.
+
+        Returns:
+            list[VirtualInstrumentState[VirtualInstrumentValue]]: States, oldest first.
+        """
+        start_ns = timestamp_to_ns(start_time)
+        # Timestamps are only microsecond-resolution on the way in, so include the whole
+        # microsecond at the end of the range.
+        end_ns = timestamp_to_ns(end_time) + 999
+        with self._state_lock:
+            start = self._history.index_of_timestamp(start_ns)
+            stop = self._history.index_of_timestamp(end_ns + 1)
+            return self._history.states(start, stop)
+
+    def history_range(
+        self,
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+        max_points: int = 1000,
+    ) -> HistoryRange:
+        """
+        Get the history over a time range at the finest resolution which covers the whole range
+        within a point budget.
+
+        The raw history is used if it reaches back far enough and has few enough states in the
+        range, otherwise the finest downsampled tier which does. If none can cover the range
+        within the budget, the coarsest resolution within the budget is used (covering as much of
+        the end of the range as it retains), and failing that the most recent buckets of the
+        coarsest tier.
+
+        Args:
+            start_time (datetime): Start of the range.
+            end_time (Optional[datetime], optional): End of the range (inclusive). Defaults to
+            None, i.e. now.
+            max_points (int, optional): Maximum number of states or buckets to return. Defaults to
+            1000.
+
+        Raises:
+            ValueError: If max_points is less than 1.
+
+        Returns:
+            HistoryRange: States or buckets in the range, and the resolution they are at.
+        """
+        if max_points < 1:
+            raise ValueError(f"max_points must be at least 1, got {max_points}")
+        start_ns = timestamp_to_ns(start_time)
+        end_ns = (
+            wall_clock.now_ns() if end_time is None else timestamp_to_ns(end_time) + 999
+        )
+        with self._state_lock:
+            # Candidates are (resolution, point count, covers the whole range), finest first.
+            history = self._history
+            first_index = history.index_of_timestamp(start_ns)
+            raw_count = history.index_of_timestamp(end_ns + 1) - first_index
+            oldest_ns = history.oldest_timestamp_ns
+            raw_covers = history.first_sequence in (None, 0) or (
+                oldest_ns is not None and oldest_ns <= start_ns
+            )
+            candidates: list[tuple[Optional[float], int, bool]] = [
+                (None, raw_count, raw_covers)
+            ]
+            for tier in self._history_tiers:
+                tier_oldest_ns = tier.oldest_ns
+                covers = not tier.wrapped or (
+                    tier_oldest_ns is not None and tier_oldest_ns <= start_ns
+                )
+                candidates.append(
+                    (tier.resolution, tier.count_between(start_ns, end_ns), covers)
+                )
+
+            within_budget = [c for c in candidates if c[1] <= max_points]
+            covering = [c for c in within_budget if c[2]]
+            if covering:
+                resolution = covering[0][0]
+            elif within_budget:
+                resolution = within_budget[-1][0]
+            else:
+                resolution = candidates[-1][0]
+
+            if resolution is None:
+                states = history.states(first_index, first_index + raw_count)
+                return HistoryRange(
+                    resolution=None, states=states[-max_points:], buckets=[]
+                )
+            tier = next(t for t in self._history_tiers if t.resolution == resolution)
+            buckets = tier.buckets_between(start_ns, end_ns)
+            return HistoryRange(
+                resolution=resolution, states=[], buckets=buckets[-max_points:]
+            )
+
+    def stats(self) -> Optional[RunningStatisticsSnapshot]:
+        """
+        Get the running statistics of this virtual instrument. This is constant time, regardless of
+        the length of the history.
+
+        Returns:
+            Optional[RunningStatisticsSnapshot]: Current statistics, or None if running statistics
+            are not enabled in the metadata.
+        """
+        if self._statistics is None:
+            return None
+        with self._state_lock:
+            return self._statistics.snapshot(wall_clock.now_ns())
+
+    @property
+    def stale(self) -> bool:
+        """
+        Whether the source of this virtual instrument has stopped updating it, as detected by its
+        translator. Cleared by the next update.
+
+        Returns:
+            bool: True if the virtual instrument is stale.
+        """
+        return self._stale
+
+    def mark_stale(self) -> None:
+        """
+        Mark this virtual instrument as stale, i.e. its source has stopped updating it. This is
+        intended to be called by an instrument translation layer object; the next update clears it.
+        """
+        with self._state_lock:
+            if self._stale:
+                return
+            self._stale = True
+        self._logger.warning("Virtual instrument is stale")
 
     @property
     def value(self) -> VirtualInstrumentValue:
@@ -125,33 +465,161 @@ class VirtualInstrument(Generic[VirtualInstrumentValue]):
 
         self._command_callback(value)
 
+    def submit_command(self, value: VirtualInstrumentValue) -> Future[Any]:
+        """
+        Command the virtual instrument, like command(), but get a future to wait on for the
+        command to be acknowledged by the translation layer. Translators which queue commands
+        (e.g. CommandDrivenTranslator) complete the future once the command has been carried out;
+        for others, it is already complete when this returns.
+
+        Args:
+            value (VirtualInstrumentValue): Value to set.
+
+        Returns:
+            Future[Any]: Future completed when the command has been carried out, with the
+            exception that failed it, if any.
+        """
+        future: Future[Any] = Future()
+        if self._command_callback is None:
+            future.set_exception(
+                RuntimeError(
+                    f"Virtual instrument '{self.metadata.uid}' cannot be commanded"
+                )
+            )
+            return future
+        try:
+            result = self._command_callback(value)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Handed to the caller through the future.
+            future.set_exception(e)
+            return future
+        if isinstance(result, Future):
+            return result
+        future.set_result(result)
+        return future
+
+    def request_burst(self, duration: Optional[float] = None) -> bool:
+        """
+        Ask the translation layer to update this virtual instrument at its fastest rate for a
+        while, e.g. around a transient an experiment step is about to cause. Only sources which
+        adapt their rate (e.g. adaptive polling) support this.
+
+        Args:
+            duration (Optional[float], optional): How long to update at the fastest rate for, in
+            seconds. Defaults to None, i.e. the source's configured burst duration.
+
+        Returns:
+            bool: True if the source supports bursts, False if the request was ignored.
+        """
+        if self._burst_callback is None:
+            return False
+        self._burst_callback(duration)
+        return True
+
     def update_state(self, value: VirtualInstrumentValue) -> None:
         """
         Update the internal state of the virtual instrument, which will perform all notification
         side-effects. This is intended to be called by an instrument translation layer object.
 
+        To update several virtual instruments at once with a single timestamp and a single
+        notification to batch subscribers, use a TranslatorUpdateBatch instead.
+
         Args:
             value (T): value to update the state to.
         """
+        update = self._record_update(value, wall_clock.now_ns())
+        state = self._publish_update(update, force_state=bool(self._batch_callbacks))
+        if state is not None:
+            publish_batch({self.metadata.uid: state}, tuple(self._batch_callbacks))
+
+    def _record_update(
+        self, value: VirtualInstrumentValue, timestamp_ns: int
+    ) -> "_RecordedUpdate[VirtualInstrumentValue]":
+        """
+        First half of a state update: append the new state to the history and collect the waiters
+        it satisfies, under the state lock.
+
+        Args:
+            value (VirtualInstrumentValue): New value.
+            timestamp_ns (int): Epoch timestamp of the new state, in nanoseconds.
+
+        Returns:
+            _RecordedUpdate[VirtualInstrumentValue]: Recorded update, to pass to _publish_update.
+        """
         with self._state_lock:
-            state = VirtualInstrumentState(
-                value=value, sequence=self._sequence, timestamp=datetime.now()
-            )
-            self._history.append(state)
+            sequence = self._sequence
+            self._history.append(sequence, timestamp_ns, value)
+            if type(value) in _NUMERIC_TYPES:
+                for tier in self._history_tiers:
+                    tier.add(timestamp_ns, value)
+                if self._statistics is not None:
+                    self._statistics.add(timestamp_ns, value)
             self._sequence += 1
-            self._condition.notify_all()
+            self._stale = False
+            due_waiters = self._waiters.pop_due(sequence)
+            predicate_waiters = self._waiters.predicate_waiters
+        return _RecordedUpdate(
+            value, sequence, timestamp_ns, due_waiters, predicate_waiters
+        )
 
-        self._logger.debug("State updated to: %s", self._state)
+    def _publish_update(
+        self, update: "_RecordedUpdate[VirtualInstrumentValue]", force_state: bool
+    ) -> Optional[VirtualInstrumentState[VirtualInstrumentValue]]:
+        """
+        Second half of a state update: wake waiters and notify subscribers and queues, outside of
+        the state lock.
 
-        # Notify all subscribers
-        for callback in self._subscriber_callbacks:
+        Args:
+            update (_RecordedUpdate[VirtualInstrumentValue]): Update returned by _record_update.
+            force_state (bool): Build (and return) the state object even if nobody here needs it.
+
+        Returns:
+            Optional[VirtualInstrumentState[VirtualInstrumentValue]]: The new state, or None if
+            it was never built.
+        """
+        due_waiters = update.due_waiters
+        predicate_waiters = update.predicate_waiters
+        # The history only stores raw columns, so only build a state object if someone is going to
+        # look at it.
+        if (
+            not force_state
+            and not due_waiters
+            and not predicate_waiters
+            and not self._subscriber_callbacks
+            and not self._consumer_queues
+            and not self._logger.isEnabledFor(logging.DEBUG)
+        ):
+            return None
+
+        state = VirtualInstrumentState(
+            value=update.value,
+            sequence=update.sequence,
+            timestamp_ns=update.timestamp_ns,
+        )
+        self._logger.debug("State updated to: %s", state)
+
+        # Only wake the waiters whose condition now holds.
+        if predicate_waiters:
+            matched = [waiter for waiter in predicate_waiters if waiter.matches(state)]
+            if matched:
+                with self._state_lock:
+                    self._waiters.discard_predicate_waiters(matched)
+                due_waiters.extend(matched)
+        if due_waiters:
+            WaiterIndex.wake(due_waiters, state)
+
+        # Notify all subscribers. Mailbox subscriptions only enqueue here, their callbacks run on
+        # the dispatcher pool.
+        for callback in tuple(self._subscriber_callbacks):
             try:
                 callback(state)
             except Exception as e:  # pylint: disable=broad-exception-caught
                 # We don't want a failing subscriber to fuck everything up for any reason, so we
                 # just log it.
                 self._logger.warning(
-                    "%s raised during subscriber callback: %s", e.__qualname__, str(e)
+                    "%s raised during subscriber callback: %s",
+                    type(e).__qualname__,
+                    str(e),
                 )
 
         for queue in list(self._consumer_queues):
@@ -166,26 +634,87 @@ class VirtualInstrument(Generic[VirtualInstrumentValue]):
                     # It may be possible for the queue to go from full to empty in this
                     pass
 
+        return state
+
     def subscribe(
-        self, callback: Callable[[VirtualInstrumentState[VirtualInstrumentValue]], None]
+        self,
+        callback: Callable[[VirtualInstrumentState[VirtualInstrumentValue]], None],
+        mailbox_size: Optional[int] = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
     ) -> Callable[[], None]:
         """
         Register a callback function to be called when the state of the virtual instrument is
         updated.
 
+        By default the callback is called synchronously by whoever updates the state (usually a
+        translator thread), so a slow callback delays acquisition. If a mailbox size is given, the
+        callback is instead called on the shared subscriber dispatcher pool; states are queued in a
+        bounded mailbox in between, and the overflow policy decides what happens when it is full.
+
         Args:
             callback (Callable[[VirtualInstrumentState[T]], None]): Callback function to register.
+            mailbox_size (Optional[int], optional): Size of the mailbox to dispatch through.
+            Defaults to None, i.e. call the callback synchronously.
+            overflow_policy (OverflowPolicy, optional): Policy to apply when the mailbox is full.
+            Defaults to OverflowPolicy.DROP_OLDEST.
+
+        Returns:
+            Callable[[], None]: function that can be called to unsubscribe the callback. For
+            mailbox subscriptions, this blocks until the already queued states are delivered.
+        """
+        if mailbox_size is None:
+            self._subscriber_callbacks.add(callback)
+
+            def unsubscribe() -> None:
+                self._subscriber_callbacks.discard(callback)
+
+            return unsubscribe
+
+        mailbox: Mailbox[VirtualInstrumentState[VirtualInstrumentValue]] = Mailbox(
+            callback, mailbox_size, overflow_policy
+        )
+        self._mailboxes.add(mailbox)
+        self._subscriber_callbacks.add(mailbox.post)
+
+        def unsubscribe_mailbox() -> None:
+            self._subscriber_callbacks.discard(mailbox.post)
+            self._mailboxes.discard(mailbox)
+            mailbox.close()
+
+        return unsubscribe_mailbox
+
+    def subscribe_batch(self, callback: BatchCallback) -> Callable[[], None]:
+        """
+        Register a batch-aware callback. Batch callbacks are called once per TranslatorUpdateBatch
+        rather than once per state, with the states of every instrument in the batch that the
+        callback is subscribed to (keyed by virtual instrument UID). Updates made outside of a
+        batch are delivered as a batch of one.
+
+        The same callback may be subscribed to several instruments; it is still only called once
+        per batch.
+
+        Args:
+            callback (BatchCallback): Callback function to register.
 
         Returns:
             Callable[[], None]: function that can be called to unsubscribe the callback.
         """
-        self._subscriber_callbacks.add(callback)
+        self._batch_callbacks.add(callback)
 
         def unsubscribe() -> None:
-            self._subscriber_callbacks.discard(callback)
+            self._batch_callbacks.discard(callback)
 
         return unsubscribe
 
+    def subscriber_statistics(self) -> list[MailboxStatistics]:
+        """
+        Get the delivery counters (including drops) of every mailbox subscription.
+
+        Returns:
+            list[MailboxStatistics]: Counters for each mailbox subscription.
+        """
+        return [mailbox.statistics for mailbox in tuple(self._mailboxes)]
+
     def get_latest_state(self) -> VirtualInstrumentState[VirtualInstrumentValue]:
         """
         Get the current state of the virtual instrument.
@@ -196,6 +725,65 @@ class VirtualInstrument(Generic[VirtualInstrumentValue]):
         with self._state_lock:
             return self._state
 
+    def _register_waiter(
+        self, waiter: Waiter[VirtualInstrumentValue]
+    ) -> Optional[VirtualInstrumentState[VirtualInstrumentValue]]:
+        """
+        Check a waiter against the current state, and add it to the waiter index if it isn't
+        already satisfied. Doing both under the state lock guarantees no update is missed.
+
+        Args:
+            waiter (Waiter[VirtualInstrumentValue]): Waiter to register.
+
+        Returns:
+            Optional[VirtualInstrumentState[VirtualInstrumentValue]]: The current state if it
+            already satisfies the waiter, otherwise None.
+        """
+        with self._state_lock:
+            state = self._history.latest()
+            if state is not None:
+                if waiter.threshold is not None and state.sequence >= waiter.threshold:
+                    return state
+                if waiter.predicate is not None and waiter.predicate(state):
+                    return state
+            self._waiters.add(waiter)
+        return None
+
+    def _wait(
+        self, waiter: Waiter[VirtualInstrumentValue], timeout: Optional[float]
+    ) -> VirtualInstrumentState[VirtualInstrumentValue]:
+        """
+        Block until a synchronous waiter is satisfied.
+        """
+        state = self._register_waiter(waiter)
+        if state is not None:
+            return state
+        try:
+            woken = waiter.wait(timeout)
+        finally:
+            with self._state_lock:
+                self._waiters.remove(waiter)
+        if not woken and waiter.state is None and waiter.error is None:
+            raise TimeoutError()
+        return waiter.result()
+
+    async def _wait_async(
+        self, waiter: Waiter[VirtualInstrumentValue], timeout: Optional[float]
+    ) -> VirtualInstrumentState[VirtualInstrumentValue]:
+        """
+        Await an asynchronous waiter being satisfied.
+        """
+        state = self._register_waiter(waiter)
+        if state is not None:
+            return state
+        if waiter.future is None:
+            raise RuntimeError("Synchronous waiter passed to _wait_async.")
+        try:
+            return await asyncio.wait_for(waiter.future, timeout=timeout)
+        finally:
+            with self._state_lock:
+                self._waiters.remove(waiter)
+
     def wait_for(
         self,
         predicate: Callable[[VirtualInstrumentState[VirtualInstrumentValue]], bool],
@@ -204,6 +792,55 @@ class VirtualInstrument(Generic[VirtualInstrumentValue]):
         """
         Wait for the virtual instrument to reach some condition, then get the state at that point.
 
+        The predicate is evaluated by the thread updating the state, and the waiting thread is only
+        woken once it returns true.
+
+        Args:
+            predicate (Callable[[VirtualInstrumentState[T]], bool]): Callable to evaluate, taking
+            the state as it's only parameter and returning a bool. When this returns true, the state
+            will be returned.
+            timeout (Optional[float], optional): Maximum time to wait, or None for no timeout.
+            Defaults to None.
+
+        Raises:
+            TimeoutError: If the timeout is reached before the predicate returns true.
+
+        Returns:
+            VirtualInstrumentState[T]: State of the virtual instrument when the predicate returned
+            true.
+        """
+        return self._wait(Waiter(predicate=predicate), timeout)
+
+    def wait_for_sequence(
+        self, sequence: int, timeout: Optional[float] = None
+    ) -> VirtualInstrumentState[VirtualInstrumentValue]:
+        """
+        Wait for the virtual instrument to reach a given sequence number. This is cheaper than the
+        equivalent wait_for, since the waiter is only looked at once the sequence is reached.
+
+        Args:
+            sequence (int): Sequence number to wait for.
+            timeout (Optional[float], optional): Maximum time to wait, or None for no timeout.
+            Defaults to None.
+
+        Raises:
+            TimeoutError: If the timeout is reached before the sequence is reached.
+
+        Returns:
+            VirtualInstrumentState[T]: First observed state with a sequence number at or after the
+            requested one.
+        """
+        return self._wait(Waiter(threshold=sequence), timeout)
+
+    async def wait_for_async(
+        self,
+        predicate: Callable[[VirtualInstrumentState[VirtualInstrumentValue]], bool],
+        timeout: Optional[float] = None,
+    ) -> VirtualInstrumentState[VirtualInstrumentValue]:
+        """
+        Asyncio equivalent of wait_for. Waiting does not occupy a thread; the waiter's future is
+        resolved on its event loop, with one call_soon_threadsafe per loop per state update.
+
         Args:
             predicate (Callable[[VirtualInstrumentState[T]], bool]): Callable to evaluate, taking
             the state as it's only parameter and returning a bool. When this returns true, the state
@@ -218,19 +855,31 @@ class VirtualInstrument(Generic[VirtualInstrumentValue]):
             VirtualInstrumentState[T]: State of the virtual instrument when the predicate returned
             true.
         """
-        with self._condition:
-            start_time = monotonic()
-            while True:
-                if predicate(self._state):
-                    return self._state
+        waiter = Waiter(predicate=predicate, loop=asyncio.get_running_loop())
+        return await self._wait_async(waiter, timeout)
+
+    async def wait_for_sequence_async(
+        self, sequence: int, timeout: Optional[float] = None
+    ) -> VirtualInstrumentState[VirtualInstrumentValue]:
+        """
+        Asyncio equivalent of wait_for_sequence.
+
+        Args:
+            sequence (int): Sequence number to wait for.
+            timeout (Optional[float], optional): Maximum time to wait, or None for no timeout.
+            Defaults to None.
 
-                if timeout is not None:
-                    remaining = timeout - (monotonic() - start_time)
-                    if remaining <= 0:
-                        raise TimeoutError()
-                    self._condition.wait(timeout=remaining)
-                else:
-                    self._condition.wait()
+        Raises:
+            TimeoutError: If the timeout is reached before the sequence is reached.
+
+        Returns:
+            VirtualInstrumentState[T]: First observed state with a sequence number at or after the
+            requested one.
+        """
+        waiter: Waiter[VirtualInstrumentValue] = Waiter(
+            threshold=sequence, loop=asyncio.get_running_loop()
+        )
+        return await self._wait_async(waiter, timeout)
 
     def as_iterator(
         self, stop: Optional[Event] = None
@@ -254,7 +903,7 @@ class VirtualInstrument(Generic[VirtualInstrumentValue]):
         while True:
             if stop is not None and stop.is_set():
                 return
-            state = self.wait_for(lambda s: s.sequence > last_sequence)
+            state = self.wait_for_sequence(last_sequence + 1)
             last_sequence = state.sequence
             yield state
 
@@ -267,7 +916,11 @@ class VirtualInstrument(Generic[VirtualInstrumentValue]):
         make room for the new state.
 
         This is ideal for consumers that want to process every new state, but don't care about
-        having the most recent state if they are falling behind.
+        having the most recent state if they are falling behind. Prefer reader() where possible,
+        which doesn't cost anything per state update.
+
+        The virtual instrument only holds a weak reference to the queue, it stops being filled once
+        the consumer drops it.
 
         Args:
             maxsize (int, optional): Maximum size of the queue. Defaults to 0, i.e. no max size.
@@ -4,16 +4,42 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Generic, TypeVar
 
+from testbenchmanager.common.clock import format_timestamp_ns, timestamp_from_ns
+
 type VirtualInstrumentValueTypes = int | float | str | bool
 VirtualInstrumentValue = TypeVar(
     "VirtualInstrumentValue", bound=VirtualInstrumentValueTypes
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VirtualInstrumentState(Generic[VirtualInstrumentValue]):
-    """State of a Virtual Instrument at a given point in time."""
+    """
+    State of a Virtual Instrument at a given point in time. States are immutable and slotted, since
+    they are shared between every consumer of an instrument and there can be a great many of them.
+    """
 
     value: VirtualInstrumentValue  # Value of the instrument
     sequence: int  # Sequence number of the state update
-    timestamp: datetime  # Timestamp of when the state was recorded
+    timestamp_ns: int  # Epoch timestamp of when the state was recorded, in nanoseconds
+
+    @property
+    def timestamp(self) -> datetime:
+        """
+        Timestamp of when the state was recorded, as a (naive, local) datetime. This is computed on
+        each access, prefer timestamp_ns where possible.
+
+        Returns:
+            datetime: Timestamp of the state.
+        """
+        return timestamp_from_ns(self.timestamp_ns)
+
+    @property
+    def timestamp_iso(self) -> str:
+        """
+        Timestamp of when the state was recorded, as a (naive, local) ISO 8601 string.
+
+        Returns:
+            str: Timestamp of the state.
+        """
+        return format_timestamp_ns(self.timestamp_ns)
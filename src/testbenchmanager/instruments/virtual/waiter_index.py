@@ -0,0 +1,283 @@
+"""Index of threads and coroutines waiting on a Virtual Instrument."""
+
+import asyncio
+import heapq
+from collections import defaultdict
+from itertools import count
+from threading import Event
+from typing import Callable, Generic, Optional
+
+from .virtual_instrument_state import VirtualInstrumentState, VirtualInstrumentValue
+
+
+# pylint: disable=too-many-instance-attributes
+# It's a slotted record, this is the point.
+class Waiter(Generic[VirtualInstrumentValue]):
+    """
+    A single pending wait on a virtual instrument, either for a sequence number threshold or for a
+    predicate to hold. Synchronous waiters block on their own Event, asynchronous waiters await a
+    future on their own event loop.
+    """
+
+    __slots__ = (
+        "predicate",
+        "threshold",
+        "loop",
+        "future",
+        "state",
+        "error",
+        "cancelled",
+        "indexed",
+        "_event",
+    )
+
+    def __init__(
+        self,
+        predicate: Optional[
+            Callable[[VirtualInstrumentState[VirtualInstrumentValue]], bool]
+        ] = None,
+        threshold: Optional[int] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        self.predicate = predicate
+        self.threshold = threshold
+        self.loop = loop
+        self.future: Optional[
+            asyncio.Future[VirtualInstrumentState[VirtualInstrumentValue]]
+        ] = (None if loop is None else loop.create_future())
+        self.state: Optional[VirtualInstrumentState[VirtualInstrumentValue]] = None
+        self.error: Optional[BaseException] = None
+        self.cancelled: bool = False  # Removed, but still lazily present in the heap.
+        self.indexed: bool = False  # Currently held by a WaiterIndex.
+        self._event: Optional[Event] = Event() if loop is None else None
+
+    def matches(self, state: VirtualInstrumentState[VirtualInstrumentValue]) -> bool:
+        """
+        Evaluate the predicate of a predicate waiter against a state. An exception raised by the
+        predicate counts as a match, and is re-raised to the waiter when it wakes.
+
+        Args:
+            state (VirtualInstrumentState[VirtualInstrumentValue]): State to evaluate.
+
+        Returns:
+            bool: Whether the waiter should be woken with this state.
+        """
+        if self.predicate is None:
+            return False
+        try:
+            return self.predicate(state)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Raised to the waiter instead of the (innocent) thread updating the state.
+            self.error = e
+            return True
+
+    def wake(self, state: VirtualInstrumentState[VirtualInstrumentValue]) -> None:
+        """
+        Wake a synchronous waiter. Asynchronous waiters are resolved through WaiterIndex.wake, so
+        wakes can be batched per event loop.
+
+        Args:
+            state (VirtualInstrumentState[VirtualInstrumentValue]): State to hand to the waiter.
+        """
+        self.state = state
+        if self._event is not None:
+            self._event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a synchronous waiter is woken.
+
+        Args:
+            timeout (Optional[float], optional): Maximum time to wait. Defaults to None.
+
+        Returns:
+            bool: True if the waiter was woken, False on timeout.
+        """
+        if self._event is None:
+            raise RuntimeError("Asynchronous waiters must await their future.")
+        return self._event.wait(timeout)
+
+    def result(self) -> VirtualInstrumentState[VirtualInstrumentValue]:
+        """
+        Get the state the waiter was woken with, re-raising any error raised by its predicate.
+
+        Returns:
+            VirtualInstrumentState[VirtualInstrumentValue]: State the waiter was woken with.
+        """
+        if self.error is not None:
+            raise self.error
+        if self.state is None:
+            raise RuntimeError("Waiter has not been woken.")
+        return self.state
+
+
+def _resolve_waiters(
+    waiters: list[
+        tuple[
+            Waiter[VirtualInstrumentValue],
+            VirtualInstrumentState[VirtualInstrumentValue],
+        ]
+    ],
+) -> None:
+    """
+    Resolve the futures of a batch of asynchronous waiters. Must run on their event loop.
+    """
+    for waiter, state in waiters:
+        future = waiter.future
+        if future is None or future.done():
+            continue
+        if waiter.error is not None:
+            future.set_exception(waiter.error)
+        else:
+            future.set_result(state)
+
+
+class WaiterIndex(Generic[VirtualInstrumentValue]):
+    """
+    Index of pending waiters on a virtual instrument, so that a state update only wakes the waiters
+    whose condition can now hold.
+
+    Sequence threshold waiters are kept in a heap ordered by threshold, so an update only looks at
+    the waiters that are actually due. Predicate waiters have to be evaluated against every update,
+    but only the ones whose predicate holds are woken.
+
+    This class is not thread safe, the owner is expected to hold its own lock, apart from wake()
+    which is intended to be called outside of it.
+    """
+
+    # Rebuild the heap once more than this fraction of it is cancelled (timed out) waiters.
+    _CANCELLED_FRACTION_LIMIT = 0.5
+
+    def __init__(self) -> None:
+        self._sequence_heap: list[tuple[int, int, Waiter[VirtualInstrumentValue]]] = []
+        self._cancelled_in_heap: int = 0
+        self._predicate_waiters: set[Waiter[VirtualInstrumentValue]] = set()
+        self._counter = count()
+
+    def __len__(self) -> int:
+        return (
+            len(self._sequence_heap)
+            - self._cancelled_in_heap
+            + len(self._predicate_waiters)
+        )
+
+    @property
+    def predicate_waiters(self) -> tuple[Waiter[VirtualInstrumentValue], ...]:
+        """
+        Snapshot of the current predicate waiters.
+
+        Returns:
+            tuple[Waiter[VirtualInstrumentValue], ...]: Pending predicate waiters.
+        """
+        return tuple(self._predicate_waiters)
+
+    def add(self, waiter: Waiter[VirtualInstrumentValue]) -> None:
+        """
+        Add a waiter to the index.
+
+        Args:
+            waiter (Waiter[VirtualInstrumentValue]): Waiter to add.
+        """
+        waiter.indexed = True
+        if waiter.threshold is not None:
+            heapq.heappush(
+                self._sequence_heap, (waiter.threshold, next(self._counter), waiter)
+            )
+        else:
+            self._predicate_waiters.add(waiter)
+
+    def remove(self, waiter: Waiter[VirtualInstrumentValue]) -> None:
+        """
+        Remove a waiter from the index, e.g. after it timed out. Removing a waiter that has already
+        been woken is a no-op.
+
+        Args:
+            waiter (Waiter[VirtualInstrumentValue]): Waiter to remove.
+        """
+        if not waiter.indexed:
+            return
+        waiter.indexed = False
+        if waiter.threshold is None:
+            self._predicate_waiters.discard(waiter)
+            return
+        # Removing from the middle of a heap is O(n), so just mark it and skip it when popped.
+        waiter.cancelled = True
+        self._cancelled_in_heap += 1
+        if (
+            self._cancelled_in_heap
+            > len(self._sequence_heap) * self._CANCELLED_FRACTION_LIMIT
+        ):
+            self._sequence_heap = [
+                entry for entry in self._sequence_heap if not entry[2].cancelled
+            ]
+            heapq.heapify(self._sequence_heap)
+            self._cancelled_in_heap = 0
+
+    def discard_predicate_waiters(
+        self, waiters: list[Waiter[VirtualInstrumentValue]]
+    ) -> None:
+        """
+        Remove predicate waiters which have been matched.
+
+        Args:
+            waiters (list[Waiter[VirtualInstrumentValue]]): Waiters to remove.
+        """
+        for waiter in waiters:
+            waiter.indexed = False
+        self._predicate_waiters.difference_update(waiters)
+
+    def pop_due(self, sequence: int) -> list[Waiter[VirtualInstrumentValue]]:
+        """
+        Remove and return all sequence waiters whose threshold has been reached.
+
+        Args:
+            sequence (int): Latest sequence number of the virtual instrument.
+
+        Returns:
+            list[Waiter[VirtualInstrumentValue]]: Waiters that are now due.
+        """
+        due: list[Waiter[VirtualInstrumentValue]] = []
+        heap = self._sequence_heap
+        while heap and heap[0][0] <= sequence:
+            waiter = heapq.heappop(heap)[2]
+            if waiter.cancelled:
+                self._cancelled_in_heap -= 1
+                continue
+            waiter.indexed = False
+            due.append(waiter)
+        return due
+
+    @staticmethod
+    def wake(
+        waiters: list[Waiter[VirtualInstrumentValue]],
+        state: VirtualInstrumentState[VirtualInstrumentValue],
+    ) -> None:
+        """
+        Wake a list of waiters with a state. Asynchronous waiters are resolved with a single
+        call_soon_threadsafe per event loop.
+
+        Args:
+            waiters (list[Waiter[VirtualInstrumentValue]]): Waiters to wake.
+            state (VirtualInstrumentState[VirtualInstrumentValue]): State to wake them with.
+        """
+        by_loop: defaultdict[
+            asyncio.AbstractEventLoop,
+            list[
+                tuple[
+                    Waiter[VirtualInstrumentValue],
+                    VirtualInstrumentState[VirtualInstrumentValue],
+                ]
+            ],
+        ] = defaultdict(list)
+        for waiter in waiters:
+            if waiter.loop is None:
+                waiter.wake(state)
+            else:
+                waiter.state = state
+                by_loop[waiter.loop].append((waiter, state))
+        for loop, loop_waiters in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_resolve_waiters, loop_waiters)
+            except RuntimeError:
+                # The loop was closed while its waiters were still registered.
+                pass
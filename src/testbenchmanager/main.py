@@ -32,6 +32,20 @@ parser.add_argument(
     choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
 )
 
+parser.add_argument(
+    "--stop-deadline",
+    type=float,
+    default=None,
+    help="Overall deadline for stopping translators at shutdown, in seconds",
+)
+
+parser.add_argument(
+    "--history-memory-budget",
+    type=int,
+    default=None,
+    help="Total memory budget for virtual instrument history, in MiB (default: unlimited)",
+)
+
 
 if __name__ == "__main__":
     logging.basicConfig(level=getattr(logging, parser.parse_args().log_level))
@@ -41,6 +55,10 @@ if __name__ == "__main__":
     config_manager = ConfigurationManager(root=config_root)
 
     instrument_manager.inject_configuration_manager(config_manager)
+    if args.history_memory_budget is not None:
+        instrument_manager.set_history_memory_budget(
+            args.history_memory_budget * 1024 * 1024
+        )
     instrument_manager.load_all_configurations()
 
     report_manager.inject_configuration_manager(config_manager)
@@ -51,6 +69,8 @@ if __name__ == "__main__":
     # Keep the application running to allow translators to operate
     try:
         uvicorn.run(api, host="0.0.0.0", port=8000)
-    except KeyboardInterrupt:
+    finally:
+        # uvicorn handles Ctrl+C itself and returns, so shut down either way.
         logger.info("Shutting down Testbench Manager.")
-        instrument_manager.stop_all_translators()
+        stop_report = instrument_manager.stop_all_translators(args.stop_deadline)
+        logger.info("Shutdown latency: %.3f s", stop_report.duration)
@@ -7,12 +7,13 @@ from typing import Annotated, Any, Callable
 
 from pydantic import BaseModel, Field
 
+from testbenchmanager.common.clock import format_timestamp_ns
+from testbenchmanager.instruments.virtual import OverflowPolicy, VirtualInstrumentState
 from testbenchmanager.instruments.virtual.virtual_instrument import (
     VirtualInstrument,
     VirtualInstrumentValue,
 )
 
-from .datapoint import DataPoint
 from .report_metadata import ReportMetadata
 
 # TODO: experiment configuration reporting
@@ -53,6 +54,10 @@ class ReportManifest(BaseModel):
 
 
 class Report:
+    # Data points are written on the subscriber dispatcher pool rather than the translator threads,
+    # so file I/O doesn't hold up acquisition. The mailbox blocks rather than dropping when full, a
+    # report should never silently lose data.
+    DATA_MAILBOX_SIZE = 1000
 
     def __init__(
         self,
@@ -103,7 +108,7 @@ class Report:
         #     with open(self.manifest.working_directory / self.manifest.experiment_config, "w", encoding="utf-8") as f:
         #         f.write(experiment_config.model_dump_json(indent=4))
 
-    def new_data_point(self, instrument_uid: str, datapoint: DataPoint[Any]):
+    def new_data_point(self, instrument_uid: str, state: VirtualInstrumentState[Any]):
         if self.closed:
             raise RuntimeError("Cannot add data point to closed report.")
         if instrument_uid not in self.manifest.data:
@@ -117,24 +122,24 @@ class Report:
             data_file_path = self.manifest.data[instrument_uid]
         with open(data_file_path, "a", encoding="utf-8") as f:
             csv_writer = csv.writer(f)
-            csv_writer.writerow([datapoint.timestamp.isoformat(), datapoint.value])
+            csv_writer.writerow([format_timestamp_ns(state.timestamp_ns), state.value])
 
     def subscribe_to_instrument(
         self, instrument: VirtualInstrument[VirtualInstrumentValue]
     ):
         self._instrument_unsubscribe_callbacks.append(
             instrument.subscribe(
-                lambda state: self.new_data_point(
-                    instrument.metadata.uid,
-                    DataPoint(timestamp=state.timestamp, value=state.value),
-                )
+                lambda state: self.new_data_point(instrument.metadata.uid, state),
+                mailbox_size=self.DATA_MAILBOX_SIZE,
+                overflow_policy=OverflowPolicy.BLOCK,
             )
         )
 
     def close(self):
-        self._closed.set()
+        # Unsubscribing drains the mailboxes, so do it while the report still accepts data points.
         for unsubscribe in self._instrument_unsubscribe_callbacks:
             unsubscribe()
+        self._closed.set()
         for callback in self._publish_callbacks:
             callback(self)
         shutil.rmtree(self.manifest.working_directory)
@@ -0,0 +1,289 @@
+"""Tests for virtual instruments: waiting, history, subscriber mailboxes and batched updates."""
+
+# pylint: disable=protected-access
+
+import threading
+import time
+from typing import Any, Callable
+
+import pytest
+
+from testbenchmanager.instruments.virtual import (
+    OverflowPolicy,
+    TranslatorUpdateBatch,
+    VirtualInstrument,
+    VirtualInstrumentMetadata,
+    VirtualInstrumentState,
+)
+from testbenchmanager.instruments.virtual.history_buffer import HistoryBuffer
+from testbenchmanager.instruments.virtual.subscriber_dispatch import (
+    Mailbox,
+    SubscriberDispatcher,
+)
+
+
+def make_instrument(uid: str = "instrument") -> VirtualInstrument[Any]:
+    return VirtualInstrument(VirtualInstrumentMetadata(uid=uid, history_length=100))
+
+
+def update_later(
+    instrument: VirtualInstrument[Any], values: list[Any], delay: float = 0.05
+) -> threading.Thread:
+    """Update an instrument from another thread, after a delay."""
+
+    def update() -> None:
+        time.sleep(delay)
+        for value in values:
+            instrument.update_state(value)
+
+    thread = threading.Thread(target=update)
+    thread.start()
+    return thread
+
+
+class ManualDispatcher(SubscriberDispatcher):
+    """Dispatcher which only drains mailboxes when told to, so tests control the timing."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.submitted: list[Callable[[], None]] = []
+
+    def submit(self, function: Callable[[], None]) -> None:
+        self.submitted.append(function)
+
+    def run_all(self) -> None:
+        while self.submitted:
+            self.submitted.pop(0)()
+
+
+# Waiting
+
+
+def test_wait_for_sequence_returns_immediately_when_reached() -> None:
+    instrument = make_instrument()
+    for value in range(3):
+        instrument.update_state(value)
+    state = instrument.wait_for_sequence(1, timeout=0)
+    assert state.sequence == 2
+    assert len(instrument._waiters) == 0
+
+
+def test_wait_for_sequence_is_woken_by_update() -> None:
+    instrument = make_instrument()
+    instrument.update_state(0)
+    thread = update_later(instrument, [1, 2, 3])
+    state = instrument.wait_for_sequence(2, timeout=5)
+    thread.join()
+    assert state.sequence == 2
+    assert state.value == 2
+
+
+def test_wait_for_sequence_times_out_and_removes_waiter() -> None:
+    instrument = make_instrument()
+    instrument.update_state(0)
+    with pytest.raises(TimeoutError):
+        instrument.wait_for_sequence(5, timeout=0.05)
+    assert len(instrument._waiters) == 0
+    # Updates after the timeout don't trip over the abandoned waiter.
+    for value in range(10):
+        instrument.update_state(value)
+
+
+def test_wait_for_returns_immediately_when_predicate_holds() -> None:
+    instrument = make_instrument()
+    instrument.update_state(10)
+    state = instrument.wait_for(lambda state: state.value > 5, timeout=0)
+    assert state.value == 10
+    assert len(instrument._waiters) == 0
+
+
+def test_wait_for_is_woken_by_update() -> None:
+    instrument = make_instrument()
+    instrument.update_state(0)
+    thread = update_later(instrument, [1, 7, 9])
+    state = instrument.wait_for(lambda state: state.value > 5, timeout=5)
+    thread.join()
+    assert state.value == 7
+
+
+def test_wait_for_times_out_and_removes_waiter() -> None:
+    instrument = make_instrument()
+    instrument.update_state(0)
+    with pytest.raises(TimeoutError):
+        instrument.wait_for(lambda state: state.value > 5, timeout=0.05)
+    assert len(instrument._waiters) == 0
+    assert not instrument._waiters.predicate_waiters
+
+
+def test_wait_for_reraises_predicate_error_to_waiter() -> None:
+    instrument = make_instrument()
+    instrument.update_state(0)
+
+    def predicate(state: VirtualInstrumentState[Any]) -> bool:
+        if state.value == "bad":
+            raise ValueError("bad value")
+        return False
+
+    # The updating thread is unaffected, the error is raised to the waiter instead.
+    thread = update_later(instrument, ["bad"])
+    with pytest.raises(ValueError, match="bad value"):
+        instrument.wait_for(predicate, timeout=5)
+    thread.join()
+    assert len(instrument._waiters) == 0
+
+
+# History
+
+
+def test_history_buffer_wraps_around() -> None:
+    buffer: HistoryBuffer[int] = HistoryBuffer(4)
+    for sequence in range(6):
+        buffer.append(sequence, 100 * sequence, sequence * 10)
+    assert len(buffer) == 4
+    assert buffer.first_sequence == 2
+    assert buffer.oldest_timestamp_ns == 200
+    assert [state.sequence for state in buffer.states()] == [2, 3, 4, 5]
+    assert [state.value for state in buffer.states()] == [20, 30, 40, 50]
+    latest = buffer.latest()
+    assert latest is not None and latest.sequence == 5
+
+
+def test_history_buffer_index_of_sequence() -> None:
+    buffer: HistoryBuffer[int] = HistoryBuffer(4)
+    assert buffer.index_of_sequence(3) == 0
+    for sequence in range(6):
+        buffer.append(sequence, 100 * sequence, sequence)
+    assert buffer.index_of_sequence(0) == 0  # Overwritten, clamped to the oldest
+    assert buffer.index_of_sequence(3) == 1
+    assert buffer.index_of_sequence(5) == 3
+    assert buffer.index_of_sequence(10) == 4  # Not yet recorded, clamped to the end
+
+
+def test_history_buffer_index_of_timestamp() -> None:
+    buffer: HistoryBuffer[int] = HistoryBuffer(4)
+    for sequence in range(6):
+        buffer.append(sequence, 100 * sequence, sequence)
+    assert buffer.index_of_timestamp(0) == 0
+    assert buffer.index_of_timestamp(300) == 1
+    assert buffer.index_of_timestamp(250) == 1
+    assert buffer.index_of_timestamp(501) == 4
+
+
+# Mailboxes
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected", "dropped"),
+    [
+        (OverflowPolicy.DROP_OLDEST, [3, 4], 3),
+        (OverflowPolicy.DROP_NEWEST, [0, 1], 3),
+        (OverflowPolicy.COALESCE, [4], 4),
+    ],
+)
+def test_mailbox_overflow_policies(
+    policy: OverflowPolicy, expected: list[int], dropped: int
+) -> None:
+    dispatcher = ManualDispatcher()
+    delivered: list[int] = []
+    mailbox: Mailbox[int] = Mailbox(delivered.append, 2, policy, dispatcher)
+    for item in range(5):
+        mailbox.post(item)
+    dispatcher.run_all()
+    assert delivered == expected
+    statistics = mailbox.statistics
+    assert statistics.delivered == len(expected)
+    assert statistics.dropped == dropped
+    assert statistics.pending == 0
+
+
+def test_mailbox_block_policy_waits_for_room() -> None:
+    dispatcher = ManualDispatcher()
+    delivered: list[int] = []
+    mailbox: Mailbox[int] = Mailbox(
+        delivered.append, 1, OverflowPolicy.BLOCK, dispatcher
+    )
+    mailbox.post(0)
+    producer = threading.Thread(target=mailbox.post, args=(1,))
+    producer.start()
+    producer.join(0.1)
+    assert producer.is_alive()  # Blocked on the full mailbox
+    dispatcher.run_all()
+    producer.join(5)
+    assert not producer.is_alive()
+    dispatcher.run_all()
+    assert delivered == [0, 1]
+    assert mailbox.statistics.dropped == 0
+
+
+def test_mailbox_close_waits_for_pending_items() -> None:
+    delivered: list[int] = []
+
+    def slow_callback(item: int) -> None:
+        time.sleep(0.01)
+        delivered.append(item)
+
+    mailbox: Mailbox[int] = Mailbox(
+        slow_callback, 100, dispatcher=SubscriberDispatcher()
+    )
+    for item in range(20):
+        mailbox.post(item)
+    mailbox.close(wait=True)
+    assert delivered == list(range(20))
+    # Closed, further items are ignored.
+    mailbox.post(20)
+    assert mailbox.statistics.pending == 0
+
+
+def test_instrument_unsubscribe_drains_mailbox() -> None:
+    instrument = make_instrument()
+    delivered: list[Any] = []
+    unsubscribe = instrument.subscribe(
+        lambda state: delivered.append(state.value), mailbox_size=100
+    )
+    for value in range(20):
+        instrument.update_state(value)
+    unsubscribe()
+    assert delivered == list(range(20))
+
+
+# Batched updates
+
+
+def test_update_batch_calls_each_batch_callback_once() -> None:
+    first = make_instrument("first")
+    second = make_instrument("second")
+    third = make_instrument("third")
+    both_calls: list[dict[str, VirtualInstrumentState[Any]]] = []
+    first_calls: list[dict[str, VirtualInstrumentState[Any]]] = []
+    first.subscribe_batch(both_calls.append)
+    second.subscribe_batch(both_calls.append)
+    first.subscribe_batch(first_calls.append)
+
+    with TranslatorUpdateBatch() as batch:
+        batch.add(first, 1.0)
+        batch.add(second, 2.0)
+        batch.add(third, 3.0)
+
+    assert len(both_calls) == 1
+    states = both_calls[0]
+    assert set(states) == {"first", "second"}
+    assert states["first"].value == 1.0
+    assert states["second"].value == 2.0
+    # Every state in a batch shares a timestamp.
+    assert states["first"].timestamp_ns == states["second"].timestamp_ns
+    assert len(first_calls) == 1
+    assert set(first_calls[0]) == {"first"}
+    assert third.get_latest_state().value == 3.0
+
+
+def test_update_batch_discarded_on_exception() -> None:
+    instrument = make_instrument()
+    calls: list[dict[str, VirtualInstrumentState[Any]]] = []
+    instrument.subscribe_batch(calls.append)
+    with pytest.raises(RuntimeError):
+        with TranslatorUpdateBatch() as batch:
+            batch.add(instrument, 1.0)
+            raise RuntimeError()
+    assert not calls
+    with pytest.raises(RuntimeError):
+        instrument.get_latest_state()